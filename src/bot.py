@@ -8,6 +8,7 @@ from discord.ext import commands
 # My command modules folder
 import src.bot_commands as bot_commands
 from src.config import Config
+from src.services.discord_outbox import discord_outbox
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +29,12 @@ MY_GUILD = discord.Object(id=int(Config.MY_GUILD))
 class MyBot(commands.Bot):
 
     def __init__(self, *, intents: discord.Intents):
-        super().__init__(command_prefix="-", intents=intents)
+        super().__init__(
+            command_prefix="-",
+            intents=intents,
+            # Lets the outbox follow Discord's rate limit headers
+            http_trace=discord_outbox.trace_config(),
+        )
         # A CommandTree is a special type that holds all the application command
         # state required to make it work. This is a separate class because it
         # allows all the extra state to be opt-in.
@@ -54,6 +60,20 @@ class MyBot(commands.Bot):
             ):
                 self.tree.add_command(attr)
 
+        # Messages from cogs and features are paced from here on
+        discord_outbox.start()
+
+        # Bot reads of the game databases go to snapshots from here on
+        if Config.GAME_DB_SNAPSHOTS:
+            from src.services.game_db_snapshot import game_db_snapshots
+
+            await game_db_snapshots.start()
+
+        # Game database changes are pushed to the features that need them
+        from src.services.game_db_changes import game_db_changes
+
+        game_db_changes.start()
+
         # Check if any enabled cogs require database
         database_needed = any(
             cog_config.get("requires_database", False)
@@ -117,6 +137,19 @@ class MyBot(commands.Bot):
         self.tree.copy_global_to(guild=MY_GUILD)
         await self.tree.sync(guild=MY_GUILD)
 
+    async def close(self):
+        from src.services.bot_db import close_db
+        from src.services.game_db import close_game_db_connections
+        from src.services.game_db_changes import game_db_changes
+        from src.services.game_db_snapshot import game_db_snapshots
+
+        await super().close()
+        await discord_outbox.stop()
+        await game_db_changes.stop()
+        await game_db_snapshots.stop()
+        await close_db()
+        await close_game_db_connections()
+
 
 intents = discord.Intents.all()
 bot = MyBot(intents=intents)
@@ -5,6 +5,7 @@ import discord
 from discord.ext import commands, tasks
 
 from src.config import Config
+from src.services.discord_outbox import Priority, discord_outbox
 
 logger = logging.getLogger(__name__)
 
@@ -51,5 +52,7 @@ class AdvertisementCog(commands.Cog):
             logger.warning("Chan is not TextChannel?")
             return
 
-        await chan.send(ad_msg + goal_url)
+        await discord_outbox.send(
+            chan, content=ad_msg + goal_url, priority=Priority.BULK
+        )
         logger.info("My ad is running!")
\ No newline at end of file
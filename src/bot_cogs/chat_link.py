@@ -1,16 +1,25 @@
+import asyncio
 import logging
 import re
+import time
+from datetime import datetime
 
 import discord
 from discord.ext import commands
 
-from src.config import Config
+from src.config import CONFIG_DIR, Config
+from src.features.chat_archive import ChatArchiveWriter
+from src.features.chat_bridge import GameMessageQueue
+from src.features.chat_commands import ChatCommandDispatcher
+from src.features.chat_moderation import ChatModerator, ModerationResult
+from src.services.discord_outbox import Priority, discord_outbox
 from src.services.log_watcher import RealTimeLogProcessor
 
 logger = logging.getLogger(__name__)
 
 
-def parse_zomboid_chat(log_line: str) -> str | None:
+def parse_chat_line(log_line: str) -> tuple[str, str, str] | None:
+    """Return (chat, author, text) for a chat log line, or None if it isn't one."""
     if "Got message:" not in log_line:
         return None
 
@@ -21,34 +30,54 @@ def parse_zomboid_chat(log_line: str) -> str | None:
     if match is None:
         return None
 
-    chat = match.group(1)
-    author = match.group(2)
-    text = match.group(3)
+    return match.group(1), match.group(2), match.group(3)
 
-    if chat != "General":
-        return None
-
-    formatted_text = f"{author}: {text}"
 
-    return formatted_text
+def parse_chat_timestamp(log_line: str) -> datetime:
+    """Return the time a chat log line was written, falling back to now."""
+    match = re.match(r"\[(\d{2}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})", log_line)
+    if match:
+        try:
+            return datetime.strptime(match.group(1), "%d-%m-%y %H:%M:%S")
+        except ValueError:
+            pass
+    return datetime.now()
 
 
 class ChatLinkCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.monitor_tasks: list[RealTimeLogProcessor] = []
+        self.watch_tasks: list[asyncio.Task] = []
+        # Outbound servermsg queues by system user, and bridged Discord channels
+        self.game_queues: dict[str, GameMessageQueue] = {}
+        self.bridge_channels: dict[int, str] = {}
+        self.archive = ChatArchiveWriter()
+        self.chat_commands = ChatCommandDispatcher(
+            Config.CHAT_COMMAND_PREFIX, Config.CHAT_COMMAND_COOLDOWN_SECONDS
+        )
+        self.command_tasks: set[asyncio.Task] = set()
+        self.moderator = ChatModerator(CONFIG_DIR / "moderation.json")
 
     async def cog_load(self):
         logger.info("ChatLinkCog loading...")
+        self.archive.start()
         await self.start_log_monitors()
 
     async def cog_unload(self):
         logger.info("ChatLinkCog unloading, stopping log monitors...")
+        for task in self.watch_tasks:
+            task.cancel()
         for monitor in self.monitor_tasks:
             if monitor.current_task:
                 monitor.current_task.cancel()
+        for queue in self.game_queues.values():
+            await queue.stop()
+        await self.archive.stop()
 
-    async def send_to_discord(self, message: str, channel_id: int):
+    async def send_to_discord(
+        self, message: str, channel_id: int, priority: Priority = Priority.NORMAL
+    ):
         channel = self.bot.get_channel(channel_id)
 
         if not isinstance(channel, discord.TextChannel):
@@ -59,10 +88,46 @@ class ChatLinkCog(commands.Cog):
             return
 
         try:
-            await channel.send(message)
+            await discord_outbox.send(channel, content=message, priority=priority)
         except Exception as e:
             logger.error(f"Failed to send message to channel {channel_id}: {e}")
 
+    async def handle_flagged_message(
+        self, server_name: str, author: str, moderation: ModerationResult
+    ):
+        logger.info(
+            f"Flagged chat from {author} on {server_name}: {moderation.matches}"
+        )
+        if not self.moderator.alert_mod_channel:
+            return
+
+        await self.send_to_discord(
+            f"🚩 Flagged chat on **{server_name}** from **{author}**:\n"
+            f"> {discord.utils.escape_markdown(moderation.text)}\n"
+            f"Matched: {', '.join(sorted(set(moderation.matches)))}",
+            Config.MOD_CHANNEL,
+            priority=Priority.ALERT,
+        )
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        """Relay messages from a bridged channel into the game."""
+        system_user = self.bridge_channels.get(message.channel.id)
+        if system_user is None:
+            return
+
+        # Our own relayed game chat lands in this channel too, never send it back
+        if message.author.bot or message.webhook_id:
+            return
+
+        content = " ".join(message.clean_content.split())
+        if not content:
+            return
+
+        self.game_queues[system_user].put(
+            f"[Discord] {message.author.display_name}: {content}"
+        )
+
     async def start_log_monitors(self):
         enabled_servers = []
 
@@ -83,15 +148,80 @@ class ChatLinkCog(commands.Cog):
             log_directory = f"/home/{system_user}/Zomboid/Logs/"
             log_pattern = "*chat.txt"
 
-            async def make_callback(ch_id: int):
+            bridge = logging_config.get("bridge", False)
+            chat_commands = logging_config.get("commands", False)
+
+            # Everything the bot says in game goes through the same paced queue
+            if bridge or chat_commands:
+                queue = GameMessageQueue(
+                    system_user,
+                    Config.CHAT_BRIDGE_COMMANDS_PER_SECOND,
+                    Config.CHAT_BRIDGE_BATCH_SECONDS,
+                )
+                queue.start()
+                self.game_queues[system_user] = queue
+            if bridge:
+                self.bridge_channels[channel_id] = system_user
+
+            async def make_callback(
+                ch_id: int,
+                srv_name: str,
+                sys_user: str,
+                queue: GameMessageQueue | None,
+                answer_commands: bool,
+            ):
                 async def callback(line: str):
-                    parsed = parse_zomboid_chat(line)
-                    if parsed:
-                        await self.send_to_discord(parsed, ch_id)
+                    received_at = time.monotonic()
+                    parsed = parse_chat_line(line)
+                    if not parsed:
+                        return
+
+                    # Drop our own bridged messages showing up in the game log
+                    if queue and queue.is_echo(parsed[2]):
+                        return
+
+                    chat, author, text = parsed
+                    self.archive.add(
+                        srv_name, parse_chat_timestamp(line), chat, author, text
+                    )
+
+                    if (
+                        queue
+                        and answer_commands
+                        and self.chat_commands.parse(text) is not None
+                    ):
+                        # Don't hold up the tailer while the reply goes out
+                        task = asyncio.create_task(
+                            self.chat_commands.dispatch(
+                                srv_name, sys_user, author, text, queue, received_at
+                            )
+                        )
+                        self.command_tasks.add(task)
+                        task.add_done_callback(self.command_tasks.discard)
+
+                    if chat != "General":
+                        return
+
+                    moderation = self.moderator.check(text)
+                    relay_text = text
+                    if moderation.flagged:
+                        await self.handle_flagged_message(srv_name, author, moderation)
+                        if self.moderator.action == "redact":
+                            relay_text = moderation.redacted
+                        else:
+                            relay_text = f"🚩 {text}"
+
+                    await self.send_to_discord(f"{author}: {relay_text}", ch_id)
 
                 return callback
 
-            callback = await make_callback(channel_id)
+            callback = await make_callback(
+                channel_id,
+                server_name,
+                system_user,
+                self.game_queues.get(system_user),
+                chat_commands,
+            )
 
             monitor = RealTimeLogProcessor(
                 log_directory, log_pattern, callback
@@ -100,9 +230,15 @@ class ChatLinkCog(commands.Cog):
             self.monitor_tasks.append(monitor)
             enabled_servers.append(server_name)
 
-            await monitor.start()
+            # start() keeps watching for new log files, so it can't be awaited here
+            self.watch_tasks.append(asyncio.create_task(monitor.start()))
 
         if enabled_servers:
             logger.info(f"ChatLinkCog monitoring servers: {enabled_servers}")
         else:
             logger.info("ChatLinkCog loaded but no servers have log_chat enabled")
+
+        if self.bridge_channels:
+            logger.info(
+                f"ChatLinkCog bridging Discord to game for: {list(self.bridge_channels.values())}"
+            )
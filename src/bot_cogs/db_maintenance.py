@@ -0,0 +1,88 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from discord.ext import commands, tasks
+
+from src.config import Config
+from src.features.ticket_tracker import ticket_tracker
+from src.services.bot_db import compact_db, prune_kofi_events
+from src.services.game_db import get_ticket_id_range
+
+logger = logging.getLogger(__name__)
+
+# Let the startup ticket sync finish before the first run
+STARTUP_DELAY_SECONDS = 600
+
+
+class DatabaseMaintenanceCog(commands.Cog):
+    """Keeps bot_db bounded by pruning rows that can never be used again."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.maintain_database.change_interval(hours=Config.BOT_DB_MAINTENANCE_HOURS)
+
+    async def cog_unload(self):
+        self.maintain_database.cancel()
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        if not self.maintain_database.is_running():
+            logger.info("Starting bot database maintenance task...")
+            self.maintain_database.start()
+
+    async def _prune_tickets(self) -> int:
+        """Drop tracked tickets that no longer exist in any game database."""
+        pruned = 0
+        for server_config in Config.SERVER_DATA:
+            server_name = server_config["server_name"]
+            id_range = await get_ticket_id_range(server_config["system_user"])
+            if isinstance(id_range, str):
+                logger.warning(f"Skipping ticket pruning for {server_name}: {id_range}")
+                continue
+
+            min_id, max_id = id_range
+            # An empty tickets table is a world reset, the ticket watcher handles those
+            if max_id == 0:
+                continue
+
+            pruned += await ticket_tracker.prune_outside_range(
+                server_name, min_id, max_id
+            )
+
+        cutoff = datetime.now() - timedelta(days=Config.BOT_DB_TICKET_RETENTION_DAYS)
+        removed_servers = await ticket_tracker.prune_unconfigured(
+            list(Config.SYSTEM_USERS), cutoff
+        )
+        if removed_servers:
+            logger.info(
+                f"Removed old ticket tracking for unconfigured servers: {', '.join(removed_servers)}"
+            )
+
+        return pruned
+
+    @tasks.loop(hours=24)
+    async def maintain_database(self):
+        """Prune stale rows, then let SQLite tidy up after them."""
+        logger.info("Running bot database maintenance...")
+        try:
+            tickets_pruned = await self._prune_tickets()
+
+            cutoff = datetime.now() - timedelta(
+                days=Config.BOT_DB_KOFI_EVENT_RETENTION_DAYS
+            )
+            events_pruned = await prune_kofi_events(cutoff)
+
+            reclaimed = await compact_db()
+
+            logger.info(
+                f"Bot database maintenance done - pruned {tickets_pruned} tracked tickets "
+                f"and {events_pruned} Ko-fi events, reclaimed {reclaimed / 1024:.1f} KiB"
+            )
+        except Exception as e:
+            logger.error(f"Error during bot database maintenance: {e}")
+
+    @maintain_database.before_loop
+    async def before_maintain_database(self):
+        await self.bot.wait_until_ready()
+        await asyncio.sleep(STARTUP_DELAY_SECONDS)
@@ -1,13 +1,24 @@
+import asyncio
+import hashlib
 import json
 import logging
+from datetime import datetime
 
 import discord
 from aiohttp import web
-from discord.ext import commands
+from discord.ext import commands, tasks
 
 # from bot import MyBot
 from src.config import Config
-from src.services.bot_db import add_donation, get_total_donations_since
+from src.features.status_api import status_api
+from src.services.bot_db import (
+    add_kofi_event,
+    get_donation_period_total,
+    get_unprocessed_kofi_events,
+    mark_kofi_event_failed,
+    record_kofi_donation,
+)
+from src.services.discord_outbox import discord_outbox
 from src.utils.helpers import get_last_occurrence_of_day, show_donation_progress
 
 logger = logging.getLogger(__name__)
@@ -15,6 +26,10 @@ logger = logging.getLogger(__name__)
 ANNOUNCE_CHANNEL = Config.ANNOUNCE_CHANNEL
 WEBHOOK_SECRET = Config.WEBHOOK_SECRET
 WEBHOOK_PATH = "/hook"
+# Other failures (database, Discord) are retried this many times per run,
+# and again on the next start if they still haven't gone through
+KOFI_EVENT_ATTEMPTS = 3
+KOFI_RETRY_SECONDS = 60
 
 
 class KoFiDonationCog(commands.Cog):
@@ -24,61 +39,142 @@ class KoFiDonationCog(commands.Cog):
         self.bot = bot
         if not Config.WEBHOOK_SECRET:
             raise ValueError("WEBHOOK_SECRET env var is required for KoFiDonationCog")
+        self.runner: web.AppRunner | None = None
+        self.event_queue: asyncio.Queue[tuple[str, dict]] = asyncio.Queue()
+        self.worker_task: asyncio.Task | None = None
+        # Billing period the published donation progress belongs to
+        self.period_start: datetime | None = None
+
+    async def cog_unload(self):
+        self.check_donation_period.cancel()
+        if self.worker_task:
+            self.worker_task.cancel()
+        if self.runner:
+            await self.runner.cleanup()
 
     # Experimenting with using the underscore for private methods
     async def _handle_kofi_donation(self, request):
-        """Handles incoming Ko-fi webhook for donation events."""
+        """
+        Handles incoming Ko-fi webhook for donation events.
+
+        Only validates and persists the event before answering, the Discord
+        posts and donation bookkeeping happen in the background worker.
+        """
         # Post request from ko-fi sent on donation
-        # TODO: Needs error handling
         data = await request.post()
-        # Process the webhook data here
-        donation = json.loads(data["data"])
-        verification_token = donation["verification_token"]
-        is_public = donation["is_public"]
-        donator = donation["from_name"]
-        # I stopped sending this back because I think its just meant for the one who issued the donation.
-        url = donation["url"]
-        email = donation["email"]
+        try:
+            raw_event = data["data"]
+            donation = json.loads(raw_event)
+            verification_token = donation["verification_token"]
+        except (KeyError, TypeError, json.JSONDecodeError) as e:
+            logger.warning(f"Malformed Ko-fi webhook: {e}")
+            return web.Response(status=400)
+
+        if verification_token != WEBHOOK_SECRET:
+            logger.warning("Verification token not valid?")
+            logger.debug("%s", data)
+            return web.Response()
+
+        # Ko-fi resends the same transaction on retries
+        transaction_id = (
+            donation.get("kofi_transaction_id")
+            or donation.get("message_id")
+            or hashlib.sha256(raw_event.encode()).hexdigest()
+        )
+
+        try:
+            is_new = await add_kofi_event(transaction_id, raw_event)
+        except Exception as e:
+            logger.error(f"Could not persist Ko-fi event {transaction_id}: {e}")
+            # Let Ko-fi retry later
+            return web.Response(status=500)
+
+        if is_new:
+            self.event_queue.put_nowait((transaction_id, donation))
+        else:
+            logger.info(f"Ignoring replayed Ko-fi event {transaction_id}")
+
+        return web.Response()
+
+    async def _refresh_donation_progress(self) -> float:
+        """Look up this billing period's total and publish it to the status API."""
+        # Day that the bill hits
+        last_6th = get_last_occurrence_of_day(Config.KOFI_BILL_DAY)
+        donos_since_last_bill = await get_donation_period_total(last_6th)
+
+        # Amount from patrons
+        starting_amount = Config.KOFI_STARTING_AMOUNT
+
+        current_amount = donos_since_last_bill + starting_amount
+        status_api.set_donation_progress(
+            current_amount, Config.KOFI_DONATION_GOAL, last_6th
+        )
+        self.period_start = last_6th
+        return current_amount
+
+    @tasks.loop(minutes=10)
+    async def check_donation_period(self):
+        """Start the website's progress over when a new billing period begins."""
+        if self.period_start is None:
+            return
+        if get_last_occurrence_of_day(Config.KOFI_BILL_DAY) != self.period_start:
+            logger.info("New billing period, refreshing donation progress")
+            try:
+                await self._refresh_donation_progress()
+            except Exception as e:
+                logger.error(f"Could not refresh donation progress: {e}")
+
+    @staticmethod
+    def _donation_fields(donation: dict) -> tuple:
+        """
+        Pull what a donation needs out of a Ko-fi payload.
+
+        Raises:
+            KeyError, ValueError, TypeError: The payload is missing a field or
+            has one that can't be used.
+        """
+        # The url field isn't sent back, I think its just meant for the one who issued the donation.
+        return (
+            donation["is_public"],
+            donation["from_name"],
+            donation["email"],
+            float(donation["amount"]),
+        )
+
+    async def _process_donation(self, transaction_id: str, donation: dict):
+        """Record a donation and post the thank you and progress to Discord."""
+        is_public, donator, email, amount = self._donation_fields(donation)
 
         goal_url = "https://ko-fi.com/westcoastnoobs/goal"
 
+        # Add the donation to the database, once per transaction
+        recorded = await record_kofi_donation(transaction_id, donator, email, amount)
+        if not recorded:
+            logger.info(f"Ko-fi event {transaction_id} was already processed")
+            return
+
+        # Keep the website's progress current even if Discord is unavailable
+        current_amount = await self._refresh_donation_progress()
+
         # Publish donation action, thank user by given name
-        if verification_token == WEBHOOK_SECRET and is_public:
+        if is_public:
             thanks_msg = (
                 f"🎉 Thank you **{donator}** for your generous donation! 💸\n{goal_url}"
             )
         # Thanks when donator doesn't give name.
-        elif verification_token == WEBHOOK_SECRET and not is_public:
+        else:
             thanks_msg = (
                 "🎉 Thank you anonymous member for your generous donation! 💸❔"
             )
-        else:
-            logger.warning("Verification token not valid?")
-            logger.debug("%s", data)
-            return web.Response()
 
         # Send thankyou message, and progress to discord
         discord_channel = self.bot.get_channel(ANNOUNCE_CHANNEL)
         if isinstance(discord_channel, discord.TextChannel):
-            await discord_channel.send(thanks_msg)
+            await discord_outbox.send(discord_channel, content=thanks_msg)
             logger.info(thanks_msg)
 
-            # Add the donation to the database
-            added_to_db = await add_donation(donator, email, donation["amount"])
-            if not added_to_db:
-                logger.error("ERROR: Donation was not added to the db.")
-
-            # Day that the bill hits
-            last_6th = get_last_occurrence_of_day(Config.KOFI_BILL_DAY)
-            donos_since_last_bill = await get_total_donations_since(last_6th)
-
-            # Amount from patrons
-            starting_amount = Config.KOFI_STARTING_AMOUNT
-
-            current_amount = donos_since_last_bill + starting_amount
-
             donation_progress = show_donation_progress(current_amount, Config.KOFI_DONATION_GOAL)
-            await discord_channel.send(donation_progress)
+            await discord_outbox.send(discord_channel, content=donation_progress)
 
         else:
             # TODO: Learn how to use the damn built in logging module
@@ -86,19 +182,72 @@ class KoFiDonationCog(commands.Cog):
                 "WARNING: Discord message not sent. discord_channel is not a TextChannel."
             )
 
-        return web.Response()
+    async def _donation_worker(self):
+        """Drains persisted Ko-fi events to the database and Discord."""
+        try:
+            await self._refresh_donation_progress()
+        except Exception as e:
+            logger.error(f"Could not load donation progress: {e}")
+
+        # Pick up anything that arrived while the bot was down or mid-processing
+        for transaction_id, payload in await get_unprocessed_kofi_events():
+            self.event_queue.put_nowait((transaction_id, json.loads(payload)))
+
+        attempts: dict[str, int] = {}
+        while True:
+            transaction_id, donation = await self.event_queue.get()
+            try:
+                self._donation_fields(donation)
+            except (KeyError, ValueError, TypeError) as e:
+                logger.error(f"Ko-fi event {transaction_id} has a bad payload: {e!r}")
+                # Retrying a bad payload on every start won't fix it, the
+                # payload and error stay in kofi_events for a manual look
+                await mark_kofi_event_failed(
+                    transaction_id, f"{type(e).__name__}: {e}"
+                )
+                continue
+
+            try:
+                await self._process_donation(transaction_id, donation)
+            except Exception as e:
+                attempts[transaction_id] = attempts.get(transaction_id, 0) + 1
+                if attempts[transaction_id] >= KOFI_EVENT_ATTEMPTS:
+                    logger.error(
+                        f"Error processing Ko-fi event {transaction_id}: {e}, "
+                        "giving up until the next start"
+                    )
+                    continue
+                logger.error(
+                    f"Error processing Ko-fi event {transaction_id}: {e}, "
+                    f"retrying in {KOFI_RETRY_SECONDS}s"
+                )
+                asyncio.get_running_loop().call_later(
+                    KOFI_RETRY_SECONDS,
+                    self.event_queue.put_nowait,
+                    (transaction_id, donation),
+                )
+            else:
+                attempts.pop(transaction_id, None)
 
     @commands.Cog.listener()
     async def on_ready(self):
-        """Starts the Ko-fi webhook HTTP listener on port 5000."""
+        """Starts the Ko-fi webhook and status API HTTP listener on port 5000."""
+        # on_ready fires again after reconnects
+        if self.runner is not None:
+            return
+
         logger.info("Bot is ready, starting Ko-fi webhook listener on port 5000...")
 
+        self.worker_task = asyncio.create_task(self._donation_worker())
+        self.check_donation_period.start()
+
         app = web.Application()
         app.router.add_post(WEBHOOK_PATH, self._handle_kofi_donation)
+        status_api.add_routes(app)
 
-        runner = web.AppRunner(app)
-        await runner.setup()
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
         site = web.TCPSite(
-            runner, "127.0.0.1", 5000
+            self.runner, "127.0.0.1", 5000
         )  # Change the IP and port as needed
         await site.start()
@@ -8,8 +8,9 @@ from discord.ext import commands, tasks
 
 from src.config import Config
 from src.features.auto_restart import auto_restart
+from src.features.server_status import server_status
+from src.services.discord_outbox import Priority, discord_outbox
 from src.services.server import (
-    combine_servers_workshop_ids,
     get_servers_workshop_ids,
     restart_zomboid_server,
     server_setting_paths,
@@ -17,12 +18,15 @@ from src.services.server import (
 )
 from src.services.steam import get_workshop_items
 from src.services.workshop import extract_workshop_ids, write_ids_to_file
+from src.utils.supervisor import ServerSupervisor
 
 logger = logging.getLogger(__name__)
 
 ANNOUNCE_CHANNEL = Config.ANNOUNCE_CHANNEL
 MY_GUILD = Config.MY_GUILD
 PZ_ADMIN_ROLE_ID = Config.PZ_ADMIN_ROLE_ID
+# Covers a restart, which waits on systemctl
+WORKSHOP_SCAN_TIMEOUT_SECONDS = 300
 
 
 class ModUpdatesCog(commands.Cog):
@@ -31,6 +35,9 @@ class ModUpdatesCog(commands.Cog):
         self.server_error_counters: dict[str, int] = {}
         self.mod_update_times: dict[str, int] = {}
         self.workshop_ids: list[str] | None = None
+        self.workshop_supervisor = ServerSupervisor(
+            "Workshop error scan", WORKSHOP_SCAN_TIMEOUT_SECONDS, backoff=60
+        )
 
     async def cog_unload(self):
         self.check_mod_updates.cancel()
@@ -48,7 +55,11 @@ class ModUpdatesCog(commands.Cog):
         logger.info("Checking for mod updates...")
 
         # Dynamically fetch the latest workshop IDs from running servers
-        current_workshop_ids = await combine_servers_workshop_ids()
+        paths = await server_setting_paths()
+        servers_workshop_ids = await get_servers_workshop_ids(paths)
+        current_workshop_ids = list(
+            {wid for ids in servers_workshop_ids.values() for wid in ids}
+        )
 
         if not current_workshop_ids:
             logger.info("No workshop IDs found on any running servers, skipping check")
@@ -57,6 +68,18 @@ class ModUpdatesCog(commands.Cog):
         self.workshop_ids = current_workshop_ids
         workshop_items = await get_workshop_items(self.workshop_ids)
 
+        # Keep each server's mod titles around for status lookups
+        titles = {
+            item["publishedfileid"]: item["title"].strip()
+            for item in workshop_items
+            if "title" in item
+        }
+        for system_user, ids in servers_workshop_ids.items():
+            server_status.update_mods(
+                Config.SERVER_NAMES.get(system_user, system_user),
+                [titles.get(wid, wid) for wid in ids],
+            )
+
         for item in workshop_items:
             if "title" not in item:
                 continue
@@ -119,7 +142,9 @@ class ModUpdatesCog(commands.Cog):
                     logger.warning("Chan is not TextChannel?")
                     continue
 
-                await chan.send(update_msg)
+                await discord_outbox.send(
+                    chan, content=update_msg, priority=Priority.ALERT
+                )
 
                 logger.info("A mod has updated!")
                 logger.info(f"title: {item['title'].strip()}")
@@ -160,74 +185,19 @@ class ModUpdatesCog(commands.Cog):
             self.check_workshop_errors.cancel()
             return
 
-        all_servers_complete = True
-
-        for server_name, workshop_ids in modded_servers.items():
-            if server_name not in self.server_error_counters:
-                self.server_error_counters[server_name] = 0
-
-            if self.server_error_counters[server_name] >= 5:
+        pending = []
+        for server_name in modded_servers:
+            if self.server_error_counters.setdefault(server_name, 0) >= 5:
                 logger.debug(f"Server {server_name} error scan complete (5 iterations)")
-                continue
-
-            self.server_error_counters[server_name] += 1
-            logger.debug(
-                f"Workshop error scan for {server_name}: iteration {self.server_error_counters[server_name]}/5"
-            )
-
-            if server_name not in Config.SYSTEM_USERS:
-                logger.warning(
-                    f"Server {server_name} not found in configuration. Skipping."
-                )
-                continue
-
-            system_user = Config.SYSTEM_USERS[server_name]
-            log_path = f"/home/{system_user}/log/console/pzserver-console.log"
-            output_path = f"/home/{system_user}/pz_scripts/workshop_id.txt"
-
-            try:
-                error_ids = await extract_workshop_ids(log_path)
-
-                if error_ids:
-                    logger.warning(f"Found workshop errors on {server_name}: {error_ids}")
-
-                    await write_ids_to_file(error_ids, output_path)
-                    logger.info(f"Workshop IDs written to {output_path}")
-
-                    chan = self.bot.get_channel(ANNOUNCE_CHANNEL)
-                    if chan and isinstance(chan, discord.TextChannel):
-                        await chan.send(
-                            f"🚨 **Workshop errors detected on {server_name}!**\n"
-                            f"Problematic workshop IDs: {', '.join(error_ids)}\n"
-                            f"Performing immediate server restart to apply fix..."
-                        )
-
-                    restart_success = await restart_zomboid_server(system_user)
-
-                    if chan and isinstance(chan, discord.TextChannel):
-                        if restart_success:
-                            await chan.send(
-                                f"✅ **{server_name}** restarted successfully and will be back up soon."
-                            )
-                        else:
-                            await chan.send(f"❌ Failed to restart **{server_name}**!")
-
-                    self.server_error_counters[server_name] = 0
-                else:
-                    logger.debug(f"No workshop errors found on {server_name}")
-                    self.server_error_counters[server_name] = 0
-
-            except FileNotFoundError:
-                logger.warning(
-                    f"Log file not found for {server_name}: {log_path}. Skipping."
-                )
-            except Exception as e:
-                logger.error(
-                    f"Error checking workshop errors for {server_name}: {e}. Skipping."
-                )
+            else:
+                pending.append(server_name)
 
-            all_servers_complete = False
+        # Scan every pending server at once, each with its own timeout
+        await self.workshop_supervisor.run(self.scan_workshop_errors, pending)
 
+        all_servers_complete = not any(
+            server_name in Config.SYSTEM_USERS for server_name in pending
+        )
         if all_servers_complete:
             self.check_workshop_errors.cancel()
             logger.info("Workshop error scan completed (all servers)")
@@ -240,3 +210,64 @@ class ModUpdatesCog(commands.Cog):
             self.check_workshop_errors.cancel()
             logger.info("Workshop error scan completed (no active errors)")
 
+    async def scan_workshop_errors(self, server_name: str):
+        """Scan one server's log for workshop errors and restart it if there are any."""
+        self.server_error_counters[server_name] += 1
+        logger.debug(
+            f"Workshop error scan for {server_name}: iteration {self.server_error_counters[server_name]}/5"
+        )
+
+        if server_name not in Config.SYSTEM_USERS:
+            logger.warning(f"Server {server_name} not found in configuration. Skipping.")
+            return
+
+        system_user = Config.SYSTEM_USERS[server_name]
+        log_path = f"/home/{system_user}/log/console/pzserver-console.log"
+        output_path = f"/home/{system_user}/pz_scripts/workshop_id.txt"
+
+        try:
+            error_ids = await extract_workshop_ids(log_path)
+        except FileNotFoundError:
+            logger.warning(f"Log file not found for {server_name}: {log_path}. Skipping.")
+            return
+
+        if not error_ids:
+            logger.debug(f"No workshop errors found on {server_name}")
+            self.server_error_counters[server_name] = 0
+            return
+
+        logger.warning(f"Found workshop errors on {server_name}: {error_ids}")
+
+        await write_ids_to_file(error_ids, output_path)
+        logger.info(f"Workshop IDs written to {output_path}")
+
+        chan = self.bot.get_channel(ANNOUNCE_CHANNEL)
+        if chan and isinstance(chan, discord.TextChannel):
+            await discord_outbox.send(
+                chan,
+                content=(
+                    f"🚨 **Workshop errors detected on {server_name}!**\n"
+                    f"Problematic workshop IDs: {', '.join(error_ids)}\n"
+                    f"Performing immediate server restart to apply fix..."
+                ),
+                priority=Priority.ALERT,
+            )
+
+        restart_success = await restart_zomboid_server(system_user)
+
+        if chan and isinstance(chan, discord.TextChannel):
+            if restart_success:
+                await discord_outbox.send(
+                    chan,
+                    content=f"✅ **{server_name}** restarted successfully and will be back up soon.",
+                    priority=Priority.ALERT,
+                )
+            else:
+                await discord_outbox.send(
+                    chan,
+                    content=f"❌ Failed to restart **{server_name}**!",
+                    priority=Priority.ALERT,
+                )
+
+        self.server_error_counters[server_name] = 0
+
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import time
 
@@ -5,15 +6,44 @@ import discord
 from discord.ext import commands, tasks
 
 from src.config import Config
-from src.services.steam import get_player_list_string
+from src.features.server_status import server_status
+from src.services.bot_db import (
+    get_playerlist_messages,
+    is_db_open,
+    set_playerlist_message,
+)
+from src.services.discord_outbox import Priority, discord_outbox
+from src.services.steam import format_player_list, get_online_players
+from src.utils.supervisor import ServerSupervisor
 
 logger = logging.getLogger(__name__)
 
+# A2S queries time out well before this, it's for a stuck Discord edit
+SERVER_TIMEOUT_SECONDS = 30
+
 
 class PlayerlistCog(commands.Cog):
     """Cog for periodically updating the playerlist message in Discord threads."""
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.servers = {srv["server_name"]: srv for srv in Config.SERVER_DATA}
+        self.supervisor = ServerSupervisor("Playerlist update", SERVER_TIMEOUT_SECONDS)
+        # server_name: (thread_id, message_id) for playerlists the bot reposted
+        self.reposted: dict[str, tuple[int, int]] = {}
+
+    async def get_player_list(self, ip: str, port: int, server_name: str) -> str:
+        """Query a server's players, record them in the status cache and format them."""
+        try:
+            players = await get_online_players(ip, port)
+        except asyncio.TimeoutError:
+            server_status.update_players(server_name, False, [])
+            return f"**{server_name}**: Connection timed out (Steam Network)."
+        except Exception as e:
+            server_status.update_players(server_name, False, [])
+            return f"**{server_name}**: Error - {str(e)}"
+
+        server_status.update_players(server_name, True, [p.name for p in players])
+        return format_player_list(players, server_name)
 
     @tasks.loop(seconds=60)
     async def update_loop(self):
@@ -22,47 +52,53 @@ class PlayerlistCog(commands.Cog):
             logger.warning("SERVER_PUB_IP is not a string. Skipping loop.")
             return
 
-        for srv_info in Config.SERVER_DATA:
-            if not srv_info["discord_playerlist"]:
-                continue
-
-            thread_id = srv_info["discord_playerlist"]["thread_id"]
-            msg_id = srv_info["discord_playerlist"]["message_id"]
-
-            thread = self.bot.get_channel(thread_id)
-            if not thread or not isinstance(
-                thread, (discord.Thread, discord.TextChannel)
-            ):
-                logger.warning(
-                    f"Could not find thread {thread_id} for {srv_info['server_name']}"
-                )
-                continue
-
-            # Quick and dirty for setup
-            if msg_id == 123:
-                await thread.send("Initial msg copy this id")
-                return
-
-            try:
-                content = await get_player_list_string(
-                    ip, int(srv_info["port"]), srv_info["server_name"]
-                )
+        # Every server at once, so one slow A2S query doesn't hold up the rest
+        await self.supervisor.run(
+            lambda server_name: self.update_server(ip, self.servers[server_name]),
+            list(self.servers),
+        )
+
+    async def update_server(self, ip: str, srv_info: dict):
+        """Refresh one server's status and its playerlist message."""
+        if not srv_info["discord_playerlist"]:
+            # No thread to post to, but keep the status cache fresh
+            await self.get_player_list(ip, int(srv_info["port"]), srv_info["server_name"])
+            return
 
-                msg = await thread.fetch_message(msg_id)
+        server_name = srv_info["server_name"]
+        thread_id = srv_info["discord_playerlist"]["thread_id"]
+        msg_id = srv_info["discord_playerlist"]["message_id"]
 
-                # Dynamic Discord timestamp (e.g., "5 minutes ago")
-                timestamp = f"\n*Last updated: <t:{int(time.time())}:R>*"
+        # A repost replaces the configured message for as long as the thread is the same
+        reposted = self.reposted.get(server_name)
+        if reposted and reposted[0] == thread_id:
+            msg_id = reposted[1]
 
-                await msg.edit(content=f"{content}{timestamp}")
+        thread = self.bot.get_channel(thread_id)
+        if not thread or not isinstance(thread, (discord.Thread, discord.TextChannel)):
+            logger.warning(
+                f"Could not find thread {thread_id} for {srv_info['server_name']}"
+            )
+            return
 
-            except discord.NotFound:
-                logger.warning(
-                    f"Message {msg_id} not found in {srv_info['server_name']}"
-                )
-            except Exception as e:
-                logger.error(
-                    f"Error updating {srv_info['server_name']}: {e}"
-                )
+        content = await self.get_player_list(ip, int(srv_info["port"]), server_name)
+
+        # Dynamic Discord timestamp (e.g., "5 minutes ago")
+        timestamp = f"\n*Last updated: <t:{int(time.time())}:R>*"
+
+        # Edit by ID, fetching the message first would double the REST calls
+        msg = thread.get_partial_message(msg_id)
+        try:
+            await discord_outbox.edit(
+                msg, content=f"{content}{timestamp}", priority=Priority.NORMAL
+            )
+        except discord.NotFound:
+            # Deleted, or a placeholder ID on first setup, post a new one
+            logger.warning(f"Message {msg_id} not found in {server_name}, reposting")
+            new_msg = await discord_outbox.send(thread, content=f"{content}{timestamp}")
+            self.reposted[server_name] = (thread_id, new_msg.id)
+            if is_db_open():
+                await set_playerlist_message(server_name, thread_id, new_msg.id)
 
     @update_loop.before_loop
     async def before_update_loop(self):
@@ -71,6 +107,13 @@ class PlayerlistCog(commands.Cog):
 
     async def cog_load(self):
         """Auto-start the loop when the Cog is loaded."""
+        # The playerlist doesn't need the database, reposts just won't survive a restart
+        if is_db_open():
+            self.reposted = await get_playerlist_messages()
+        else:
+            logger.warning(
+                "Bot database unavailable, reposted playerlist messages won't be saved"
+            )
         if not self.update_loop.is_running():
             self.update_loop.start()
 
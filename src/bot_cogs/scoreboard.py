@@ -5,6 +5,7 @@ import discord
 from discord.ext import commands, tasks
 
 from src.config import Config
+from src.services.discord_outbox import Priority, discord_outbox
 
 logger = logging.getLogger(__name__)
 
@@ -43,4 +44,6 @@ class ScoreboardCog(commands.Cog):
             logger.warning("Chan is not TextChannel?")
             return
 
-        await chan.send("https://westcoastnoobs.com")
\ No newline at end of file
+        await discord_outbox.send(
+            chan, content="https://westcoastnoobs.com", priority=Priority.BULK
+        )
\ No newline at end of file
@@ -8,34 +8,47 @@ import discord
 from discord.ext import commands, tasks
 
 from src.config import Config
-from src.services.bot_db import (
-    add_ticket_notification,
-    clear_ticket_notifications_for_server,
-    get_last_processed_ticket_id,
-    get_tracked_tickets,
-    get_tracked_tickets_in_range,
-    is_ticket_processed,
-    update_ticket_state,
-)
+from src.features.ticket_tracker import TrackedTicket, ticket_tracker
+from src.services.bot_db import record_ticket_history
+from src.services.discord_outbox import Priority, discord_outbox
+from src.services.game_db import game_db_connection, game_db_path
+from src.services.game_db_changes import TicketsChanged, game_db_changes
+from src.utils.supervisor import ServerSupervisor
 
 logger = logging.getLogger(__name__)
 
 MOD_CHANNEL = Config.MOD_CHANNEL
+# Matches the LIMIT on the new ticket query
+NEW_TICKETS_PER_CYCLE = 20
+# Long enough to post a full batch of new tickets
+SERVER_TIMEOUT_SECONDS = 120
+# Tickets posted during the startup sync before they are recorded
+SYNC_BATCH_SIZE = 25
+# SQLite's largest integer, for "every ticket" ranges
+MAX_TICKET_ID = 2**63 - 1
 
 
 class TicketWatcherCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.ticket_thread_id = None
-        self.retry_count = 0
-        self.max_retries = 3
-        self.server_last_ticket_ids = {}  # Track last ticket ID per server
-        for server_config in Config.SERVER_DATA:
-            self.server_last_ticket_ids[server_config["server_name"]] = 0
+        self.supervisor = ServerSupervisor("Ticket monitor", SERVER_TIMEOUT_SECONDS)
+
+        # Servers whose tickets changed since they were last processed, all of
+        # them to start with. Only used while the change feed is running.
+        self.changed_servers = {srv["server_name"] for srv in Config.SERVER_DATA}
+        game_db_changes.subscribe(TicketsChanged, self.on_tickets_changed)
+        if game_db_changes.is_running:
+            # Idle servers are skipped, so checking often is cheap
+            self.ticket_monitor.change_interval(seconds=5)
 
     async def cog_unload(self):
         """Clean up when cog is unloaded."""
         self.ticket_monitor.cancel()
+        game_db_changes.unsubscribe(TicketsChanged, self.on_tickets_changed)
+
+    async def on_tickets_changed(self, event: TicketsChanged):
+        self.changed_servers.add(Config.SERVER_NAMES.get(event.server, event.server))
 
     @commands.Cog.listener()
     async def on_ready(self):
@@ -45,6 +58,9 @@ class TicketWatcherCog(commands.Cog):
         # Create or get the ticket thread
         await self.ensure_ticket_thread()
 
+        # Tracked tickets are read from memory from here on
+        await ticket_tracker.load()
+
         # Sync with game database on startup
         await self.sync_with_game_database()
 
@@ -70,94 +86,18 @@ class TicketWatcherCog(commands.Cog):
         for server_config in Config.SERVER_DATA:
             server_name = server_config["server_name"]
             system_user = server_config["system_user"]
-            db_path = f"/home/{system_user}/Zomboid/db/pzserver.db"
+            db_path = game_db_path(system_user)
 
             if not os.path.exists(db_path):
                 logger.warning(f"Database not found for {server_name}: {db_path}")
                 continue
 
             try:
-                # Use read-only mode to avoid conflicts with PZ server
-                async with aiosqlite.connect(
-                    f"file:{db_path}?mode=ro", uri=True
-                ) as pz_db:
-                    async with pz_db.execute(
-                        "SELECT id, message, author, answeredID FROM tickets WHERE answeredID IS NULL ORDER BY id ASC"
-                    ) as cursor:
-                        all_tickets = await cursor.fetchall()
-                        ticket_count = sum(1 for _ in all_tickets) if all_tickets else 0
-
-                logger.info(f"Found {ticket_count} tickets in {server_name} database")
-
-                tickets_added = 0
-                tickets_skipped = 0
-
-                for ticket in all_tickets:
-                    ticket_id, message, author, answered_id = ticket
-
-                    # Check if we already have this ticket in our tracking (duplicate prevention)
-                    if await is_ticket_processed(server_name, ticket_id):
-                        tickets_skipped += 1
-                        continue
-
-                    # For original tickets, check if there's an answer (simplified 2-state system)
-                    async with aiosqlite.connect(
-                        f"file:{db_path}?mode=ro", uri=True
-                    ) as pz_db:
-                        answer = await self._find_answer_for_ticket(pz_db, ticket_id)
-                        if answer:
-                            state = "answered"
-                        else:
-                            state = "unanswered"
-
-                        # Create embed for existing ticket
-                        embed = discord.Embed(
-                            title=f"🎫 [{server_name}] Support Ticket #{ticket_id}",
-                            color=self._get_state_color(state),
-                            timestamp=datetime.now(timezone.utc),
-                        )
-                        embed.add_field(
-                            name="Status",
-                            value=self._get_state_text(state),
-                            inline=True,
-                        )
-                        embed.description = await self._build_ticket_description(
-                            pz_db, ticket_id, message, author, answered_id
-                        )
-                        embed.set_footer(text="WCN Ticket System")
-
-                        try:
-                            discord_message = await thread.send(embed=embed)
-
-                            # Record the notification
-                            await add_ticket_notification(
-                                server_name, ticket_id, discord_message.id, thread.id
-                            )
-
-                            # Update state tracking
-                            await update_ticket_state(server_name, ticket_id, state)
-                            tickets_added += 1
-
-                            logger.info(
-                                f"Added {server_name} ticket #{ticket_id} from {author}"
-                            )
-
-                        except discord.Forbidden:
-                            logger.warning(
-                                "Missing permissions to send messages during sync"
-                            )
-                            break
-                        except Exception as e:
-                            logger.error(
-                                f"Error sending {server_name} ticket #{ticket_id} during sync: {e}"
-                            )
-
-                total_tickets_added += tickets_added
-                total_tickets_skipped += tickets_skipped
-                logger.info(
-                    f"{server_name} sync completed - added {tickets_added} tickets, skipped {tickets_skipped} already tracked"
-                )
-
+                # Every unanswered ticket and its answer in one query
+                async with game_db_connection(system_user) as pz_db:
+                    all_tickets = await self._fetch_tickets_with_answers(
+                        pz_db, unanswered_only=True
+                    )
             except aiosqlite.OperationalError as e:
                 if "database is locked" in str(e).lower():
                     logger.warning(
@@ -165,13 +105,89 @@ class TicketWatcherCog(commands.Cog):
                     )
                 else:
                     logger.error(f"{server_name} database error during sync: {e}")
+                continue
             except Exception as e:
                 logger.error(f"Error during {server_name} database sync: {e}")
+                continue
+
+            logger.info(f"Found {len(all_tickets)} tickets in {server_name} database")
+            await self._record_history(server_name, all_tickets)
+
+            # Diff against tracked tickets in memory (duplicate prevention)
+            tracked_ids = ticket_tracker.ticket_ids(server_name)
+            new_tickets = [
+                (ticket_id, row)
+                for ticket_id, row in all_tickets.items()
+                if ticket_id not in tracked_ids
+            ]
+            tickets_skipped = len(all_tickets) - len(new_tickets)
+            tickets_added = await self._post_synced_tickets(
+                server_name, thread, new_tickets
+            )
+
+            total_tickets_added += tickets_added
+            total_tickets_skipped += tickets_skipped
+            logger.info(
+                f"{server_name} sync completed - added {tickets_added} tickets, skipped {tickets_skipped} already tracked"
+            )
 
         logger.info(
             f"Overall sync completed - added {total_tickets_added} tickets, skipped {total_tickets_skipped} already tracked"
         )
 
+    async def _post_synced_tickets(
+        self, server_name: str, thread, new_tickets: list[tuple[int, tuple]]
+    ) -> int:
+        """
+        Post tickets found by the startup sync and start tracking them.
+
+        A batch is queued on the outbox at once, which sends it in order as
+        fast as the thread's rate limit allows, then recorded in one bot_db
+        transaction. Only a batch in flight is lost to a crash or restart.
+        """
+        total = len(new_tickets)
+        tickets_added = 0
+
+        for start in range(0, total, SYNC_BATCH_SIZE):
+            batch = new_tickets[start : start + SYNC_BATCH_SIZE]
+            states = []
+            sends = []
+            for ticket_id, row in batch:
+                state, description = self._ticket_state_and_description(row)
+                embed = self._ticket_embed(server_name, ticket_id, state, description)
+                states.append(state)
+                sends.append(
+                    discord_outbox.send(thread, embed=embed, priority=Priority.BULK)
+                )
+
+            results = await asyncio.gather(*sends, return_exceptions=True)
+
+            posted = []
+            forbidden = False
+            for (ticket_id, _), state, result in zip(batch, states, results):
+                if isinstance(result, discord.Forbidden):
+                    forbidden = True
+                elif isinstance(result, BaseException):
+                    logger.error(
+                        f"Error sending {server_name} ticket #{ticket_id} during sync: {result}"
+                    )
+                else:
+                    posted.append(TrackedTicket(ticket_id, result.id, thread.id, state))
+
+            # Record the notifications and their states in one transaction
+            await ticket_tracker.add_many(server_name, posted)
+            tickets_added += len(posted)
+
+            if forbidden:
+                logger.warning("Missing permissions to send messages during sync")
+                break
+            if total > SYNC_BATCH_SIZE:
+                logger.info(
+                    f"Sync progress: {min(start + SYNC_BATCH_SIZE, total)}/{total} {server_name} tickets posted"
+                )
+
+        return tickets_added
+
     async def ensure_ticket_thread(self):
         """Create or retrieve the support tickets thread."""
         mod_channel = self.bot.get_channel(MOD_CHANNEL)
@@ -197,9 +213,12 @@ class TicketWatcherCog(commands.Cog):
             logger.info(f"Created new ticket thread: {thread.id}")
 
             # Send initial message
-            await thread.send(
-                "🎫 **Support Ticket Monitor Started**\n\n"
-                "This thread will automatically post new support tickets from the server database."
+            await discord_outbox.send(
+                thread,
+                content=(
+                    "🎫 **Support Ticket Monitor Started**\n\n"
+                    "This thread will automatically post new support tickets from the server database."
+                ),
             )
         except discord.Forbidden:
             logger.warning("Missing permissions to create thread in mod channel")
@@ -220,115 +239,106 @@ class TicketWatcherCog(commands.Cog):
                 logger.warning(f"Could not find thread {self.ticket_thread_id}")
                 return
 
-            # Process each server
-            for server_config in Config.SERVER_DATA:
-                server_name = server_config["server_name"]
-                system_user = server_config["system_user"]
-                db_path = f"/home/{system_user}/Zomboid/db/pzserver.db"
+            # Every server at once, each with its own timeout and backoff
+            await self.supervisor.run(
+                lambda server_name: self._monitor_server(server_name, thread),
+                [srv["server_name"] for srv in Config.SERVER_DATA],
+            )
 
-                if not os.path.exists(db_path):
-                    logger.warning(
-                        f"Database file not found for {server_name}: {db_path}"
-                    )
-                    continue
+        except Exception as e:
+            logger.error(f"Unexpected error in monitor loop: {e}")
 
-                try:
-                    # Connect to PZ server database
-                    async with aiosqlite.connect(db_path) as pz_db:
-                        # Phase 1: Process new tickets
-                        await self._process_new_tickets(server_name, pz_db, thread)
-
-                        # Phase 2: Process status updates on tracked tickets
-                        await self._process_status_updates(server_name, pz_db, thread)
-
-                except aiosqlite.OperationalError as e:
-                    if "database is locked" in str(e).lower():
-                        logger.warning(
-                            f"{server_name} database locked (attempt {self.retry_count + 1})"
-                        )
-                        self.retry_count += 1
-                        if self.retry_count >= self.max_retries:
-                            logger.warning(
-                                "Max retries reached, stopping loop temporarily"
-                            )
-                            self.ticket_monitor.restart()
-                    else:
-                        logger.error(f"{server_name} database error: {e}")
-                    continue  # Skip to next server
-                except Exception as e:
-                    logger.error(f"Unexpected error for {server_name}: {e}")
-                    continue  # Skip to next server
+    async def _monitor_server(self, server_name: str, thread):
+        """Check one server's game database for new and updated tickets."""
+        system_user = Config.SYSTEM_USERS[server_name]
+        db_path = game_db_path(system_user)
 
-            # Reset retry count on success
-            self.retry_count = 0
+        # Nothing to do until the change feed sees the tickets table change
+        if game_db_changes.is_running:
+            if server_name not in self.changed_servers:
+                return
+            self.changed_servers.discard(server_name)
 
-        except Exception as e:
-            logger.error(f"Unexpected error in monitor loop: {e}")
+        if not os.path.exists(db_path):
+            logger.warning(f"Database file not found for {server_name}: {db_path}")
+            return
+
+        try:
+            # Phase 1: Process new tickets
+            await self._process_new_tickets(server_name, system_user, thread)
 
-    async def _process_new_tickets(self, server_name: str, pz_db, thread):
+            # Phase 2: Process status updates on tracked tickets
+            await self._process_status_updates(server_name, system_user, thread)
+        except BaseException:
+            # Failed, timed out or cancelled, try this server again next time
+            self.changed_servers.add(server_name)
+            raise
+
+    async def _process_new_tickets(self, server_name: str, system_user: str, thread):
         """Process and post new unanswered tickets."""
-        # Check for game world reset by seeing if tickets table is empty
-        async with pz_db.execute("SELECT COUNT(*) FROM tickets") as cursor:
-            result = await cursor.fetchone()
-            ticket_count = result[0] if result else 0
+        last_tracked_id = ticket_tracker.last_ticket_id(server_name)
+
+        # The connection is only held for the reads, the pool is shared with
+        # commands and the Discord posts below can take a while
+        async with game_db_connection(system_user) as pz_db:
+            # Check for game world reset by seeing if tickets table is empty
+            async with pz_db.execute("SELECT COUNT(*) FROM tickets") as cursor:
+                result = await cursor.fetchone()
+                ticket_count = result[0] if result else 0
 
-        last_tracked_id = await get_last_processed_ticket_id(server_name)
+            new_tickets = await self._fetch_new_tickets(pz_db, last_tracked_id)
 
         if ticket_count == 0 and last_tracked_id > 0:
             logger.warning(
-                f"Detected reset for {server_name} (table empty, last tracked: {last_tracked_id}), resyncing..."
+                f"Detected reset for {server_name} (table empty, last tracked: {last_tracked_id}), clearing its tracking"
             )
-            await clear_ticket_notifications_for_server(server_name)
-            await self.sync_with_game_database()
+            # The table is empty, so there is nothing to sync. Tickets of the
+            # new world are picked up as new tickets from ID 0 on.
+            await ticket_tracker.clear_server(server_name)
             return
 
-        # Query only for tickets after the last tracked ID (efficient - skip already processed)
-        query = """
-            SELECT id, message, author 
-            FROM tickets 
-            WHERE answeredID IS NULL AND id > ?
-            ORDER BY id ASC
-            LIMIT 20
-        """
+        if not new_tickets:
+            return
 
-        async with pz_db.execute(query, (last_tracked_id,)) as cursor:
-            new_tickets = await cursor.fetchall()
+        await self._record_history(server_name, new_tickets)
 
-            if new_tickets:
-                logger.info(
-                    f"Found {len(new_tickets)} new tickets for {server_name} (last tracked: {last_tracked_id})"
-                )
+        # More are waiting, pick them up next cycle without a new change
+        if len(new_tickets) == NEW_TICKETS_PER_CYCLE:
+            self.changed_servers.add(server_name)
 
-            for ticket in new_tickets:
-                ticket_id, message, author = ticket
+        logger.info(
+            f"Found {len(new_tickets)} new tickets for {server_name} (last tracked: {last_tracked_id})"
+        )
+
+        tracked_ids = ticket_tracker.ticket_ids(server_name)
+        posted = []
+
+        try:
+            for ticket_id, row in new_tickets.items():
+                author = row[1]
 
                 # Skip if already processed (duplicate prevention)
-                if await is_ticket_processed(server_name, ticket_id):
+                if ticket_id in tracked_ids:
                     logger.debug(
                         f"The ticket # {ticket_id} looks processed for the {server_name}."
                     )
                     continue
 
                 # Create and send embed
-                embed = discord.Embed(
-                    title=f"🎫 [{server_name}] New Support Ticket #{ticket_id}",
-                    color=self._get_state_color("unanswered"),
-                    timestamp=datetime.now(timezone.utc),
-                )
-                embed.add_field(
-                    name="Status", value=self._get_state_text("unanswered"), inline=True
-                )
-                embed.description = await self._build_ticket_description(
-                    pz_db, ticket_id, message, author, None
+                state, description = self._ticket_state_and_description(row)
+                embed = self._ticket_embed(
+                    server_name,
+                    ticket_id,
+                    state,
+                    description,
+                    title="New Support Ticket",
                 )
-                embed.set_footer(text="WCN Ticket System")
 
                 try:
-                    discord_message = await thread.send(embed=embed)
+                    discord_message = await discord_outbox.send(thread, embed=embed)
 
-                    # Record the notification
-                    await add_ticket_notification(
-                        server_name, ticket_id, discord_message.id, thread.id
+                    posted.append(
+                        TrackedTicket(ticket_id, discord_message.id, thread.id, state)
                     )
 
                     logger.info(
@@ -340,50 +350,85 @@ class TicketWatcherCog(commands.Cog):
                     break
                 except Exception as e:
                     logger.error(f"Error sending message: {e}")
+        finally:
+            # Record the notifications in one transaction
+            await ticket_tracker.add_many(server_name, posted)
 
-    async def _process_status_updates(self, server_name: str, pz_db, thread):
+    async def _fetch_new_tickets(self, pz_db, last_tracked_id: int) -> dict:
+        """
+        Up to NEW_TICKETS_PER_CYCLE unanswered tickets after last_tracked_id.
+
+        Returns:
+            dict: ticket ID to a row like _fetch_tickets_with_answers returns,
+            with the answer in case one came in before the ticket was posted.
+        """
+        query = """
+            SELECT t.id, t.message, t.author, a.author, a.message
+            FROM tickets t
+            LEFT JOIN tickets a ON a.answeredID = t.id
+            WHERE t.id IN (
+                SELECT id FROM tickets
+                WHERE answeredID IS NULL AND id > ?
+                ORDER BY id ASC
+                LIMIT ?
+            )
+            ORDER BY t.id ASC, a.id ASC
+        """
+
+        new_tickets = {}
+        async with pz_db.execute(
+            query, (last_tracked_id, NEW_TICKETS_PER_CYCLE)
+        ) as cursor:
+            async for ticket_id, *row in cursor:
+                # The first answer wins, as in _fetch_tickets_with_answers
+                new_tickets.setdefault(ticket_id, tuple(row))
+        return new_tickets
+
+    async def _process_status_updates(self, server_name: str, system_user: str, thread):
         """Process status updates for existing tracked tickets."""
-        # Get valid ticket ID range from game DB
-        async with pz_db.execute("SELECT MIN(id), MAX(id) FROM tickets") as cursor:
-            row = await cursor.fetchone()
-            min_id = row[0] if row and row[0] is not None else 0
-            max_id = row[1] if row and row[1] is not None else 0
-
-        # Only get tracked tickets within the current game DB range
-        tracked_tickets = await get_tracked_tickets_in_range(
-            server_name, min_id, max_id
-        )
+        tracked_tickets = {
+            ticket.ticket_id: ticket for ticket in ticket_tracker.tickets(server_name)
+        }
+        if not tracked_tickets:
+            return
 
-        # Count how many tickets actually need updates for progress tracking
-        tickets_needing_updates = []
-        for tracked_ticket in tracked_tickets:
-            (
-                tracked_server_name,
-                ticket_id,
-                discord_message_id,
-                thread_id,
-                last_state,
-            ) = tracked_ticket
+        # Every ticket in the tracked range with its answer, in one query. The
+        # connection goes back to the pool before any embeds are edited.
+        async with game_db_connection(system_user) as pz_db:
+            current_tickets = await self._fetch_tickets_with_answers(
+                pz_db, min(tracked_tickets), max(tracked_tickets)
+            )
 
-            # Only process tickets for this server
-            if tracked_server_name != server_name:
+        # Diff against what was last posted. Deleted tickets don't come back
+        # from the query, so they are skipped and left in bot_db.
+        tickets_needing_updates = []
+        for ticket_id, row in current_tickets.items():
+            tracked_ticket = tracked_tickets.get(ticket_id)
+            if tracked_ticket is None:
+                continue
+            current_state, description = self._ticket_state_and_description(row)
+            if current_state == tracked_ticket.last_state:
                 continue
 
-            try:
-                current_state = await self._determine_ticket_state(pz_db, ticket_id)
-                # Skip deleted tickets (current_state is None) - leave them in bot_db
-                if current_state is not None and current_state != last_state:
-                    tickets_needing_updates.append(
-                        (
-                            ticket_id,
-                            discord_message_id,
-                            thread_id,
-                            last_state,
-                            current_state,
-                        )
-                    )
-            except Exception as e:
-                logger.error(f"Error checking {server_name} ticket #{ticket_id}: {e}")
+            tickets_needing_updates.append(
+                (
+                    ticket_id,
+                    tracked_ticket.discord_message_id,
+                    tracked_ticket.thread_id,
+                    tracked_ticket.last_state,
+                    current_state,
+                    description,
+                )
+            )
+
+        # Answers go into the history as soon as they are seen
+        await self._record_history(
+            server_name,
+            {
+                ticket_id: current_tickets[ticket_id]
+                for ticket_id, *_ in tickets_needing_updates
+            },
+        )
 
         total_updates = len(tickets_needing_updates)
 
@@ -391,6 +436,9 @@ class TicketWatcherCog(commands.Cog):
         if total_updates > 5:
             logger.info(f"Processing {total_updates} {server_name} ticket updates...")
 
+        # State changes are recorded together once the embeds are edited
+        applied_updates = []
+
         # Process the updates
         for i, (
             ticket_id,
@@ -398,98 +446,138 @@ class TicketWatcherCog(commands.Cog):
             thread_id,
             last_state,
             current_state,
+            description,
         ) in enumerate(tickets_needing_updates):
-            try:
-                await self._update_ticket_embed(
-                    server_name,
-                    thread,
-                    discord_message_id,
-                    ticket_id,
-                    current_state,
-                    pz_db,
-                )
+            updated = await self._update_ticket_embed(
+                server_name,
+                thread,
+                thread_id,
+                discord_message_id,
+                ticket_id,
+                current_state,
+                description,
+            )
+            if not updated:
+                # Keep the old state so the edit is tried again
+                continue
+
+            # Update our tracking
+            applied_updates.append((ticket_id, current_state))
+            logger.info(
+                f"Updated {server_name} ticket #{ticket_id}: {last_state} → {current_state}"
+            )
 
-                # Update our tracking
-                await update_ticket_state(server_name, ticket_id, current_state)
+            # Show progress for large batches
+            if total_updates > 5 and (i + 1) % 5 == 0:
                 logger.info(
-                    f"Updated {server_name} ticket #{ticket_id}: {last_state} → {current_state}"
+                    f"Progress: {i + 1}/{total_updates} {server_name} updates completed"
                 )
 
-                # Show progress for large batches
-                if total_updates > 5 and (i + 1) % 5 == 0:
-                    logger.info(
-                        f"Progress: {i + 1}/{total_updates} {server_name} updates completed"
-                    )
-
-            except discord.NotFound:
-                logger.warning(
-                    f"Message {discord_message_id} for {server_name} ticket #{ticket_id} not found"
-                )
-            except Exception as e:
-                logger.error(f"Error updating {server_name} ticket #{ticket_id}: {e}")
+        await ticket_tracker.update_states(server_name, applied_updates)
+        if len(applied_updates) < total_updates:
+            # Retry the failed edits next cycle rather than waiting for a new change
+            self.changed_servers.add(server_name)
 
         # Final progress update for large batches
         if total_updates > 5:
             logger.info(f"Completed {total_updates} {server_name} ticket updates")
 
-    async def _determine_ticket_state(self, pz_db, ticket_id):
-        """Determine the current state of a ticket (simplified 2-state system)."""
-        # Check if ticket still exists
-        async with pz_db.execute(
-            "SELECT answeredID, author FROM tickets WHERE id = ?", (ticket_id,)
-        ) as cursor:
-            result = await cursor.fetchone()
+    async def _fetch_tickets_with_answers(
+        self, pz_db, min_id: int = 0, max_id: int = MAX_TICKET_ID, unanswered_only=False
+    ) -> dict:
+        """
+        Tickets with IDs between min_id and max_id and their answers, in one query.
 
-            if not result:
-                return None  # Ticket no longer exists, we'll stop tracking it
+        Answers carry the ID of the ticket they answer in answeredID, and the
+        first one wins when a ticket was answered more than once.
 
-            answered_id, author = result
+        Returns:
+            dict: ticket ID to (message, author, answer author, answer message),
+            in ID order. The answer fields are None for unanswered tickets.
+        """
+        unanswered_filter = "AND t.answeredID IS NULL" if unanswered_only else ""
+        query = f"""
+            SELECT t.id, t.message, t.author, a.author, a.message
+            FROM tickets t
+            LEFT JOIN tickets a
+                ON a.answeredID = t.id AND a.answeredID BETWEEN ? AND ?
+            WHERE t.id BETWEEN ? AND ? {unanswered_filter}
+            ORDER BY t.id ASC, a.id ASC
+        """
+        tickets = {}
+        async with pz_db.execute(query, (min_id, max_id, min_id, max_id)) as cursor:
+            async for ticket_id, *row in cursor:
+                tickets.setdefault(ticket_id, tuple(row))
+        return tickets
+
+    async def _record_history(self, server_name: str, tickets: dict) -> None:
+        """Keep the searchable ticket history up to date with tickets seen in the game DB."""
+        await record_ticket_history(
+            [
+                (server_name, ticket_id, author, message, answer_author, answer_message)
+                for ticket_id, (message, author, answer_author, answer_message) in (
+                    tickets.items()
+                )
+            ]
+        )
 
-            # Check if this ticket has an answer (for original tickets)
-            answer = await self._find_answer_for_ticket(pz_db, ticket_id)
-            if answer:
-                return "answered"
-            else:
-                return "unanswered"
+    def _ticket_state_and_description(self, row: tuple) -> tuple[str, str]:
+        """State and embed description for a row from _fetch_tickets_with_answers."""
+        message, author, answer_author, answer_message = row
+        if answer_author is None:
+            return "unanswered", self._format_ticket_description(author, message)
+        return "answered", self._format_ticket_description(
+            author, message, answer_author, answer_message
+        )
 
-    async def _update_ticket_embed(
-        self, server_name: str, thread, discord_message_id, ticket_id, state, pz_db
+    def _ticket_embed(
+        self, server_name: str, ticket_id, state, description, title="Support Ticket"
     ):
-        """Update the Discord embed with new ticket status."""
-        # Get ticket details for embed update
-        async with pz_db.execute(
-            "SELECT message, author, answeredID FROM tickets WHERE id = ?", (ticket_id,)
-        ) as cursor:
-            result = await cursor.fetchone()
-
-        if not result:
-            return
-
-        message, author, answered_id = result
-
-        # Create updated embed
+        """Embed for a ticket, titled "New Support Ticket" when it is first posted."""
         embed = discord.Embed(
-            title=f"🎫 [{server_name}] Support Ticket #{ticket_id}",
+            title=f"🎫 [{server_name}] {title} #{ticket_id}",
             color=self._get_state_color(state),
             timestamp=datetime.now(timezone.utc),
         )
         embed.add_field(name="Status", value=self._get_state_text(state), inline=True)
-        embed.description = await self._build_ticket_description(
-            pz_db, ticket_id, message, author, answered_id
-        )
+        embed.description = description
         embed.set_footer(text="WCN Ticket System")
+        return embed
 
-        # Update the message using rate-safe editing
+    async def _update_ticket_embed(
+        self,
+        server_name: str,
+        thread,
+        thread_id,
+        discord_message_id,
+        ticket_id,
+        state,
+        description,
+    ) -> bool:
+        """Update the Discord embed with new ticket status. Returns True if it was."""
+        embed = self._ticket_embed(server_name, ticket_id, state, description)
+
+        # Edit by the stored IDs rather than fetching the message first, and
+        # paced by the outbox, a newer state replaces one still waiting to go out
+        discord_message = self.bot.get_partial_messageable(
+            thread_id
+        ).get_partial_message(discord_message_id)
         try:
-            discord_message = await thread.fetch_message(discord_message_id)
-            success = await self.safe_message_edit(discord_message, embed=embed)
-            if success:
-                # Add conservative delay between updates
-                await asyncio.sleep(0.6)
+            await discord_outbox.edit(discord_message, embed=embed)
+            return True
         except discord.NotFound:
+            # Deleted on Discord, post it again and track the new message
             logger.warning(
-                f"Could not find message {discord_message_id} for {server_name} ticket #{ticket_id} to edit"
+                f"Message {discord_message_id} for {server_name} ticket #{ticket_id} is gone, reposting"
             )
+            try:
+                reposted = await discord_outbox.send(thread, embed=embed)
+                await ticket_tracker.replace_message(
+                    server_name, ticket_id, reposted.id, thread.id, state
+                )
+                return True
+            except Exception as e:
+                logger.error(f"Error reposting {server_name} ticket #{ticket_id}: {e}")
         except discord.Forbidden:
             logger.warning(
                 f"Missing permissions to edit message {discord_message_id} for {server_name} ticket #{ticket_id}"
@@ -498,69 +586,15 @@ class TicketWatcherCog(commands.Cog):
             logger.error(
                 f"Error editing message {discord_message_id} for {server_name} ticket #{ticket_id}: {e}"
             )
+        return False
 
-    async def _get_answer_details(self, pz_db, answered_id):
-        """Get full details about the ticket answer."""
-        if not answered_id:
-            return None
-
-        async with pz_db.execute(
-            "SELECT author, message FROM tickets WHERE id = ?", (answered_id,)
-        ) as cursor:
-            result = await cursor.fetchone()
-            if result:
-                return {"author": result[0], "message": result[1]}
-            return None
-
-    async def _get_original_ticket_details(self, pz_db, original_ticket_id):
-        """Get details of the original ticket."""
-        if not original_ticket_id:
-            return None
-
-        async with pz_db.execute(
-            "SELECT author, message FROM tickets WHERE id = ?", (original_ticket_id,)
-        ) as cursor:
-            result = await cursor.fetchone()
-            if result:
-                return {"author": result[0], "message": result[1]}
-            return None
-
-    async def _find_answer_for_ticket(self, pz_db, original_ticket_id):
-        """Find the single ticket that answers the original ticket."""
-        if not original_ticket_id:
-            return None
-
-        async with pz_db.execute(
-            "SELECT author, message FROM tickets WHERE answeredID = ?",
-            (original_ticket_id,),
-        ) as cursor:
-            result = await cursor.fetchone()
-            if result:
-                return {"author": result[0], "message": result[1]}
-            return None
-
-    async def _build_ticket_description(
-        self, pz_db, ticket_id, message, author, answered_id
+    def _format_ticket_description(
+        self, author, message, answer_author=None, answer_message=None
     ):
-        """Build the embed description with ticket and answer information."""
-        if answered_id:
-            # This ticket IS an answer, get the original question
-            original_ticket = await self._get_original_ticket_details(
-                pz_db, answered_id
-            )
-            if original_ticket:
-                description = f"📝 **Ticket from {original_ticket['author']}:**\n{original_ticket['message']}\n\n💬 **Answer from {author}:**\n{message}"
-            else:
-                # Original ticket not found, display as regular ticket
-                description = f"📝 **Ticket from {author}:**\n{message}"
-        else:
-            # This is an original ticket, check if it has an answer
-            answer = await self._find_answer_for_ticket(pz_db, ticket_id)
-            if answer:
-                description = f"📝 **Ticket from {author}:**\n{message}\n\n💬 **Answer from {answer['author']}:**\n{answer['message']}"
-            else:
-                description = f"📝 **Ticket from {author}:**\n{message}"
-
+        """Format a ticket, and its answer if there is one, for an embed."""
+        description = f"📝 **Ticket from {author}:**\n{message}"
+        if answer_author is not None:
+            description += f"\n\n💬 **Answer from {answer_author}:**\n{answer_message}"
         return description
 
     def _get_state_color(self, state):
@@ -579,34 +613,6 @@ class TicketWatcherCog(commands.Cog):
         }
         return texts.get(state, "❓ Unknown")
 
-    async def safe_message_edit(self, message, **kwargs):
-        """Edit message with conservative retry based on Discord rate limit headers"""
-        max_retries = 3
-
-        for attempt in range(max_retries):
-            try:
-                await message.edit(**kwargs)
-                return True
-
-            except discord.HTTPException as e:
-                if e.status == 429 and attempt < max_retries - 1:
-                    # Conservative approach: add extra buffer to Discord's wait time
-                    retry_after = (
-                        float(e.response.headers.get("Retry-After", 5000)) / 1000.0
-                    )
-                    wait_time = retry_after + 1.0  # Extra 1 second buffer
-
-                    logger.warning(
-                        f"[RateLimit] Conservative wait {wait_time:.2f}s (attempt {attempt + 1}/{max_retries})"
-                    )
-                    await asyncio.sleep(wait_time)
-                    continue
-                else:
-                    # Re-raise non-rate-limit errors or final attempt
-                    raise
-
-        return False
-
     @ticket_monitor.before_loop
     async def before_ticket_monitor(self):
         """Wait until the bot's internal cache is ready before starting the loop."""
@@ -3,9 +3,11 @@ from discord import app_commands
 from .admin import admin_group
 from .ban import ban_group
 from .cat_fact import cat_fact
+from .chat import chat_group
 from .get_playerlist import get_playerlist
 from .heal_player import heal_player
 from .logs import logs_group
+from .player import player_group
 from .reset_password import reset_password
 from .restart_server import restart_server
 from .restart_server_auto import cancel_restart, restart_server_auto
@@ -14,6 +16,7 @@ from .send_message import send_message
 from .server_settings import server_settings
 from .speak import speak
 from .teleport import teleport
+from .tickets import tickets_group
 from .update_mods_lists import update_mods_lists
 from .update_sandbox_settings import update_sandbox_settings
 
@@ -35,14 +38,17 @@ __all__ = [
     "admin_group",
     "ban_group",
     "cat_fact",
+    "chat_group",
     "get_playerlist",
     "heal_player",
     "logs_group",
+    "player_group",
     "reset_password",
     "restart_group",
     "send_message",
     "speak",
     "teleport",
+    "tickets_group",
     "update_group",
     "server_settings",
     "restore_levels",
@@ -3,6 +3,7 @@ import re
 import discord
 from discord import app_commands
 
+from src.bot_commands.autocomplete import player_name_autocomplete
 from src.config import Config
 from src.services.game_db import get_admins, get_player
 from src.services.pz_server import pz_set_access_level
@@ -33,6 +34,7 @@ admin_group = app_commands.Group(
     accesslevel="The choice to give or take admin",
     player="The name of the player in game.",
 )
+@app_commands.autocomplete(player=player_name_autocomplete)
 @app_commands.checks.has_role(PZ_ADMIN_ROLE_ID)
 async def toggle(
     interaction: discord.Interaction,
@@ -0,0 +1,26 @@
+import discord
+from discord import app_commands
+
+from src.config import Config
+from src.services.game_db import suggest_player_names
+
+SERVER_NAMES = Config.SERVER_NAMES
+
+
+async def player_name_autocomplete(
+    interaction: discord.Interaction, current: str
+) -> list[app_commands.Choice[str]]:
+    """
+    Suggest usernames from the server picked in the same command.
+
+    The server options are numbered from 1 in SERVER_NAMES order, so the
+    chosen value maps back to its system user. Nothing is suggested until a
+    server has been picked.
+    """
+    server = getattr(interaction.namespace, "server", None)
+    if not isinstance(server, int) or not 1 <= server <= len(SERVER_NAMES):
+        return []
+
+    system_user = list(SERVER_NAMES)[server - 1]
+    names = await suggest_player_names(system_user, current.strip())
+    return [app_commands.Choice(name=name, value=name) for name in names]
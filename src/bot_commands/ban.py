@@ -6,6 +6,7 @@ import discord
 from discord import app_commands
 from tabulate import tabulate
 
+from src.bot_commands.autocomplete import player_name_autocomplete
 from src.config import Config
 from src.services.game_db import (
     get_all_banned_players,
@@ -13,7 +14,7 @@ from src.services.game_db import (
     get_player_by_steamid,
 )
 from src.services.pz_server import pz_ban_player, pz_unban_player
-from src.services.server import get_game_version, server_isrunning
+from src.services.server import server_isrunning
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +40,7 @@ def is_valid_steam_id(steam_id: str) -> bool:
     server="Which server?",
     player="Enter player's name or SteamID.",
 )
+@app_commands.autocomplete(player=player_name_autocomplete)
 @app_commands.checks.has_role(PZ_ADMIN_ROLE_ID)
 async def issue(
     interaction: discord.Interaction,
@@ -54,7 +56,6 @@ async def issue(
 
     await interaction.response.defer()
     system_user = SYSTEM_USERS[server.name]
-    game_version = get_game_version(system_user)
     steam_id = ""
 
     # Determine if input is a SteamID
@@ -64,7 +65,7 @@ async def issue(
             await interaction.followup.send("SteamID must be exactly 17 digits.")
             return
         row = await get_player_by_steamid(system_user, steam_id)
-        player_name = row[2] if row else None
+        player_name = row.username if row and not isinstance(row, str) else None
     else:
         # Lookup player by name
         player_row = await get_player(system_user, player_input)
@@ -80,12 +81,7 @@ async def issue(
             )
             return
 
-        # print(player_row)
-        if game_version == "B41":
-            steam_id = player_row[11]
-        elif game_version == "B42":
-            steam_id = player_row[8]
-
+        steam_id = player_row.steamid
         player_name = player_input
 
     # Check if the game server is running
@@ -118,6 +114,7 @@ async def issue(
     server="Which server?",
     player="Enter player's name or SteamID.",
 )
+@app_commands.autocomplete(player=player_name_autocomplete)
 @app_commands.checks.has_role(PZ_ADMIN_ROLE_ID)
 async def revoke(
     interaction: discord.Interaction,
@@ -133,7 +130,6 @@ async def revoke(
 
     await interaction.response.defer()
     system_user = SYSTEM_USERS[server.name]
-    game_version = get_game_version(system_user)
     steam_id = ""
 
     # Determine if input is a SteamID
@@ -143,7 +139,7 @@ async def revoke(
             await interaction.followup.send("SteamID must be exactly 17 digits.")
             return
         row = await get_player_by_steamid(system_user, steam_id)
-        player_name = row[2] if row else None
+        player_name = row.username if row and not isinstance(row, str) else None
     else:
         player_row = await get_player(system_user, player_input)
 
@@ -156,11 +152,7 @@ async def revoke(
             )
             return
 
-        if game_version == "B41":
-            steam_id = player_row[11]
-        elif game_version == "B42":
-            steam_id = player_row[8]
-
+        steam_id = player_row.steamid
         player_name = player_input
 
     success, response = await pz_unban_player(system_user, steam_id)
@@ -201,32 +193,19 @@ async def list(interaction: discord.Interaction, server: app_commands.Choice[int
 
     servers_banned_players = await get_all_banned_players(system_user)
 
+    if isinstance(servers_banned_players, str):
+        await interaction.followup.send(servers_banned_players)
+        return
+
     if not servers_banned_players:
         await interaction.followup.send("No banned players on this server.")
         return
 
-    banned_players = []
-    seen_players = []
-    for b_player in servers_banned_players:
-        steamid = b_player[0]
-
-        if steamid in seen_players:
-            continue
-
-        seen_players.append(steamid)
-
-        user = await get_player_by_steamid(system_user, steamid)
-        if not user:
-            banned_players.append(("None", steamid))
-            continue
-        elif isinstance(user, str):
-            continue
-
-        banned_players.append((user[2], steamid))
-
     category = next(k for k, v in SYSTEM_USERS.items() if v == system_user)
 
-    banned_list = [[p[0], p[1]] for p in banned_players]
+    banned_list = [
+        [name or "None", steamid] for name, steamid in servers_banned_players
+    ]
     msg = format_message(banned_list, category)
 
     note = "If the players name is None then they were banned before ever joining.\n\n"
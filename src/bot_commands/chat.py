@@ -0,0 +1,92 @@
+import logging
+from datetime import datetime, timedelta
+
+import discord
+from discord import app_commands
+
+from src.config import Config
+from src.services.bot_db import search_chat_messages
+from src.utils.pagination import CodeBlockPager
+
+logger = logging.getLogger(__name__)
+
+SERVER_NAMES = Config.SERVER_NAMES
+PZ_ADMIN_ROLE_ID = Config.PZ_ADMIN_ROLE_ID
+
+PAGE_SIZE = 15
+
+chat_group = app_commands.Group(
+    name="chat", description="Search archived in-game chat."
+)
+
+
+def parse_date(value: str) -> datetime:
+    return datetime.strptime(value.strip(), "%Y-%m-%d")
+
+
+def format_chat_line(row: tuple) -> str:
+    logged_at, channel, author, text = row
+    return f"[{logged_at[:16]}] ({channel}) {author}: {text}"
+
+
+@chat_group.command()
+@app_commands.choices(
+    server=[
+        app_commands.Choice(name=srv, value=index + 1)
+        for index, srv in enumerate(SERVER_NAMES.values())
+    ]
+)
+@app_commands.describe(
+    server="Which server?",
+    phrase="Words or phrase the message contains.",
+    author="Exact player name.",
+    since="Start date, YYYY-MM-DD.",
+    until="End date (inclusive), YYYY-MM-DD.",
+)
+@app_commands.checks.has_role(PZ_ADMIN_ROLE_ID)
+async def search(
+    interaction: discord.Interaction,
+    server: app_commands.Choice[int],
+    phrase: str | None = None,
+    author: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+):
+    """Search archived in-game chat."""
+    try:
+        since_date = parse_date(since) if since else None
+        until_date = parse_date(until) + timedelta(days=1) if until else None
+    except ValueError:
+        await interaction.response.send_message(
+            "Dates must look like YYYY-MM-DD.", ephemeral=True
+        )
+        return
+
+    await interaction.response.defer(ephemeral=True)
+
+    filters = {
+        "phrase": phrase,
+        "author": author,
+        "since": since_date,
+        "until": until_date,
+    }
+    view = CodeBlockPager(
+        interaction.user.id,
+        lambda limit, offset: search_chat_messages(
+            server.name, limit=limit, offset=offset, **filters
+        ),
+        format_chat_line,
+        title=f"**{server.name}** chat results",
+        empty_message=f"No chat found on **{server.name}** for that search.",
+        page_size=PAGE_SIZE,
+    )
+
+    try:
+        content, has_next = await view.fetch_page()
+    except Exception as e:
+        logger.error(f"Chat search failed: {e}")
+        await interaction.followup.send("Chat search failed, check logs.")
+        return
+
+    view.update_buttons(has_next)
+    await interaction.followup.send(content, view=view)
@@ -1,6 +1,7 @@
 import discord
 from discord import app_commands
 
+from src.bot_commands.autocomplete import player_name_autocomplete
 from src.config import Config
 from src.services.pz_server import pz_heal_player
 
@@ -17,6 +18,7 @@ SERVER_NAMES = Config.SERVER_NAMES
     ]
 )
 @app_commands.describe(server="Which server?", player="Who will you save?")
+@app_commands.autocomplete(player=player_name_autocomplete)
 @app_commands.checks.has_role(PZ_ADMIN_ROLE_ID)
 async def heal_player(
     interaction: discord.Interaction, server: app_commands.Choice[int], player: str
@@ -7,6 +7,7 @@ from datetime import datetime
 import discord
 from discord import app_commands
 
+from src.bot_commands.autocomplete import player_name_autocomplete
 from src.config import Config
 from src.services.game_db import get_player
 
@@ -33,6 +34,7 @@ logs_group = app_commands.Group(
     ],
 )
 @app_commands.describe(server="Which server?", playername="Which player?")
+@app_commands.autocomplete(playername=player_name_autocomplete)
 @app_commands.checks.has_role(PZ_ADMIN_ROLE_ID)
 async def get_player_logs(
     interaction: discord.Interaction, server: app_commands.Choice[int], playername: str
@@ -0,0 +1,126 @@
+import asyncio
+import logging
+import re
+
+import discord
+from discord import app_commands
+
+from src.config import Config
+from src.features.server_status import server_status
+from src.services.game_db import find_players, get_banned_player
+
+logger = logging.getLogger(__name__)
+
+PZ_ADMIN_ROLE_ID = Config.PZ_ADMIN_ROLE_ID
+
+# Discord allows 25 fields per embed
+MAX_FIELDS = 25
+# Online is None until the playerlist has queried the server once
+ONLINE_LABELS = {True: "🟢 Yes", False: "No", None: "unknown"}
+
+player_group = app_commands.Group(
+    name="player", description="Look up players across every server."
+)
+
+
+async def lookup_server(server_name: str, system_user: str, player: str) -> list | str:
+    """
+    Find a player on one server.
+
+    Returns:
+        list | str: (record, banned, online) tuples, or an error message.
+            online is None when the player list has never been queried.
+    """
+    records = await find_players(system_user, player)
+    if isinstance(records, str):
+        return records
+
+    status = server_status.get(server_name)
+    online_names = {name.casefold() for name in status.players}
+
+    results = []
+    for record in records:
+        banned = (
+            await get_banned_player(system_user, record.steamid)
+            if record.steamid
+            else None
+        )
+        if isinstance(banned, str):
+            return banned
+        online = (
+            record.username.casefold() in online_names
+            if status.players_updated
+            else None
+        )
+        results.append((record, banned is not None, online))
+    return results
+
+
+@player_group.command()
+@app_commands.describe(player="Enter player's name or SteamID.")
+@app_commands.checks.has_role(PZ_ADMIN_ROLE_ID)
+async def find(interaction: discord.Interaction, player: str):
+    """Find which servers a player is on, with their access level and bans."""
+    player_input = player.strip()
+
+    if re.search(r"[\"']", player_input):
+        await interaction.response.send_message("Quotes are not allowed.")
+        return
+
+    await interaction.response.defer()
+
+    # Every server at once, so this takes as long as the slowest one
+    servers = list(Config.SYSTEM_USERS.items())
+    lookups = await asyncio.gather(
+        *[
+            lookup_server(server_name, system_user, player_input)
+            for server_name, system_user in servers
+        ],
+        return_exceptions=True,
+    )
+
+    embed = discord.Embed(
+        title=f"🔎 Player lookup: {player_input}", color=discord.Color.blue()
+    )
+    not_found = []
+    errors = []
+
+    for (server_name, _), result in zip(servers, lookups):
+        if isinstance(result, BaseException):
+            logger.error(f"Error looking up {player_input} on {server_name}: {result}")
+            errors.append(server_name)
+            continue
+        if isinstance(result, str):
+            errors.append(server_name)
+            continue
+        if not result:
+            not_found.append(server_name)
+            continue
+
+        for record, banned, online in result:
+            if len(embed.fields) >= MAX_FIELDS:
+                break
+            embed.add_field(
+                name=f"{server_name} - {record.username}",
+                value=(
+                    f"SteamID: {record.steamid or 'unknown'}\n"
+                    f"Access level: {record.access_level or 'none'}\n"
+                    f"Banned: {'🔨 Yes' if banned else 'No'}\n"
+                    f"Online: {ONLINE_LABELS[online]}"
+                ),
+                inline=True,
+            )
+
+    if not embed.fields:
+        embed.description = "Not found on any server."
+        embed.color = discord.Color.orange()
+
+    footer = []
+    if not_found and embed.fields:
+        footer.append(f"Not on: {', '.join(not_found)}")
+    if errors:
+        footer.append(f"Could not check: {', '.join(errors)}")
+    if footer:
+        embed.set_footer(text=" | ".join(footer))
+
+    await interaction.followup.send(embed=embed)
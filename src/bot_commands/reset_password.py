@@ -1,6 +1,7 @@
 import discord
 from discord import app_commands
 
+from src.bot_commands.autocomplete import player_name_autocomplete
 from src.config import Config
 from src.services.game_db import get_player
 from src.services.pz_server import pz_reset_password_b41, pz_setpassword_b42
@@ -20,6 +21,7 @@ PZ_ADMIN_ROLE_ID = Config.PZ_ADMIN_ROLE_ID
     ],
 )
 @app_commands.describe(server="Which server?", playername="Which player?")
+@app_commands.autocomplete(playername=player_name_autocomplete)
 @app_commands.checks.has_role(PZ_ADMIN_ROLE_ID)
 async def reset_password(
     interaction: discord.Interaction, server: app_commands.Choice[int], playername: str
@@ -4,6 +4,7 @@ import discord
 from discord import app_commands
 
 from src.config import Config
+from src.services.discord_outbox import Priority, discord_outbox
 from src.services.server import restart_zomboid_server, server_isrunning
 
 logger = logging.getLogger(__name__)
@@ -97,7 +98,9 @@ async def restart_server(
             return
 
         # Let the people know whats up!
-        await announce_chan.send(initiated_by)
+        await discord_outbox.send(
+            announce_chan, content=initiated_by, priority=Priority.ALERT
+        )
 
         await restart_zomboid_server(system_user)
 
@@ -107,7 +110,9 @@ async def restart_server(
         )
 
         # Announce restart
-        await announce_chan.send(status_msg)
+        await discord_outbox.send(
+            announce_chan, content=status_msg, priority=Priority.ALERT
+        )
 
     else:
         logger.info("Restart cancelled for %s...", server.name)
@@ -1,6 +1,7 @@
 import discord
 from discord import app_commands
 
+from src.bot_commands.autocomplete import player_name_autocomplete
 from src.config import Config
 from src.services.pz_server import pz_teleport_player
 
@@ -22,6 +23,10 @@ PZ_ADMIN_ROLE_ID = Config.PZ_ADMIN_ROLE_ID
     player1="Who to teleport?",
     player2="Teleport to who?"
 )
+@app_commands.autocomplete(
+    player1=player_name_autocomplete,
+    player2=player_name_autocomplete,
+)
 @app_commands.checks.has_role(PZ_ADMIN_ROLE_ID)
 async def teleport(
     interaction: discord.Interaction,
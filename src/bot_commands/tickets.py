@@ -0,0 +1,94 @@
+import logging
+from datetime import datetime, timedelta, timezone
+
+import discord
+from discord import app_commands
+
+from src.config import Config
+from src.services.bot_db import search_ticket_history
+from src.utils.pagination import CodeBlockPager
+
+logger = logging.getLogger(__name__)
+
+SERVER_NAMES = Config.SERVER_NAMES
+PZ_ADMIN_ROLE_ID = Config.PZ_ADMIN_ROLE_ID
+
+PAGE_SIZE = 10
+# Tickets and answers are cut to this many characters in results
+MAX_TEXT_LENGTH = 150
+
+tickets_group = app_commands.Group(
+    name="tickets", description="Search the history of support tickets."
+)
+
+
+def shorten(text: str) -> str:
+    text = " ".join(text.split())
+    if len(text) > MAX_TEXT_LENGTH:
+        return text[:MAX_TEXT_LENGTH] + "…"
+    return text
+
+
+def format_ticket_entry(row: tuple) -> str:
+    server_name, ticket_id, author, message, answered_by, answer, first_seen, _ = row
+    entry = f"[{first_seen[:16]}] {server_name} #{ticket_id} {author}: {shorten(message)}"
+    if answered_by:
+        return entry + f"\n    ↳ {answered_by}: {shorten(answer or '')}"
+    return entry + "\n    ↳ (unanswered)"
+
+
+@tickets_group.command()
+@app_commands.choices(
+    server=[
+        app_commands.Choice(name=srv, value=index + 1)
+        for index, srv in enumerate(SERVER_NAMES.values())
+    ]
+)
+@app_commands.describe(
+    server="Which server? Leave empty for all of them.",
+    text="Words or phrase in the ticket or its answer.",
+    author="Exact name of the player who sent the ticket.",
+    unanswered_days="Only tickets still unanswered after this many days.",
+)
+@app_commands.checks.has_role(PZ_ADMIN_ROLE_ID)
+async def search(
+    interaction: discord.Interaction,
+    server: app_commands.Choice[int] | None = None,
+    text: str | None = None,
+    author: str | None = None,
+    unanswered_days: app_commands.Range[int, 0, 3650] | None = None,
+):
+    """Search support tickets from every server, including past worlds."""
+    await interaction.response.defer(ephemeral=True)
+
+    filters = {
+        "server_name": server.name if server else None,
+        "text": text,
+        "author": author,
+        # History timestamps are UTC
+        "unanswered_before": (
+            datetime.now(timezone.utc) - timedelta(days=unanswered_days)
+            if unanswered_days is not None
+            else None
+        ),
+    }
+    view = CodeBlockPager(
+        interaction.user.id,
+        lambda limit, offset: search_ticket_history(
+            limit=limit, offset=offset, **filters
+        ),
+        format_ticket_entry,
+        title=f"**{filters['server_name'] or 'All servers'}** ticket results",
+        empty_message="No tickets found for that search.",
+        page_size=PAGE_SIZE,
+    )
+
+    try:
+        content, has_next = await view.fetch_page()
+    except Exception as e:
+        logger.error(f"Ticket search failed: {e}")
+        await interaction.followup.send("Ticket search failed, check logs.")
+        return
+
+    view.update_buttons(has_next)
+    await interaction.followup.send(content, view=view)
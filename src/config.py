@@ -2,7 +2,7 @@ import json
 import logging
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, TypedDict
+from typing import Dict, List, NotRequired, Optional, TypedDict
 
 logger = logging.getLogger(__name__)
 logger.info("Loading Config...")
@@ -26,6 +26,10 @@ class RconConfig(TypedDict):
 class LoggingConfig(TypedDict):
     chat: bool
     channel_id: Optional[int]
+    # Relay messages posted in channel_id back into the game
+    bridge: NotRequired[bool]
+    # Answer !commands typed in game chat
+    commands: NotRequired[bool]
 
 
 class ServerConfig(TypedDict):
@@ -90,6 +94,31 @@ class Config:
     KOFI_STARTING_AMOUNT = float(os.getenv("KOFI_STARTING_AMOUNT", 5))
     KOFI_DONATION_GOAL = float(os.getenv("KOFI_DONATION_GOAL", 80))
 
+    # Discord to game chat bridge pacing
+    CHAT_BRIDGE_COMMANDS_PER_SECOND = float(
+        os.getenv("CHAT_BRIDGE_COMMANDS_PER_SECOND", 1)
+    )
+    CHAT_BRIDGE_BATCH_SECONDS = float(os.getenv("CHAT_BRIDGE_BATCH_SECONDS", 1.5))
+
+    # In-game chat commands
+    CHAT_COMMAND_PREFIX = os.getenv("CHAT_COMMAND_PREFIX", "!")
+    CHAT_COMMAND_COOLDOWN_SECONDS = float(os.getenv("CHAT_COMMAND_COOLDOWN_SECONDS", 10))
+
+    # Bot reads of each pzserver.db go to a snapshot refreshed this often
+    GAME_DB_SNAPSHOTS = os.getenv("GAME_DB_SNAPSHOTS", "true").lower() == "true"
+    GAME_DB_SNAPSHOT_SECONDS = float(os.getenv("GAME_DB_SNAPSHOT_SECONDS", 10))
+    # How often each game database is checked for changes
+    GAME_DB_CHANGE_POLL_SECONDS = float(os.getenv("GAME_DB_CHANGE_POLL_SECONDS", 2))
+
+    # Bot database maintenance
+    BOT_DB_MAINTENANCE_HOURS = float(os.getenv("BOT_DB_MAINTENANCE_HOURS", 24))
+    # Tracked tickets from servers removed from servers.json
+    BOT_DB_TICKET_RETENTION_DAYS = int(os.getenv("BOT_DB_TICKET_RETENTION_DAYS", 90))
+    # Processed Ko-fi webhook events
+    BOT_DB_KOFI_EVENT_RETENTION_DAYS = int(
+        os.getenv("BOT_DB_KOFI_EVENT_RETENTION_DAYS", 90)
+    )
+
     SERVER_DATA: List[ServerConfig] = load_server_data(str(CONFIG_DIR / "servers.json"))
 
     # Map server name to system user.
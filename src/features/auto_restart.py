@@ -3,6 +3,7 @@ import asyncio
 import discord
 
 from src.config import Config
+from src.services.discord_outbox import Priority, discord_outbox
 from src.services.pz_server import pz_send_message
 from src.services.server import restart_zomboid_server, server_isrunning
 
@@ -19,12 +20,19 @@ class AutoRestart:
     def __init__(self):
         self._countdown_running = {server: False for server in SYSTEM_USERS.values()}
         self._abort_signals = {server: False for server in SYSTEM_USERS.values()}
+        self._seconds_left: dict[str, int] = {}
 
     def is_running(self, server_name: str) -> bool:
         """Check if a countdown is running for a server."""
         system_user = SYSTEM_USERS[server_name]
         return self._countdown_running[system_user]
 
+    def seconds_until_restart(self, system_user: str) -> int | None:
+        """Seconds left on a running countdown, or None if there isn't one."""
+        if not self._countdown_running.get(system_user):
+            return None
+        return self._seconds_left.get(system_user)
+
     def abort(self, server_name: str) -> None:
         """Set abort signal for a specific server."""
         system_user = SYSTEM_USERS[server_name]
@@ -54,6 +62,7 @@ class AutoRestart:
         self._countdown_running[system_user] = True
         seconds_left = duration
         while seconds_left > 0:
+            self._seconds_left[system_user] = seconds_left
             if self._abort_signals[system_user]:
                 self._countdown_running[system_user] = False
 
@@ -72,6 +81,7 @@ class AutoRestart:
 
             await asyncio.sleep(5)
             seconds_left -= 5
+        self._seconds_left[system_user] = 0
         self._countdown_running[system_user] = True
         return True, ""
 
@@ -94,28 +104,34 @@ class AutoRestart:
 
         is_running = await server_isrunning(system_user)
         if not is_running:
-            await channel.send(
-                f"Auto restart failed, **{server_name}** is **NOT** running!"
+            await discord_outbox.send(
+                channel,
+                content=f"Auto restart failed, **{server_name}** is **NOT** running!",
+                priority=Priority.ALERT,
             )
             return False
 
-        await channel.send(init_msg)
+        await discord_outbox.send(channel, content=init_msg, priority=Priority.ALERT)
 
         countdown_status = await self.run_countdown(system_user, 300)
         if not countdown_status[0]:
-            await channel.send(countdown_status[1])
+            await discord_outbox.send(
+                channel, content=countdown_status[1], priority=Priority.ALERT
+            )
             return False
 
         if not await self.restart_server(system_user):
-            await channel.send(
-                f"There was a problem restarting the **{server_name}** server."
+            await discord_outbox.send(
+                channel,
+                content=f"There was a problem restarting the **{server_name}** server.",
+                priority=Priority.ALERT,
             )
             return False
 
         self._countdown_running[system_user] = False
 
         msg = f"Success! The **{server_name}** was restarted and is now loading back up."
-        await channel.send(msg)
+        await discord_outbox.send(channel, content=msg, priority=Priority.ALERT)
         return True
 
 
@@ -0,0 +1,69 @@
+# Domain features and business logic
+import asyncio
+import logging
+from datetime import datetime
+
+from src.services.bot_db import add_chat_messages
+
+logger = logging.getLogger(__name__)
+
+
+class ChatArchiveWriter:
+    """
+    Buffers parsed chat messages and writes them to bot_db in batches.
+
+    A flush happens every `flush_seconds` or as soon as `max_batch` messages
+    are waiting, whichever comes first, so a busy server costs one insert
+    transaction per batch instead of one per chat line.
+    """
+
+    def __init__(self, flush_seconds: float = 5.0, max_batch: int = 200):
+        self.flush_seconds = flush_seconds
+        self.max_batch = max_batch
+        self._buffer: list[tuple[str, str, str, str, str]] = []
+        self._full = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start the background flusher."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flusher and write anything still buffered."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def add(
+        self, server_name: str, logged_at: datetime, channel: str, author: str, text: str
+    ) -> None:
+        """Queue a chat message for archiving."""
+        self._buffer.append(
+            (server_name, logged_at.strftime("%Y-%m-%d %H:%M:%S"), channel, author, text)
+        )
+        if len(self._buffer) >= self.max_batch:
+            self._full.set()
+
+    async def flush(self) -> None:
+        """Write the current buffer to the database."""
+        if not self._buffer:
+            return
+
+        batch, self._buffer = self._buffer, []
+        if not await add_chat_messages(batch):
+            logger.warning(f"Dropped {len(batch)} chat messages that failed to archive")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._full.wait(), timeout=self.flush_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._full.clear()
+            await self.flush()
@@ -0,0 +1,188 @@
+# Domain features and business logic
+import asyncio
+import logging
+import time
+from collections import deque
+
+from src.services.pz_server import clean_server_message, pz_send_message
+from src.utils.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# Long servermsg lines get cut off in the in-game chat box
+MAX_SERVERMSG_LENGTH = 240
+BATCH_SEPARATOR = " | "
+# How long a sent message is remembered for echo detection
+ECHO_WINDOW_SECONDS = 60.0
+
+
+class GameMessageQueue:
+    """
+    Outbound servermsg queue for a single game server.
+
+    Messages that arrive close together are merged into one servermsg and every
+    send has to take a token from a bucket, so no matter how busy the Discord
+    side gets the game server never sees more than the configured number of
+    RCON commands per second. Immediate messages (replies to in-game
+    commands) wait in their own queue, go out ahead of any batch without the
+    batching delay and are never merged with other messages.
+
+    Args:
+        system_user: The linux user running the game server.
+        commands_per_second: RCON command budget for this queue.
+        batch_seconds: How long to wait for more messages before sending.
+        max_pending: Messages beyond this are dropped instead of queued.
+    """
+
+    def __init__(
+        self,
+        system_user: str,
+        commands_per_second: float,
+        batch_seconds: float,
+        max_pending: int = 50,
+    ):
+        self.system_user = system_user
+        self.batch_seconds = batch_seconds
+        self.max_pending = max_pending
+        self._bucket = TokenBucket(commands_per_second)
+        self._pending: deque[tuple[str, asyncio.Future]] = deque()
+        self._immediate: deque[tuple[str, asyncio.Future]] = deque()
+        self._wakeup = asyncio.Event()
+        self._recent: deque[tuple[float, str]] = deque()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start the background sender."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background sender and fail anything still queued."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        for queue in (self._immediate, self._pending):
+            while queue:
+                _, future = queue.popleft()
+                if not future.done():
+                    future.set_result(False)
+
+    def put(self, message: str, immediate: bool = False) -> asyncio.Future:
+        """
+        Queue a message for the game server.
+
+        Args:
+            message: Text to broadcast with servermsg.
+            immediate: Send ahead of batched messages, on its own and without
+                the batching delay (still respects the rate budget).
+        Returns:
+            asyncio.Future: Resolves to True once the message was delivered.
+        """
+        future = asyncio.get_running_loop().create_future()
+        text = clean_server_message(message).strip()[:MAX_SERVERMSG_LENGTH]
+
+        if not text:
+            future.set_result(False)
+            return future
+
+        if len(self._pending) + len(self._immediate) >= self.max_pending:
+            logger.warning(
+                f"Game message queue for {self.system_user} is full, dropping: {text}"
+            )
+            future.set_result(False)
+            return future
+
+        (self._immediate if immediate else self._pending).append((text, future))
+        self._wakeup.set()
+        return future
+
+    def is_echo(self, text: str) -> bool:
+        """Check if an in-game chat line is one of our own recent broadcasts."""
+        self._expire_recent()
+        text = text.strip()
+        return any(sent == text for _, sent in self._recent)
+
+    def _remember(self, text: str) -> None:
+        self._recent.append((time.monotonic(), text))
+        self._expire_recent()
+
+    def _expire_recent(self) -> None:
+        cutoff = time.monotonic() - ECHO_WINDOW_SECONDS
+        while self._recent and self._recent[0][0] < cutoff:
+            self._recent.popleft()
+
+    def _take_batch(self) -> list[tuple[str, asyncio.Future]]:
+        """Pop as many queued messages as fit into one servermsg."""
+        batch: list[tuple[str, asyncio.Future]] = []
+        length = 0
+        while self._pending:
+            text = self._pending[0][0]
+            added = len(text) + (len(BATCH_SEPARATOR) if batch else 0)
+            if batch and length + added > MAX_SERVERMSG_LENGTH:
+                break
+            batch.append(self._pending.popleft())
+            length += added
+        return batch
+
+    async def _run(self) -> None:
+        # When the oldest batched message is due to go out
+        batch_due: float | None = None
+
+        while True:
+            if not self._immediate:
+                if not self._pending:
+                    batch_due = None
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+
+                # Give close-together messages a chance to land in the same
+                # servermsg, but wake up early for an immediate message
+                if batch_due is None:
+                    batch_due = time.monotonic() + self.batch_seconds
+                remaining = batch_due - time.monotonic()
+                if remaining > 0:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=remaining)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+            await self._bucket.acquire()
+
+            # An immediate message that arrived while waiting for budget goes first
+            if self._immediate:
+                batch = [self._immediate.popleft()]
+            else:
+                batch = self._take_batch()
+                batch_due = None
+
+            await self._deliver(batch)
+
+    async def _deliver(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        combined = BATCH_SEPARATOR.join(text for text, _ in batch)
+        for text, _ in batch:
+            self._remember(text)
+        if len(batch) > 1:
+            self._remember(combined)
+
+        try:
+            success = await pz_send_message(self.system_user, combined)
+        except Exception as e:
+            logger.error(f"Error sending queued message to {self.system_user}: {e}")
+            success = False
+
+        if not success:
+            logger.warning(
+                f"Failed to deliver {len(batch)} queued message(s) to {self.system_user}"
+            )
+
+        for _, future in batch:
+            if not future.done():
+                future.set_result(success)
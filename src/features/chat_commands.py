@@ -0,0 +1,143 @@
+# Domain features and business logic
+import logging
+import time
+from collections import deque
+from typing import Callable
+
+from src.config import Config
+from src.features.auto_restart import auto_restart
+from src.features.chat_bridge import GameMessageQueue
+from src.features.server_status import server_status
+
+logger = logging.getLogger(__name__)
+
+# Replies slower than this get logged as warnings
+LATENCY_TARGET_SECONDS = 1.0
+
+
+def _players_reply(server_name: str, system_user: str) -> str:
+    status = server_status.get(server_name)
+    if not status.players_updated:
+        return "Player count isn't available yet, try again in a minute."
+    if not status.players:
+        return "There are no players online."
+    return f"{len(status.players)} player(s) online: {', '.join(status.players)}"
+
+
+def _restart_reply(server_name: str, system_user: str) -> str:
+    seconds_left = auto_restart.seconds_until_restart(system_user)
+    if seconds_left is None:
+        return "No restart is scheduled right now."
+    minutes, seconds = divmod(seconds_left, 60)
+    return f"The server will restart in {minutes}m {seconds}s."
+
+
+def _mods_reply(server_name: str, system_user: str) -> str:
+    status = server_status.get(server_name)
+    if not status.mods_updated:
+        return "The mod list isn't available yet."
+
+    reply = f"This server runs {len(status.mods)} mod(s)."
+    server_config = Config.get_rcon_config(server_name)
+    gists = server_config.get("gists") if server_config else None
+    if gists and gists.get("modlist"):
+        reply += f" Full list: https://gist.github.com/{gists['modlist']}"
+    return reply
+
+
+class ChatCommandDispatcher:
+    """
+    Answers `!command` style messages typed in game chat.
+
+    Handlers only read in-memory caches, and replies skip the chat bridge's
+    batching delay, so the time from the chat line being logged to the
+    servermsg landing is just the RCON round trip.
+
+    Args:
+        prefix: Character(s) that mark a chat message as a command.
+        cooldown_seconds: How long a player must wait between commands.
+    """
+
+    def __init__(self, prefix: str, cooldown_seconds: float):
+        self.prefix = prefix
+        self.cooldown_seconds = cooldown_seconds
+        self.handlers: dict[str, Callable[[str, str], str]] = {
+            "players": _players_reply,
+            "restart": _restart_reply,
+            "mods": _mods_reply,
+            "help": self._help_reply,
+        }
+        self._last_used: dict[tuple[str, str], float] = {}
+        self.latencies: deque[float] = deque(maxlen=100)
+
+    def _help_reply(self, server_name: str, system_user: str) -> str:
+        commands = ", ".join(f"{self.prefix}{name}" for name in self.handlers)
+        return f"Commands: {commands}"
+
+    def parse(self, text: str) -> str | None:
+        """Return the command name if text is a known command."""
+        if not text.startswith(self.prefix):
+            return None
+        name = text[len(self.prefix) :].split(maxsplit=1)
+        if not name:
+            return None
+        command = name[0].lower()
+        return command if command in self.handlers else None
+
+    def _on_cooldown(self, server_name: str, player: str) -> bool:
+        now = time.monotonic()
+        key = (server_name, player)
+        last_used = self._last_used.get(key)
+        if last_used is not None and now - last_used < self.cooldown_seconds:
+            return True
+        self._last_used[key] = now
+        return False
+
+    async def dispatch(
+        self,
+        server_name: str,
+        system_user: str,
+        player: str,
+        text: str,
+        queue: GameMessageQueue,
+        received_at: float,
+    ) -> bool:
+        """
+        Answer a chat message if it's a command.
+
+        Args:
+            received_at: time.monotonic() when the chat line was read, used to
+                measure the full chat-to-reply latency.
+        Returns:
+            bool: True if the message was a command (answered or on cooldown).
+        """
+        command = self.parse(text)
+        if command is None:
+            return False
+
+        if self._on_cooldown(server_name, player):
+            logger.debug(f"{player} on {server_name} is on command cooldown")
+            return True
+
+        try:
+            reply = self.handlers[command](server_name, system_user)
+        except Exception as e:
+            logger.error(f"Chat command {command} failed on {server_name}: {e}")
+            return True
+
+        delivered = await queue.put(reply, immediate=True)
+
+        latency = time.monotonic() - received_at
+        self.latencies.append(latency)
+        if latency > LATENCY_TARGET_SECONDS:
+            logger.warning(
+                f"Chat command {command} for {player} on {server_name} took {latency:.2f}s"
+            )
+        else:
+            logger.debug(
+                f"Chat command {command} for {player} on {server_name} took {latency:.3f}s"
+            )
+
+        if not delivered:
+            logger.warning(f"Reply to {command} was not delivered on {server_name}")
+        return True
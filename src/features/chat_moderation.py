@@ -0,0 +1,129 @@
+# Domain features and business logic
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.utils.aho_corasick import AhoCorasick
+
+logger = logging.getLogger(__name__)
+
+# How often the config file's mtime is checked for changes
+RELOAD_CHECK_SECONDS = 10.0
+
+
+@dataclass
+class ModerationResult:
+    """Outcome of checking one chat message."""
+
+    text: str
+    matches: list[str] = field(default_factory=list)
+    redacted: str = ""
+
+    @property
+    def flagged(self) -> bool:
+        return bool(self.matches)
+
+
+class ChatModerator:
+    """
+    Checks chat messages against banned words and link patterns.
+
+    The lists are compiled into a single Aho-Corasick automaton, so checking a
+    line costs one pass over it no matter how many entries the lists have. The
+    config file is reloaded when its modification time changes.
+
+    Config file format:
+        {
+          "action": "redact" or "flag",
+          "alert_mod_channel": true,
+          "banned_words": ["..."],   # matched as whole words
+          "link_patterns": ["..."]   # matched anywhere, e.g. "discord.gg/"
+        }
+
+    Args:
+        config_path: Path to the moderation JSON file.
+    """
+
+    def __init__(self, config_path: Path):
+        self.config_path = config_path
+        self.action = "flag"
+        self.alert_mod_channel = False
+        self._words = AhoCorasick([])
+        self._links = AhoCorasick([])
+        self._mtime: float | None = None
+        self._last_check = 0.0
+        self.reload_if_changed(force=True)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._words.pattern_count or self._links.pattern_count)
+
+    def reload_if_changed(self, force: bool = False) -> None:
+        """Rebuild the automatons if the config file changed on disk."""
+        now = time.monotonic()
+        if not force and now - self._last_check < RELOAD_CHECK_SECONDS:
+            return
+        self._last_check = now
+
+        try:
+            mtime = os.path.getmtime(self.config_path)
+        except OSError:
+            if self._mtime is not None:
+                logger.warning(f"Moderation config {self.config_path} was removed")
+                self._words = AhoCorasick([])
+                self._links = AhoCorasick([])
+                self._mtime = None
+            return
+
+        if mtime == self._mtime:
+            return
+
+        try:
+            with open(self.config_path, "r") as f:
+                config = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"Error loading moderation config {self.config_path}: {e}")
+            return
+
+        self._mtime = mtime
+        self.action = config.get("action", "flag")
+        self.alert_mod_channel = config.get("alert_mod_channel", False)
+        self._words = AhoCorasick(config.get("banned_words", []))
+        self._links = AhoCorasick(config.get("link_patterns", []))
+        logger.info(
+            f"Loaded moderation lists: {self._words.pattern_count} words, "
+            f"{self._links.pattern_count} link patterns"
+        )
+
+    def check(self, text: str) -> ModerationResult:
+        """Find banned words and links in a chat message."""
+        self.reload_if_changed()
+        result = ModerationResult(text=text, redacted=text)
+        if not self.enabled:
+            return result
+
+        spans = [
+            (start, end)
+            for start, end in self._words.find(text)
+            if _is_whole_word(text, start, end)
+        ]
+        spans.extend(self._links.find(text))
+        if not spans:
+            return result
+
+        redacted = list(text)
+        for start, end in spans:
+            result.matches.append(text[start:end])
+            for i in range(start, end):
+                redacted[i] = "*"
+        result.redacted = "".join(redacted)
+        return result
+
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    before = text[start - 1] if start > 0 else " "
+    after = text[end] if end < len(text) else " "
+    return not before.isalnum() and not after.isalnum()
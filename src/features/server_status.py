@@ -0,0 +1,59 @@
+# Domain features and business logic
+import time
+from dataclasses import dataclass, field
+
+from src.config import Config
+
+
+@dataclass
+class ServerStatus:
+    """Last known state of a game server, as seen by the bot's own loops."""
+
+    server_name: str
+    online: bool = False
+    players: list[str] = field(default_factory=list)
+    mods: list[str] = field(default_factory=list)
+    players_updated: float = 0.0
+    mods_updated: float = 0.0
+
+
+class ServerStatusCache:
+    """
+    In-memory snapshots of each server's status.
+
+    Filled in by the loops that already query the servers (playerlist, mod
+    updates) so anything that only needs to read status never has to do its
+    own A2S or file lookups.
+    """
+
+    def __init__(self):
+        self._status = {
+            srv["server_name"]: ServerStatus(srv["server_name"])
+            for srv in Config.SERVER_DATA
+        }
+        # Bumped on every update so readers can tell when to rebuild derived data
+        self.version = 0
+
+    def get(self, server_name: str) -> ServerStatus:
+        if server_name not in self._status:
+            self._status[server_name] = ServerStatus(server_name)
+        return self._status[server_name]
+
+    def all(self) -> list[ServerStatus]:
+        return list(self._status.values())
+
+    def update_players(self, server_name: str, online: bool, players: list[str]) -> None:
+        status = self.get(server_name)
+        status.online = online
+        status.players = players
+        status.players_updated = time.time()
+        self.version += 1
+
+    def update_mods(self, server_name: str, mods: list[str]) -> None:
+        status = self.get(server_name)
+        status.mods = mods
+        status.mods_updated = time.time()
+        self.version += 1
+
+
+server_status = ServerStatusCache()
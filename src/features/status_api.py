@@ -0,0 +1,113 @@
+# Domain features and business logic
+import hashlib
+import json
+from typing import Callable
+
+from aiohttp import web
+
+from src.features.server_status import server_status
+
+# How long browsers and proxies may reuse a response without asking again
+CACHE_MAX_AGE = 30
+
+
+class JsonSnapshot:
+    """A pre-serialized JSON body with its ETag."""
+
+    def __init__(self):
+        self.body = b"null"
+        self.etag = self._make_etag(self.body)
+
+    @staticmethod
+    def _make_etag(body: bytes) -> str:
+        return f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+
+    def update(self, data) -> None:
+        body = json.dumps(data, sort_keys=True).encode()
+        if body != self.body:
+            self.body = body
+            self.etag = self._make_etag(body)
+
+    def matches(self, if_none_match: str | None) -> bool:
+        """Check an If-None-Match header against the current ETag."""
+        if not if_none_match:
+            return False
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or self.etag in tags
+
+
+class StatusApi:
+    """
+    Read-only JSON endpoints for the website.
+
+    Every response comes from an in-memory snapshot. Server and mod snapshots
+    are rebuilt from the ServerStatusCache only when its version changes, and
+    the donation snapshot is pushed in by the Ko-fi worker, so requests never
+    touch A2S, RCON or SQLite.
+    """
+
+    def __init__(self):
+        self._servers = JsonSnapshot()
+        self._mods = JsonSnapshot()
+        self._donations = JsonSnapshot()
+        self._status_version = -1
+
+    def add_routes(self, app: web.Application) -> None:
+        app.router.add_get("/api/servers", self._serve(self._servers))
+        app.router.add_get("/api/mods", self._serve(self._mods))
+        app.router.add_get("/api/donations", self._serve(self._donations))
+
+    def set_donation_progress(
+        self, current_amount: float, goal_amount: float, period_start
+    ) -> None:
+        """Update the donation snapshot, called whenever the total changes."""
+        # Without a goal there is no percentage, reported as null
+        percentage = (
+            round(current_amount / goal_amount * 100, 1) if goal_amount > 0 else None
+        )
+        self._donations.update(
+            {
+                "current": round(current_amount, 2),
+                "goal": goal_amount,
+                "percentage": percentage,
+                "period_start": period_start.strftime("%Y-%m-%d"),
+            }
+        )
+
+    def _refresh_status(self) -> None:
+        if self._status_version == server_status.version:
+            return
+        self._status_version = server_status.version
+
+        statuses = server_status.all()
+        self._servers.update(
+            [
+                {
+                    "name": status.server_name,
+                    "online": status.online,
+                    "player_count": len(status.players),
+                    "players": status.players,
+                    "updated": int(status.players_updated),
+                }
+                for status in statuses
+            ]
+        )
+        self._mods.update({status.server_name: status.mods for status in statuses})
+
+    def _serve(self, snapshot: JsonSnapshot) -> Callable:
+        async def handler(request: web.Request) -> web.Response:
+            self._refresh_status()
+            headers = {
+                "ETag": snapshot.etag,
+                "Cache-Control": f"public, max-age={CACHE_MAX_AGE}",
+            }
+            if snapshot.matches(request.headers.get("If-None-Match")):
+                return web.Response(status=304, headers=headers)
+            return web.Response(
+                body=snapshot.body, content_type="application/json", headers=headers
+            )
+
+        return handler
+
+
+status_api = StatusApi()
@@ -0,0 +1,171 @@
+# Domain features and business logic
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.services.bot_db import (
+    add_ticket_notifications,
+    clear_ticket_notifications_for_server,
+    get_tracked_tickets,
+    prune_ticket_notifications,
+    prune_unconfigured_ticket_notifications,
+    update_ticket_message,
+    update_ticket_states,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TrackedTicket:
+    """A game ticket that has been posted to Discord."""
+
+    ticket_id: int
+    discord_message_id: int
+    thread_id: int
+    last_state: str
+
+
+class TicketTracker:
+    """
+    Write-through cache of the ticket_notifications table.
+
+    The bot is the only writer of that table, so it is loaded once at startup
+    and every change goes to bot_db and memory together. The ticket monitor
+    then reads tracked tickets and last IDs from memory instead of querying
+    bot_db every cycle.
+    """
+
+    def __init__(self):
+        self._tickets: dict[str, dict[int, TrackedTicket]] = {}
+        self._last_ids: dict[str, int] = {}
+        self.loaded = False
+
+    async def load(self) -> None:
+        """Fill the cache from bot_db, only the first call does anything."""
+        if self.loaded:
+            return
+
+        for server_name, ticket_id, message_id, thread_id, state in (
+            await get_tracked_tickets()
+        ):
+            self._remember(
+                server_name, TrackedTicket(ticket_id, message_id, thread_id, state)
+            )
+        self.loaded = True
+
+        total = sum(len(tickets) for tickets in self._tickets.values())
+        logger.info(f"Loaded {total} tracked tickets for {len(self._tickets)} servers")
+
+    def _remember(self, server_name: str, ticket: TrackedTicket) -> None:
+        self._tickets.setdefault(server_name, {})[ticket.ticket_id] = ticket
+        if ticket.ticket_id > self._last_ids.get(server_name, 0):
+            self._last_ids[server_name] = ticket.ticket_id
+
+    def is_tracked(self, server_name: str, ticket_id: int) -> bool:
+        return ticket_id in self._tickets.get(server_name, {})
+
+    def get(self, server_name: str, ticket_id: int) -> TrackedTicket | None:
+        return self._tickets.get(server_name, {}).get(ticket_id)
+
+    def ticket_ids(self, server_name: str) -> set[int]:
+        return set(self._tickets.get(server_name, {}))
+
+    def last_ticket_id(self, server_name: str) -> int:
+        """Highest ticket ID tracked for a server, 0 if none."""
+        return self._last_ids.get(server_name, 0)
+
+    def tickets(self, server_name: str) -> list[TrackedTicket]:
+        """Every tracked ticket for a server, in ID order."""
+        tickets = self._tickets.get(server_name, {})
+        return [tickets[ticket_id] for ticket_id in sorted(tickets)]
+
+    async def add_many(self, server_name: str, tickets: list[TrackedTicket]) -> bool:
+        """Record posted tickets in bot_db and the cache."""
+        if not tickets:
+            return True
+
+        saved = await add_ticket_notifications(
+            [
+                (
+                    server_name,
+                    ticket.ticket_id,
+                    ticket.discord_message_id,
+                    ticket.thread_id,
+                    ticket.last_state,
+                )
+                for ticket in tickets
+            ]
+        )
+        # The messages exist on Discord either way, so don't post them again
+        for ticket in tickets:
+            if not self.is_tracked(server_name, ticket.ticket_id):
+                self._remember(server_name, ticket)
+        return saved
+
+    async def update_states(
+        self, server_name: str, updates: list[tuple[int, str]]
+    ) -> bool:
+        """Record new ticket states in bot_db and the cache."""
+        if not updates:
+            return True
+
+        saved = await update_ticket_states(server_name, updates)
+        for ticket_id, state in updates:
+            ticket = self.get(server_name, ticket_id)
+            if ticket:
+                ticket.last_state = state
+        return saved
+
+    async def replace_message(
+        self,
+        server_name: str,
+        ticket_id: int,
+        discord_message_id: int,
+        thread_id: int,
+        state: str,
+    ) -> bool:
+        """Record the message that was posted after a ticket's old one was deleted."""
+        saved = await update_ticket_message(
+            server_name, ticket_id, discord_message_id, thread_id, state
+        )
+        ticket = self.get(server_name, ticket_id)
+        if ticket:
+            ticket.discord_message_id = discord_message_id
+            ticket.thread_id = thread_id
+            ticket.last_state = state
+        return saved
+
+    async def clear_server(self, server_name: str) -> None:
+        """Forget every ticket for a server, used when its world is reset."""
+        await clear_ticket_notifications_for_server(server_name)
+        self._tickets.pop(server_name, None)
+        self._last_ids.pop(server_name, None)
+
+    async def prune_outside_range(
+        self, server_name: str, min_id: int, max_id: int
+    ) -> int:
+        """Stop tracking tickets that are no longer in the game database."""
+        removed = await prune_ticket_notifications(server_name, min_id, max_id)
+        tickets = self._tickets.get(server_name, {})
+        for ticket_id in removed:
+            tickets.pop(ticket_id, None)
+        if removed:
+            self._last_ids[server_name] = max(tickets, default=0)
+        return len(removed)
+
+    async def prune_unconfigured(
+        self, server_names: list[str], older_than: datetime
+    ) -> list[str]:
+        """Drop old tracking for servers that are no longer configured."""
+        removed_servers = await prune_unconfigured_ticket_notifications(
+            server_names, older_than
+        )
+        # Unconfigured servers aren't monitored, so nothing reads their cache
+        for server_name in removed_servers:
+            self._tickets.pop(server_name, None)
+            self._last_ids.pop(server_name, None)
+        return removed_servers
+
+
+ticket_tracker = TicketTracker()
@@ -1,176 +1,677 @@
-from datetime import datetime
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import AsyncIterator, Optional
 
 import aiosqlite
 import logging
 
+from src.config import Config
+from src.utils.helpers import get_billing_period_start
+
 logger = logging.getLogger(__name__)
 
 project_root = Path(__file__).parent.parent.parent
 db_path = project_root / "data" / "bot_database.db"
 
+READER_CONNECTIONS = 2
+# Negative cache_size is in KiB, so this is 8MB of page cache per connection
+CACHE_SIZE_KIB = 8192
+# How SQLite's CURRENT_TIMESTAMP writes dates, always UTC
+DONATION_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class _Database:
+    """
+    Long-lived connections to the bot database.
+
+    aiosqlite runs every connection on its own thread, so opening one per
+    query means a thread start and file open each time. Instead there is one
+    writer connection, with writes serialized by a lock and committed (or
+    rolled back) as a unit, and a small pool of reader connections. The
+    database runs in WAL mode so readers never wait on the writer.
+    """
+
+    def __init__(self):
+        self._writer: aiosqlite.Connection | None = None
+        self._write_lock = asyncio.Lock()
+        self._readers: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._reader_connections: list[aiosqlite.Connection] = []
+
+    @property
+    def is_open(self) -> bool:
+        return self._writer is not None
+
+    @staticmethod
+    async def _pragma(conn: aiosqlite.Connection, pragma: str):
+        # Some pragmas return a row, close the cursor so nothing stays locked
+        async with conn.execute(f"PRAGMA {pragma}"):
+            pass
+
+    async def _connect(self, path: Path, read_only: bool) -> aiosqlite.Connection:
+        conn = await aiosqlite.connect(path, timeout=10)
+        await self._pragma(conn, "synchronous=NORMAL")
+        await self._pragma(conn, f"cache_size=-{CACHE_SIZE_KIB}")
+        await self._pragma(conn, "temp_store=MEMORY")
+        if read_only:
+            await self._pragma(conn, "query_only=1")
+        return conn
+
+    async def open(self, path: Path, readers: int = READER_CONNECTIONS):
+        if self.is_open:
+            return
+
+        self._writer = await self._connect(path, read_only=False)
+        # WAL is persistent, but setting it every start is cheap and harmless
+        await self._pragma(self._writer, "journal_mode=WAL")
+
+        for _ in range(readers):
+            conn = await self._connect(path, read_only=True)
+            self._reader_connections.append(conn)
+            self._readers.put_nowait(conn)
+
+    async def close(self):
+        for conn in self._reader_connections:
+            await conn.close()
+        self._reader_connections.clear()
+        self._readers = asyncio.Queue()
+
+        if self._writer:
+            await self._writer.close()
+            self._writer = None
+
+    @asynccontextmanager
+    async def write(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Exclusive use of the writer, committed on success and rolled back on error."""
+        if self._writer is None:
+            raise RuntimeError("Bot database is not open, call init_db() first")
+
+        async with self._write_lock:
+            try:
+                yield self._writer
+                await self._writer.commit()
+            except BaseException:
+                await self._writer.rollback()
+                raise
+
+    @asynccontextmanager
+    async def read(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a reader connection from the pool."""
+        if self._writer is None:
+            raise RuntimeError("Bot database is not open, call init_db() first")
+
+        conn = await self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put_nowait(conn)
+
+
+_db = _Database()
+
+
+TICKET_NOTIFICATIONS_SCHEMA = """
+    CREATE TABLE ticket_notifications (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        server_name TEXT NOT NULL,
+        ticket_id INTEGER NOT NULL,
+        discord_message_id INTEGER NOT NULL,
+        thread_id INTEGER NOT NULL,
+        processed_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        last_state TEXT DEFAULT 'unanswered',
+        UNIQUE(server_name, ticket_id)
+    )
+"""
+
+
+async def _table_columns(db: aiosqlite.Connection, table: str) -> list[str]:
+    async with db.execute(f"PRAGMA table_info({table})") as cursor:
+        return [row[1] for row in await cursor.fetchall()]
+
+
+async def _rebuild_table(
+    db: aiosqlite.Connection, table: str, create_sql: str, defaults: dict
+):
+    """
+    Recreate a table with a new schema, keeping its rows.
+
+    Columns that exist in both schemas are copied, new columns are filled
+    from defaults (or their column default). Runs inside the caller's
+    migration transaction, so a failure leaves the old table untouched.
+    """
+    old_columns = await _table_columns(db, table)
+    temp_table = f"{table}_new"
+
+    await db.execute(f"DROP TABLE IF EXISTS {temp_table}")
+    await db.execute(create_sql.replace(f"TABLE {table}", f"TABLE {temp_table}", 1))
+    new_columns = await _table_columns(db, temp_table)
+
+    copied = [col for col in new_columns if col in old_columns]
+    filled = [col for col in new_columns if col not in old_columns and col in defaults]
+    columns = ", ".join(copied + filled)
+    values = ", ".join(copied + ["?"] * len(filled))
+    await db.execute(
+        f"INSERT OR IGNORE INTO {temp_table} ({columns}) SELECT {values} FROM {table}",
+        [defaults[col] for col in filled],
+    )
+
+    await db.execute(f"DROP TABLE {table}")
+    await db.execute(f"ALTER TABLE {temp_table} RENAME TO {table}")
+
+
+async def _migrate_base_tables(db: aiosqlite.Connection):
+    """Bans, donations and ticket tracking."""
+    await db.execute(
+        """
+        CREATE TABLE IF NOT EXISTS banned_players (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            player_name TEXT NOT NULL,
+            steam_id TEXT NOT NULL,
+            banned_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(steam_id)
+        )
+        """
+    )
+
+    await db.execute(
+        """
+        CREATE TABLE IF NOT EXISTS donations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            player_name TEXT NOT NULL,
+            email TEXT NOT NULL,
+            amount REAL NOT NULL,
+            donation_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+
+    columns = await _table_columns(db, "ticket_notifications")
+    if not columns:
+        await db.execute(TICKET_NOTIFICATIONS_SCHEMA)
+    elif "server_name" not in columns:
+        # Tables from before multi server support, those tickets all came
+        # from the first server
+        logger.info("Migrating ticket_notifications table to support multiple servers")
+        first_server = (
+            Config.SERVER_DATA[0]["server_name"] if Config.SERVER_DATA else "unknown"
+        )
+        await _rebuild_table(
+            db,
+            "ticket_notifications",
+            TICKET_NOTIFICATIONS_SCHEMA,
+            {"server_name": first_server},
+        )
+
+
+async def _migrate_donation_tracking(db: aiosqlite.Connection):
+    """Billing period totals and raw Ko-fi events."""
+    # Running totals per billing period, maintained alongside donations
+    await db.execute(
+        """
+        CREATE TABLE IF NOT EXISTS donation_periods (
+            bill_day INTEGER NOT NULL,
+            period_start TEXT NOT NULL,
+            total REAL NOT NULL DEFAULT 0,
+            donation_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (bill_day, period_start)
+        )
+        """
+    )
+
+    # Raw Ko-fi webhook events, unique per transaction so retries are no-ops
+    await db.execute(
+        """
+        CREATE TABLE IF NOT EXISTS kofi_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            transaction_id TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            received_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            processed_date TIMESTAMP,
+            UNIQUE(transaction_id)
+        )
+        """
+    )
+
+
+async def _migrate_chat_archive(db: aiosqlite.Connection):
+    """Archived game chat with its full text index."""
+    await db.execute(
+        """
+        CREATE TABLE IF NOT EXISTS chat_messages (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            server_name TEXT NOT NULL,
+            logged_at TIMESTAMP NOT NULL,
+            channel TEXT NOT NULL,
+            author TEXT NOT NULL,
+            text TEXT NOT NULL
+        )
+        """
+    )
+    await db.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_chat_messages_server_time
+        ON chat_messages(server_name, logged_at)
+        """
+    )
+    await db.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_chat_messages_author
+        ON chat_messages(server_name, author COLLATE NOCASE, logged_at)
+        """
+    )
+    # External content FTS index over chat_messages, kept in sync by triggers
+    await db.execute(
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS chat_messages_fts USING fts5(
+            author, text, content='chat_messages', content_rowid='id'
+        )
+        """
+    )
+    await db.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS chat_messages_ai AFTER INSERT ON chat_messages
+        BEGIN
+            INSERT INTO chat_messages_fts(rowid, author, text)
+            VALUES (new.id, new.author, new.text);
+        END
+        """
+    )
+    await db.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS chat_messages_ad AFTER DELETE ON chat_messages
+        BEGIN
+            INSERT INTO chat_messages_fts(chat_messages_fts, rowid, author, text)
+            VALUES ('delete', old.id, old.author, old.text);
+        END
+        """
+    )
+
+
+async def _migrate_baseline_indexes(db: aiosqlite.Connection):
+    """Indexes for the donation total and ticket state lookups."""
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_donations_date ON donations(donation_date)"
+    )
+    await db.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_ticket_notifications_state
+        ON ticket_notifications(server_name, last_state)
+        """
+    )
+    # banned_players(steam_id) is already indexed by its UNIQUE constraint
+
+
+async def _migrate_playerlist_messages(db: aiosqlite.Connection):
+    """Playerlist messages the bot has reposted in place of the configured ones."""
+    await db.execute(
+        """
+        CREATE TABLE IF NOT EXISTS playerlist_messages (
+            server_name TEXT PRIMARY KEY,
+            channel_id INTEGER NOT NULL,
+            message_id INTEGER NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+
+
+async def _migrate_ticket_history(db: aiosqlite.Connection):
+    """Every ticket and answer the bot has seen, with its full text index."""
+    # Ticket IDs start again after a world reset, so the text is part of the key
+    await db.execute(
+        """
+        CREATE TABLE IF NOT EXISTS ticket_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            server_name TEXT NOT NULL,
+            ticket_id INTEGER NOT NULL,
+            author TEXT NOT NULL,
+            message TEXT NOT NULL,
+            answered_by TEXT,
+            answer TEXT,
+            first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            answered_at TIMESTAMP,
+            UNIQUE(server_name, ticket_id, author, message)
+        )
+        """
+    )
+    await db.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_ticket_history_author
+        ON ticket_history(author COLLATE NOCASE, first_seen)
+        """
+    )
+    await db.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_ticket_history_unanswered
+        ON ticket_history(first_seen) WHERE answered_by IS NULL
+        """
+    )
+    # External content FTS index over ticket_history, kept in sync by triggers
+    await db.execute(
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS ticket_history_fts USING fts5(
+            author, message, answered_by, answer,
+            content='ticket_history', content_rowid='id'
+        )
+        """
+    )
+    await db.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS ticket_history_ai AFTER INSERT ON ticket_history
+        BEGIN
+            INSERT INTO ticket_history_fts(rowid, author, message, answered_by, answer)
+            VALUES (new.id, new.author, new.message, new.answered_by, new.answer);
+        END
+        """
+    )
+    await db.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS ticket_history_ad AFTER DELETE ON ticket_history
+        BEGIN
+            INSERT INTO ticket_history_fts(
+                ticket_history_fts, rowid, author, message, answered_by, answer
+            )
+            VALUES ('delete', old.id, old.author, old.message, old.answered_by, old.answer);
+        END
+        """
+    )
+    await db.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS ticket_history_au AFTER UPDATE ON ticket_history
+        BEGIN
+            INSERT INTO ticket_history_fts(
+                ticket_history_fts, rowid, author, message, answered_by, answer
+            )
+            VALUES ('delete', old.id, old.author, old.message, old.answered_by, old.answer);
+            INSERT INTO ticket_history_fts(rowid, author, message, answered_by, answer)
+            VALUES (new.id, new.author, new.message, new.answered_by, new.answer);
+        END
+        """
+    )
+
+
+async def _migrate_kofi_event_errors(db: aiosqlite.Connection):
+    """Why a Ko-fi event failed, so it isn't retried on every start."""
+    if "error" not in await _table_columns(db, "kofi_events"):
+        await db.execute("ALTER TABLE kofi_events ADD COLUMN error TEXT")
+
+
+async def _migrate_donation_period_clock(db: aiosqlite.Connection):
+    """Period totals kept with the wrong clock, rebuilt by init_db's backfill."""
+    await db.execute("DELETE FROM donation_periods")
+
+
+# Schema steps in order, a database at user_version N has had the first N
+# applied. Only ever append to this list. Steps must be safe to run on
+# databases created before versioning, and anything that touches every row
+# of a large table belongs in a background job rather than here.
+MIGRATIONS = [
+    _migrate_base_tables,
+    _migrate_donation_tracking,
+    _migrate_chat_archive,
+    _migrate_baseline_indexes,
+    _migrate_playerlist_messages,
+    _migrate_ticket_history,
+    _migrate_kofi_event_errors,
+    _migrate_donation_period_clock,
+]
+
+
+async def _run_migrations():
+    async with _db.read() as db:
+        async with db.execute("PRAGMA user_version") as cursor:
+            version = (await cursor.fetchone())[0]
+
+    if version > len(MIGRATIONS):
+        logger.warning(
+            f"Bot database is at schema version {version}, newer than this bot ({len(MIGRATIONS)})"
+        )
+        return
+
+    for number, migration in enumerate(MIGRATIONS[version:], start=version + 1):
+        logger.info(f"Applying bot database migration {number}: {migration.__doc__}")
+        # Each step and its version bump commit together, or not at all
+        async with _db.write() as db:
+            await db.execute("BEGIN")
+            await migration(db)
+            await db.execute(f"PRAGMA user_version = {number}")
+
 
 async def init_db():
-    """Initialize the database and create tables if they don't exist."""
+    """Open the database connections and bring the schema up to date."""
     global db_path
 
     db_path = db_path.resolve()
 
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    async with aiosqlite.connect(db_path) as db:
-        await db.execute(
-            """
-            CREATE TABLE IF NOT EXISTS banned_players (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                player_name TEXT NOT NULL,
-                steam_id TEXT NOT NULL,
-                banned_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(steam_id)
-            )
-            """
-        )
+    await _db.open(db_path)
+    await _run_migrations()
 
-        await db.execute(
-            """
-            CREATE TABLE IF NOT EXISTS donations (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                player_name TEXT NOT NULL,
-                email TEXT NOT NULL,
-                amount REAL NOT NULL,
-                donation_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            """
-        )
+    # The bill day comes from config, so its totals may need building on any start
+    async with _db.write() as db:
+        await _backfill_donation_periods(db, Config.KOFI_BILL_DAY)
 
-        await db.execute(
-            """
-            CREATE TABLE IF NOT EXISTS ticket_notifications (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                server_name TEXT NOT NULL,
-                ticket_id INTEGER NOT NULL,
-                discord_message_id INTEGER NOT NULL,
-                thread_id INTEGER NOT NULL,
-                processed_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                last_state TEXT DEFAULT 'unanswered',
-                UNIQUE(server_name, ticket_id)
-            )
-            """
+    logger.info("Database initialized")
+
+
+async def close_db():
+    """Close the database connections."""
+    await _db.close()
+
+
+def is_db_open() -> bool:
+    """Whether init_db() has opened the database, for cogs that can run without it."""
+    return _db.is_open
+
+
+async def _backfill_donation_periods(db: aiosqlite.Connection, bill_day: int):
+    """Build the period totals for bill_day from the donations table if missing."""
+    async with db.execute(
+        "SELECT 1 FROM donation_periods WHERE bill_day = ? LIMIT 1", (bill_day,)
+    ) as cursor:
+        if await cursor.fetchone() is not None:
+            return
+
+    totals: dict[str, list] = {}
+    async with db.execute("SELECT amount, donation_date FROM donations") as cursor:
+        async for amount, donation_date in cursor:
+            period = _donation_period(donation_date, bill_day)
+            period_total = totals.setdefault(period, [0.0, 0])
+            period_total[0] += amount
+            period_total[1] += 1
+
+    if totals:
+        await db.executemany(
+            "INSERT INTO donation_periods (bill_day, period_start, total, donation_count) VALUES (?, ?, ?, ?)",
+            [(bill_day, period, total, count) for period, (total, count) in totals.items()],
         )
+        logger.info(f"Backfilled donation totals for {len(totals)} billing periods")
 
-        try:
-            async with db.execute("PRAGMA table_info(ticket_notifications)") as cursor:
-                columns = await cursor.fetchall()
-                has_server_name = any(col[1] == 'server_name' for col in columns)
-            
-            if not has_server_name:
-                logger.info("Migrating ticket_notifications table to support multiple servers")
-                await db.execute("DROP TABLE IF EXISTS ticket_notifications")
-                await db.execute(
-                    """
-                    CREATE TABLE ticket_notifications (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        server_name TEXT NOT NULL,
-                        ticket_id INTEGER NOT NULL,
-                        discord_message_id INTEGER NOT NULL,
-                        thread_id INTEGER NOT NULL,
-                        processed_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        last_state TEXT DEFAULT 'unanswered',
-                        UNIQUE(server_name, ticket_id)
-                    )
-                    """
-                )
-                logger.info("Migration completed - now supporting multiple servers")
-        except Exception as e:
-            logger.error(f"Error during migration: {e}")
 
-        await db.commit()
-        logger.info("Database initialized")
+def _period_key(period_start: datetime) -> str:
+    return period_start.strftime("%Y-%m-%d")
+
+
+def _donation_period(donation_date: str, bill_day: int) -> str:
+    """
+    The billing period key for a stored donation_date.
+
+    donation_date is UTC, as CURRENT_TIMESTAMP writes it, while the bill day
+    and the period totals are read in local time, so it's converted first.
+    """
+    donated_at = datetime.strptime(donation_date[:19], DONATION_DATE_FORMAT)
+    local = donated_at.replace(tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
+    return _period_key(get_billing_period_start(local, bill_day))
+
+
+async def _insert_donation(
+    db: aiosqlite.Connection, player_name: str, email: str, amount: float
+):
+    """Insert a donation and add it to the current period's total (no commit)."""
+    bill_day = Config.KOFI_BILL_DAY
+    # The row's own timestamp decides the period, the same as for the backfill
+    donation_date = datetime.now(timezone.utc).strftime(DONATION_DATE_FORMAT)
+    period = _donation_period(donation_date, bill_day)
+    await db.execute(
+        "INSERT INTO donations (player_name, email, amount, donation_date) VALUES (?, ?, ?, ?)",
+        (player_name, email, amount, donation_date),
+    )
+    await db.execute(
+        """
+        INSERT INTO donation_periods (bill_day, period_start, total, donation_count)
+        VALUES (?, ?, ?, 1)
+        ON CONFLICT(bill_day, period_start) DO UPDATE SET
+            total = total + excluded.total,
+            donation_count = donation_count + 1
+        """,
+        (bill_day, period, amount),
+    )
 
 
 async def add_donation(player_name: str, email: str, amount: float) -> bool:
-    """Record a donation from a player."""
+    """Record a donation from a player and add it to the current period's total."""
     try:
-        async with aiosqlite.connect(db_path) as db:
-            await db.execute(
-                "INSERT INTO donations (player_name, email, amount) VALUES (?, ?, ?)",
-                (player_name, email, amount),
-            )
-            await db.commit()
+        async with _db.write() as db:
+            await _insert_donation(db, player_name, email, amount)
             return True
     except Exception:
         return False
 
 
-async def get_total_donations_since(from_date: datetime) -> float:
+async def add_kofi_event(transaction_id: str, payload: str) -> bool:
     """
-    Get the total sum of donations since the specified date.
-
-    Args:
-        from_date (datetime): Sum donations from this date onwards
+    Persist a raw Ko-fi webhook event.
 
     Returns:
-        float: Total sum of donations.
+        bool: True if the event is new, False if it was already recorded.
     """
-    async with aiosqlite.connect(db_path) as db:
-        date_str = from_date.strftime("%Y-%m-%d %H:%M:%S")
-        query = """
-            SELECT SUM(amount)
-            FROM donations
-            WHERE donation_date >= ?
-        """
+    async with _db.write() as db:
+        cursor = await db.execute(
+            "INSERT OR IGNORE INTO kofi_events (transaction_id, payload) VALUES (?, ?)",
+            (transaction_id, payload),
+        )
+        return cursor.rowcount == 1
 
-        async with db.execute(query, (date_str,)) as cursor:
-            result = await cursor.fetchone()
-            if result and result[0] is not None:
-                return float(result[0])
-            else:
-                return 0.0
+
+async def get_unprocessed_kofi_events() -> list:
+    """Get (transaction_id, payload) for events that haven't been processed yet."""
+    async with _db.read() as db:
+        async with db.execute(
+            "SELECT transaction_id, payload FROM kofi_events WHERE processed_date IS NULL ORDER BY id ASC"
+        ) as cursor:
+            return list(await cursor.fetchall())
 
 
-async def add_ticket_notification(
-    server_name: str, ticket_id: int, discord_message_id: int, thread_id: int
+async def record_kofi_donation(
+    transaction_id: str, player_name: str, email: str, amount: float
 ) -> bool:
-    """Record that a ticket has been posted to Discord."""
+    """
+    Record the donation for a Ko-fi event and mark the event processed, atomically.
+
+    Returns:
+        bool: True if the donation was recorded now, False if the event was
+        already processed (or unknown).
+    """
+    async with _db.write() as db:
+        cursor = await db.execute(
+            "UPDATE kofi_events SET processed_date = CURRENT_TIMESTAMP WHERE transaction_id = ? AND processed_date IS NULL",
+            (transaction_id,),
+        )
+        if cursor.rowcount != 1:
+            return False
+
+        await _insert_donation(db, player_name, email, amount)
+        return True
+
+
+async def mark_kofi_event_failed(transaction_id: str, error: str) -> bool:
+    """
+    Mark an event that could not be processed as done, keeping the error.
+
+    Returns:
+        bool: True if the event was marked now, False if it was already processed.
+    """
     try:
-        async with aiosqlite.connect(db_path) as db:
-            await db.execute(
-                "INSERT INTO ticket_notifications (server_name, ticket_id, discord_message_id, thread_id, last_state) VALUES (?, ?, ?, ?, ?)",
-                (server_name, ticket_id, discord_message_id, thread_id, "unanswered"),
+        async with _db.write() as db:
+            cursor = await db.execute(
+                "UPDATE kofi_events SET processed_date = CURRENT_TIMESTAMP, error = ? WHERE transaction_id = ? AND processed_date IS NULL",
+                (error, transaction_id),
             )
-            await db.commit()
-            return True
-    except aiosqlite.IntegrityError:
-        return False
-    except Exception:
+            return cursor.rowcount == 1
+    except Exception as e:
+        logger.error(f"Error marking Ko-fi event {transaction_id} failed: {e}")
         return False
 
 
-async def is_ticket_processed(server_name: str, ticket_id: int) -> bool:
-    """Check if a ticket has already been processed."""
-    async with aiosqlite.connect(db_path) as db:
+async def get_donation_period_total(period_start: datetime) -> float:
+    """
+    Get the running donation total for the billing period starting at period_start.
+
+    Args:
+        period_start (datetime): Start of the billing period, e.g. from
+            get_last_occurrence_of_day(Config.KOFI_BILL_DAY)
+
+    Returns:
+        float: Total donated in that period.
+    """
+    async with _db.read() as db:
         async with db.execute(
-            "SELECT 1 FROM ticket_notifications WHERE server_name = ? AND ticket_id = ?", (server_name, ticket_id)
+            "SELECT total FROM donation_periods WHERE bill_day = ? AND period_start = ?",
+            (Config.KOFI_BILL_DAY, _period_key(period_start)),
         ) as cursor:
-            return await cursor.fetchone() is not None
+            result = await cursor.fetchone()
+            return float(result[0]) if result else 0.0
 
 
-async def get_last_processed_ticket_id(server_name: str) -> int:
-    """Get the highest ticket ID that has been processed for a specific server."""
-    async with aiosqlite.connect(db_path) as db:
+async def get_donation_history(limit: int = 12) -> list:
+    """
+    Get donation totals for the most recent billing periods.
+
+    Returns:
+        list: (period_start, total, donation_count) rows, newest first.
+    """
+    async with _db.read() as db:
         async with db.execute(
-            "SELECT MAX(ticket_id) FROM ticket_notifications WHERE server_name = ?", (server_name,)
+            """
+            SELECT period_start, total, donation_count
+            FROM donation_periods
+            WHERE bill_day = ?
+            ORDER BY period_start DESC
+            LIMIT ?
+            """,
+            (Config.KOFI_BILL_DAY, limit),
         ) as cursor:
-            result = await cursor.fetchone()
-            if result and result[0] is not None:
-                return int(result[0])
-            else:
-                return 0
+            return list(await cursor.fetchall())
+
+
+async def add_ticket_notifications(rows: list[tuple[str, int, int, int, str]]) -> bool:
+    """
+    Record many posted tickets in a single transaction.
+
+    Args:
+        rows: (server_name, ticket_id, discord_message_id, thread_id, last_state)
+            tuples. Tickets that are already tracked are left as they are.
+    """
+    if not rows:
+        return True
+
+    try:
+        async with _db.write() as db:
+            await db.executemany(
+                "INSERT OR IGNORE INTO ticket_notifications (server_name, ticket_id, discord_message_id, thread_id, last_state) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            return True
+    except Exception as e:
+        logger.error(f"Error recording {len(rows)} ticket notifications: {e}")
+        return False
 
 
 async def get_tracked_tickets() -> list:
     """Get all tickets that have Discord notifications posted."""
-    async with aiosqlite.connect(db_path) as db:
+    async with _db.read() as db:
         async with db.execute(
             """
             SELECT server_name, ticket_id, discord_message_id, thread_id, last_state
@@ -182,71 +683,378 @@ async def get_tracked_tickets() -> list:
             return [(row[0], row[1], row[2], row[3], row[4]) for row in results]
 
 
-async def get_tracked_tickets_in_range(server_name: str, min_id: int, max_id: int) -> list:
-    """Get tracked tickets within a specific ID range."""
-    async with aiosqlite.connect(db_path) as db:
-        async with db.execute(
-            """SELECT server_name, ticket_id, discord_message_id, thread_id, last_state
-               FROM ticket_notifications 
-               WHERE server_name = ? AND ticket_id BETWEEN ? AND ?
-               ORDER BY ticket_id ASC""",
-            (server_name, min_id, max_id)
-        ) as cursor:
-            results = await cursor.fetchall()
-            return [(row[0], row[1], row[2], row[3], row[4]) for row in results]
-
-
 async def clear_ticket_notifications_for_server(server_name: str):
     """Remove all ticket tracking for a server (used on game world reset)."""
-    async with aiosqlite.connect(db_path) as db:
+    async with _db.write() as db:
         await db.execute(
             "DELETE FROM ticket_notifications WHERE server_name = ?", (server_name,)
         )
-        await db.commit()
 
 
-async def update_ticket_state(server_name: str, ticket_id: int, new_state: str) -> bool:
-    """Update the last known state of a ticket."""
+async def update_ticket_states(server_name: str, updates: list[tuple[int, str]]) -> bool:
+    """
+    Update the last known state of many tickets in a single transaction.
+
+    Args:
+        server_name: Server the tickets belong to.
+        updates: (ticket_id, new_state) tuples.
+    """
+    if not updates:
+        return True
+
     try:
-        async with aiosqlite.connect(db_path) as db:
-            await db.execute(
+        async with _db.write() as db:
+            await db.executemany(
                 "UPDATE ticket_notifications SET last_state = ? WHERE server_name = ? AND ticket_id = ?",
-                (new_state, server_name, ticket_id),
+                [(state, server_name, ticket_id) for ticket_id, state in updates],
             )
-            await db.commit()
             return True
-    except Exception:
+    except Exception as e:
+        logger.error(f"Error updating {len(updates)} {server_name} ticket states: {e}")
+        return False
+
+
+async def update_ticket_message(
+    server_name: str, ticket_id: int, discord_message_id: int, thread_id: int, state: str
+) -> bool:
+    """Point a tracked ticket at the message that was posted to replace its old one."""
+    try:
+        async with _db.write() as db:
+            await db.execute(
+                "UPDATE ticket_notifications SET discord_message_id = ?, thread_id = ?, last_state = ? WHERE server_name = ? AND ticket_id = ?",
+                (discord_message_id, thread_id, state, server_name, ticket_id),
+            )
+            return True
+    except Exception as e:
+        logger.error(f"Error updating {server_name} ticket #{ticket_id} message: {e}")
         return False
 
 
-async def get_ticket_last_state(server_name: str, ticket_id: int) -> str:
-    """Get the last known state of a ticket."""
-    async with aiosqlite.connect(db_path) as db:
+async def prune_ticket_notifications(
+    server_name: str, min_id: int, max_id: int
+) -> list[int]:
+    """
+    Stop tracking a server's tickets that are outside its live ID range.
+
+    Tickets outside the range were deleted from the game, usually by a
+    world reset, so their Discord posts can never change again.
+
+    Returns:
+        list[int]: The ticket IDs that were removed.
+    """
+    async with _db.write() as db:
         async with db.execute(
-            "SELECT last_state FROM ticket_notifications WHERE server_name = ? AND ticket_id = ?",
-            (server_name, ticket_id),
+            "SELECT ticket_id FROM ticket_notifications WHERE server_name = ? AND ticket_id NOT BETWEEN ? AND ?",
+            (server_name, min_id, max_id),
         ) as cursor:
-            result = await cursor.fetchone()
-            return result[0] if result else "unanswered"
+            ticket_ids = [row[0] for row in await cursor.fetchall()]
+
+        if ticket_ids:
+            await db.execute(
+                "DELETE FROM ticket_notifications WHERE server_name = ? AND ticket_id NOT BETWEEN ? AND ?",
+                (server_name, min_id, max_id),
+            )
+        return ticket_ids
+
+
+async def prune_unconfigured_ticket_notifications(
+    server_names: list[str], older_than: datetime
+) -> list[str]:
+    """
+    Drop tracked tickets from servers that are no longer configured.
+
+    Only tickets processed before older_than are removed, so a server that is
+    briefly missing from the config keeps its tracking.
+
+    Returns:
+        list[str]: The servers that had tickets removed.
+    """
+    placeholders = ", ".join("?" for _ in server_names) or "NULL"
+    condition = f"server_name NOT IN ({placeholders}) AND processed_date < ?"
+    params = [*server_names, older_than.strftime("%Y-%m-%d %H:%M:%S")]
+
+    async with _db.write() as db:
+        async with db.execute(
+            f"SELECT DISTINCT server_name FROM ticket_notifications WHERE {condition}",
+            params,
+        ) as cursor:
+            removed_servers = [row[0] for row in await cursor.fetchall()]
+
+        if removed_servers:
+            await db.execute(f"DELETE FROM ticket_notifications WHERE {condition}", params)
+        return removed_servers
+
+
+async def prune_kofi_events(older_than: datetime) -> int:
+    """Delete processed Ko-fi events received before older_than, keeping failed ones."""
+    async with _db.write() as db:
+        cursor = await db.execute(
+            "DELETE FROM kofi_events WHERE processed_date IS NOT NULL AND error IS NULL AND received_date < ?",
+            (older_than.strftime("%Y-%m-%d %H:%M:%S"),),
+        )
+        return cursor.rowcount
+
+
+async def _database_size(db: aiosqlite.Connection) -> int:
+    async with db.execute("PRAGMA page_count") as cursor:
+        page_count = (await cursor.fetchone())[0]
+    async with db.execute("PRAGMA page_size") as cursor:
+        page_size = (await cursor.fetchone())[0]
+    return page_count * page_size
+
+
+async def compact_db() -> int:
+    """
+    Refresh query planner stats and return free pages to the filesystem.
+
+    The first run switches the database to incremental auto vacuum, which
+    needs a one-off full VACUUM. That is done here rather than at startup
+    so it never delays the bot coming online.
+
+    Returns:
+        int: Bytes reclaimed from the database file.
+    """
+    async with _db.write() as db:
+        size_before = await _database_size(db)
+        await db.execute("PRAGMA optimize")
+
+        async with db.execute("PRAGMA auto_vacuum") as cursor:
+            auto_vacuum = (await cursor.fetchone())[0]
+
+        # VACUUM can't run inside a transaction
+        await db.commit()
+        if auto_vacuum != 2:
+            logger.info("Switching bot database to incremental auto vacuum")
+            await db.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            await db.execute("VACUUM")
+        else:
+            async with db.execute("PRAGMA incremental_vacuum"):
+                pass
 
+        # Fold the WAL back into the main file so its size is real
+        async with db.execute("PRAGMA wal_checkpoint(TRUNCATE)"):
+            pass
+
+        return size_before - await _database_size(db)
+
+
+async def add_chat_messages(messages: list[tuple[str, str, str, str, str]]) -> bool:
+    """
+    Archive a batch of in-game chat messages in a single transaction.
+
+    Args:
+        messages: (server_name, logged_at, channel, author, text) tuples, with
+            logged_at formatted as "YYYY-MM-DD HH:MM:SS".
+    """
+    if not messages:
+        return True
 
-async def clear_local_tracking() -> bool:
-    """Clear all ticket notifications from local database."""
     try:
-        async with aiosqlite.connect(db_path) as db:
-            await db.execute("DELETE FROM ticket_notifications")
-            await db.commit()
+        async with _db.write() as db:
+            await db.executemany(
+                "INSERT INTO chat_messages (server_name, logged_at, channel, author, text) VALUES (?, ?, ?, ?, ?)",
+                messages,
+            )
             return True
-    except Exception:
+    except Exception as e:
+        logger.error(f"Error archiving {len(messages)} chat messages: {e}")
         return False
 
 
-async def clear_server_tracking(server_name: str) -> bool:
-    """Clear all ticket notifications for a specific server from local database."""
+def _fts_phrase(phrase: str) -> str:
+    """Quote user input as a single FTS5 phrase so it can't inject query syntax."""
+    return '"' + phrase.replace('"', '""') + '"'
+
+
+async def search_chat_messages(
+    server_name: str,
+    phrase: Optional[str] = None,
+    author: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    limit: int = 15,
+    offset: int = 0,
+) -> list:
+    """
+    Search archived chat, newest first.
+
+    Args:
+        server_name: Server the chat was logged on.
+        phrase: Words that must appear in the message text, in order.
+        author: Exact (case-insensitive) player name.
+        since: Only messages logged at or after this time.
+        until: Only messages logged before this time.
+        limit: Page size.
+        offset: Number of results to skip.
+
+    Returns:
+        list: (logged_at, channel, author, text) rows.
+    """
+    conditions = ["m.server_name = ?"]
+    params: list = [server_name]
+
+    if phrase:
+        source = "chat_messages_fts f JOIN chat_messages m ON m.id = f.rowid"
+        conditions.append("chat_messages_fts MATCH ?")
+        params.append(f"text : {_fts_phrase(phrase)}")
+    else:
+        source = "chat_messages m"
+
+    if author:
+        conditions.append("m.author = ? COLLATE NOCASE")
+        params.append(author)
+    if since:
+        conditions.append("m.logged_at >= ?")
+        params.append(since.strftime("%Y-%m-%d %H:%M:%S"))
+    if until:
+        conditions.append("m.logged_at < ?")
+        params.append(until.strftime("%Y-%m-%d %H:%M:%S"))
+
+    query = f"""
+        SELECT m.logged_at, m.channel, m.author, m.text
+        FROM {source}
+        WHERE {" AND ".join(conditions)}
+        ORDER BY m.logged_at DESC, m.id DESC
+        LIMIT ? OFFSET ?
+    """
+    params.extend([limit, offset])
+
+    async with _db.read() as db:
+        async with db.execute(query, params) as cursor:
+            return list(await cursor.fetchall())
+
+
+async def record_ticket_history(
+    rows: list[tuple[str, int, str, str, Optional[str], Optional[str]]]
+) -> bool:
+    """
+    Add tickets to the history, or fill in their answers, in a single transaction.
+
+    Rows that are already recorded only change when they gain an answer, so
+    seeing the same tickets again is cheap.
+
+    Args:
+        rows: (server_name, ticket_id, author, message, answered_by, answer)
+            tuples, the answer fields None for unanswered tickets.
+    """
+    if not rows:
+        return True
+
     try:
-        async with aiosqlite.connect(db_path) as db:
-            await db.execute("DELETE FROM ticket_notifications WHERE server_name = ?", (server_name,))
-            await db.commit()
+        async with _db.write() as db:
+            await db.executemany(
+                """
+                INSERT INTO ticket_history
+                    (server_name, ticket_id, author, message, answered_by, answer, answered_at)
+                VALUES (?, ?, ?, ?, ?, ?, CASE WHEN ? IS NULL THEN NULL ELSE CURRENT_TIMESTAMP END)
+                ON CONFLICT(server_name, ticket_id, author, message) DO UPDATE SET
+                    answered_by = excluded.answered_by,
+                    answer = excluded.answer,
+                    answered_at = excluded.answered_at
+                WHERE excluded.answered_by IS NOT NULL AND ticket_history.answered_by IS NULL
+                """,
+                [(*row, row[4]) for row in rows],
+            )
             return True
-    except Exception:
+    except Exception as e:
+        logger.error(f"Error recording {len(rows)} tickets in the history: {e}")
+        return False
+
+
+async def search_ticket_history(
+    server_name: Optional[str] = None,
+    text: Optional[str] = None,
+    author: Optional[str] = None,
+    unanswered_before: Optional[datetime] = None,
+    limit: int = 10,
+    offset: int = 0,
+) -> list:
+    """
+    Search the ticket history, newest first.
+
+    Args:
+        server_name: Only tickets from this server, every server if None.
+        text: Words that must appear in the ticket or its answer, in order.
+        author: Exact (case-insensitive) name of the player who sent the ticket.
+        unanswered_before: Only tickets first seen before this UTC time that
+            still have no answer.
+        limit: Page size.
+        offset: Number of results to skip.
+
+    Returns:
+        list: (server_name, ticket_id, author, message, answered_by, answer,
+        first_seen, answered_at) rows.
+    """
+    conditions = []
+    params: list = []
+
+    if text:
+        source = "ticket_history_fts f JOIN ticket_history h ON h.id = f.rowid"
+        conditions.append("ticket_history_fts MATCH ?")
+        params.append(f"{{message answer}} : {_fts_phrase(text)}")
+    else:
+        source = "ticket_history h"
+
+    if server_name:
+        conditions.append("h.server_name = ?")
+        params.append(server_name)
+    if author:
+        conditions.append("h.author = ? COLLATE NOCASE")
+        params.append(author)
+    if unanswered_before:
+        conditions.append("h.answered_by IS NULL AND h.first_seen < ?")
+        params.append(unanswered_before.strftime("%Y-%m-%d %H:%M:%S"))
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    query = f"""
+        SELECT h.server_name, h.ticket_id, h.author, h.message, h.answered_by,
+            h.answer, h.first_seen, h.answered_at
+        FROM {source}
+        {where}
+        ORDER BY h.first_seen DESC, h.id DESC
+        LIMIT ? OFFSET ?
+    """
+    params.extend([limit, offset])
+
+    async with _db.read() as db:
+        async with db.execute(query, params) as cursor:
+            return list(await cursor.fetchall())
+
+
+async def get_playerlist_messages() -> dict[str, tuple[int, int]]:
+    """Reposted playerlist messages as server_name: (channel_id, message_id)."""
+    try:
+        async with _db.read() as db:
+            async with db.execute(
+                "SELECT server_name, channel_id, message_id FROM playerlist_messages"
+            ) as cursor:
+                return {
+                    server_name: (channel_id, message_id)
+                    async for server_name, channel_id, message_id in cursor
+                }
+    except Exception as e:
+        logger.error(f"Error loading playerlist messages: {e}")
+        return {}
+
+
+async def set_playerlist_message(
+    server_name: str, channel_id: int, message_id: int
+) -> bool:
+    """Remember the message a server's playerlist now lives in."""
+    try:
+        async with _db.write() as db:
+            await db.execute(
+                """
+                INSERT INTO playerlist_messages (server_name, channel_id, message_id)
+                VALUES (?, ?, ?)
+                ON CONFLICT(server_name) DO UPDATE SET
+                    channel_id = excluded.channel_id,
+                    message_id = excluded.message_id,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                (server_name, channel_id, message_id),
+            )
+            return True
+    except Exception as e:
+        logger.error(f"Error saving {server_name} playerlist message: {e}")
         return False
@@ -0,0 +1,247 @@
+import asyncio
+import itertools
+import logging
+import re
+from enum import IntEnum
+from typing import Any, Awaitable, Callable
+
+import aiohttp
+import discord
+
+from src.utils.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# Discord's documented limits, used until a response says otherwise
+GLOBAL_REQUESTS_PER_SECOND = 50
+ROUTE_REQUESTS = 5
+ROUTE_WINDOW_SECONDS = 5
+
+# Message create and edit, the bucket is per channel and method
+_MESSAGE_ROUTE = re.compile(r"/channels/(\d+)/messages(?:/\d+)?$")
+
+
+class Priority(IntEnum):
+    """Lower goes first when several requests are waiting."""
+
+    ALERT = 0
+    NORMAL = 1
+    BULK = 2
+
+
+class _Job:
+    def __init__(
+        self,
+        priority: Priority,
+        seq: int,
+        route: tuple,
+        call: Callable[..., Awaitable],
+        kwargs: dict,
+        key: int | None = None,
+    ):
+        self.priority = priority
+        self.seq = seq
+        self.route = route
+        self.call = call
+        self.kwargs = kwargs
+        # Message ID for edits, so a newer edit can replace a queued one
+        self.key = key
+        self.futures: list[asyncio.Future] = []
+
+    def resolve(self, result: Any = None, error: BaseException | None = None):
+        for future in self.futures:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+
+class DiscordOutbox:
+    """
+    Every message the bot sends or edits outside of interactions goes here.
+
+    Requests wait in one queue and go out highest priority first, each
+    taking a token from a bucket for its route (channel and method) and from
+    a global bucket. The route buckets start at Discord's documented limits
+    and are then kept in line with the X-RateLimit headers of every message
+    response, which arrive through an aiohttp trace on the bot's own HTTP
+    session. A route has one request in flight at a time, so messages to a
+    channel still arrive in the order they were queued.
+
+    An edit to a message that already has an edit waiting replaces it, and
+    everyone waiting on either gets the result of the one request.
+    """
+
+    def __init__(self):
+        self._jobs: list[_Job] = []
+        self._edits: dict[int, _Job] = {}
+        self._buckets: dict[tuple, TokenBucket] = {}
+        self._global = TokenBucket(GLOBAL_REQUESTS_PER_SECOND, GLOBAL_REQUESTS_PER_SECOND)
+        self._busy_routes: set[tuple] = set()
+        self._in_flight: set[asyncio.Task] = set()
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def pending(self) -> int:
+        return len(self._jobs)
+
+    def _bucket(self, route: tuple) -> TokenBucket:
+        bucket = self._buckets.get(route)
+        if bucket is None:
+            bucket = TokenBucket(ROUTE_REQUESTS / ROUTE_WINDOW_SECONDS, ROUTE_REQUESTS)
+            self._buckets[route] = bucket
+        return bucket
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Hook for the bot's HTTP session so buckets follow Discord's headers."""
+        trace = aiohttp.TraceConfig()
+        trace.on_request_end.append(self._on_request_end)
+        return trace
+
+    async def _on_request_end(self, session, context, params) -> None:
+        match = _MESSAGE_ROUTE.search(params.url.path)
+        if not match:
+            return
+
+        headers = params.response.headers
+        try:
+            limit = int(headers["X-RateLimit-Limit"])
+            remaining = int(headers["X-RateLimit-Remaining"])
+            reset_after = float(headers["X-RateLimit-Reset-After"])
+        except (KeyError, ValueError):
+            return
+
+        route = (params.method.upper(), int(match[1]))
+        self._bucket(route).update(limit, remaining, reset_after)
+        if params.response.status == 429:
+            logger.warning(f"Rate limited on {route}, next request in {reset_after}s")
+
+    def _queue(self, job: _Job) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        job.futures.append(future)
+        self._jobs.append(job)
+        self._wakeup.set()
+        return future
+
+    async def send(
+        self,
+        channel: discord.abc.Messageable,
+        *,
+        priority: Priority = Priority.NORMAL,
+        **kwargs,
+    ) -> discord.Message:
+        """Queue channel.send(**kwargs) and return the sent message."""
+        if not self.is_running:
+            return await channel.send(**kwargs)
+
+        job = _Job(
+            priority,
+            next(self._seq),
+            ("POST", channel.id),
+            channel.send,
+            kwargs,
+        )
+        return await self._queue(job)
+
+    async def edit(
+        self,
+        message: discord.Message | discord.PartialMessage,
+        *,
+        priority: Priority = Priority.BULK,
+        **kwargs,
+    ) -> discord.Message:
+        """Queue message.edit(**kwargs), merged into any edit already waiting."""
+        if not self.is_running:
+            return await message.edit(**kwargs)
+
+        queued = self._edits.get(message.id)
+        if queued is not None:
+            # Superseded, only the latest content needs to reach Discord
+            queued.kwargs.update(kwargs)
+            queued.priority = min(queued.priority, priority)
+            future = asyncio.get_running_loop().create_future()
+            queued.futures.append(future)
+            return await future
+
+        job = _Job(
+            priority,
+            next(self._seq),
+            ("PATCH", message.channel.id),
+            message.edit,
+            kwargs,
+            key=message.id,
+        )
+        self._edits[message.id] = job
+        return await self._queue(job)
+
+    def _next_job(self) -> tuple[_Job | None, float | None]:
+        """The job to run now, or how long until one could run."""
+        ready = None
+        wait = None
+        for job in self._jobs:
+            if job.route in self._busy_routes:
+                continue
+            delay = self._bucket(job.route).delay()
+            if delay > 0:
+                wait = delay if wait is None else min(wait, delay)
+            elif ready is None or (job.priority, job.seq) < (ready.priority, ready.seq):
+                ready = job
+        return ready, wait
+
+    async def _execute(self, job: _Job) -> None:
+        try:
+            result = await job.call(**job.kwargs)
+        except Exception as e:
+            job.resolve(error=e)
+        else:
+            job.resolve(result)
+        finally:
+            self._busy_routes.discard(job.route)
+            self._wakeup.set()
+
+    async def _run(self):
+        while True:
+            job, wait = self._next_job()
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            self._jobs.remove(job)
+            if job.key is not None:
+                self._edits.pop(job.key, None)
+
+            await self._bucket(job.route).acquire()
+            await self._global.acquire()
+            self._busy_routes.add(job.route)
+            task = asyncio.create_task(self._execute(job))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    def start(self) -> None:
+        if not self.is_running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        for job in self._jobs:
+            for future in job.futures:
+                future.cancel()
+        self._jobs.clear()
+        self._edits.clear()
+
+
+discord_outbox = DiscordOutbox()
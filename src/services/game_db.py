@@ -1,14 +1,117 @@
+import asyncio
+import bisect
 import logging
 import os
-from typing import Optional
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
 
 import aiosqlite
 
+from src.services.game_db_changes import (
+    WhitelistChanged,
+    game_db_changes,
+    whitelist_fingerprint,
+)
+from src.services.game_db_snapshot import file_signature, game_db_path, live_db_path
 from src.services.server import get_game_version
 
 logger = logging.getLogger(__name__)
+
+# Connections kept open per server, and how long a query waits on the game's writes
+POOL_SIZE = 2
+BUSY_TIMEOUT_SECONDS = 5
+
+
+class _GameDbPool:
+    """
+    Read-only connections to one server's pzserver.db, or its snapshot.
+
+    The game server owns that file, so the bot only ever opens it with
+    mode=ro and a busy timeout, and keeps the connections around instead of
+    opening one per query. A world reset or a new snapshot replaces the
+    file, which is caught by its inode changing, and every connection to the
+    old file is closed.
+    """
+
+    def __init__(self, server: str):
+        self.server = server
+        self.path = game_db_path(server)
+        self._idle: list[aiosqlite.Connection] = []
+        self._slots = asyncio.Semaphore(POOL_SIZE)
+        self._file_id: tuple[str, int, int] | None = None
+        self._generation = 0
+
+    async def _recycle(self, file_id: tuple[str, int, int] | None):
+        if self._file_id is not None:
+            logger.info(f"{self.path} was replaced, reopening connections")
+        self._file_id = file_id
+        self._generation += 1
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            await conn.close()
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        self.path = game_db_path(self.server)
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            await self._recycle(None)
+            raise aiosqlite.OperationalError(f"unable to open database file {self.path}")
+
+        file_id = (self.path, stat.st_dev, stat.st_ino)
+        if file_id != self._file_id:
+            await self._recycle(file_id)
+
+        async with self._slots:
+            if self._idle:
+                conn = self._idle.pop()
+            else:
+                conn = await aiosqlite.connect(
+                    f"file:{self.path}?mode=ro", uri=True, timeout=BUSY_TIMEOUT_SECONDS
+                )
+            generation = self._generation
+
+            reusable = False
+            try:
+                yield conn
+                reusable = generation == self._generation
+            finally:
+                # Connections that hit an error, or belong to a replaced file, are dropped
+                if reusable:
+                    self._idle.append(conn)
+                else:
+                    await conn.close()
+
+    async def close(self):
+        await self._recycle(None)
+
+
+_pools: dict[str, _GameDbPool] = {}
+
+
+def game_db_connection(server: str):
+    """
+    Borrow a pooled read-only connection to a server's game database.
+
+    Usage:
+        async with game_db_connection(server) as db:
+            ...
+    """
+    if server not in _pools:
+        _pools[server] = _GameDbPool(server)
+    return _pools[server].connection()
+
+
+async def close_game_db_connections():
+    """Close every pooled game database connection."""
+    for pool in _pools.values():
+        await pool.close()
+
+
 def check_db_file(server: str) -> tuple[bool, str]:
-    path = f"/home/{server}/Zomboid/db/pzserver.db"
+    path = game_db_path(server)
     if not os.path.exists(path):
         error_message = f"File does not exist:\n{path}"
         logger.error(error_message)
@@ -16,39 +119,247 @@ def check_db_file(server: str) -> tuple[bool, str]:
     return True, path
 
 
-async def get_player(server: str, username: str) -> Optional[aiosqlite.Row] | str:
-    """Return the db row for a player."""
+@dataclass(frozen=True, slots=True)
+class PlayerRecord:
+    """A whitelist entry, with the same field names on every game version."""
+
+    username: str
+    steamid: str
+    # accesslevel on B41, the role ID on B42
+    access_level: str
+
+
+class _PlayerIndex:
+    """
+    One server's whitelist, indexed by username and SteamID.
+
+    Built from a single scan of the table. After the game writes to its
+    database only the rows added since the last scan are read, unless a
+    fingerprint of the rows already indexed shows one was changed or
+    deleted, which is rare enough to rescan the table for. Most lookups are
+    just dictionary hits. Columns are found by name, which keeps the records
+    the same across game versions whose whitelist layouts differ.
+    """
+
+    def __init__(self, server: str):
+        self.server = server
+        self.by_username: dict[str, PlayerRecord] = {}
+        self.by_steamid: dict[str, PlayerRecord] = {}
+        # Casefolded names in sorted order, with the real names alongside
+        self._sorted_keys: list[str] = []
+        self._sorted_names: list[str] = []
+        self._signature: tuple | None = None
+        # Highest rowid read so far, and the fingerprint of the rows up to it
+        self._scanned_rowid: int | None = None
+        self._fingerprint: tuple | None = None
+        self._live_inode: int | None = None
+        self._lock = asyncio.Lock()
+
+    async def refresh(self) -> None:
+        signature = file_signature(game_db_path(self.server))
+        if signature == self._signature:
+            return
+
+        async with self._lock:
+            if signature == self._signature:
+                return
+
+            # Snapshots are new files with the live database's rows, so only a
+            # replaced live database (a world reset) has to start over
+            live_file = file_signature(live_db_path(self.server))[0]
+            live_inode = live_file[0] if live_file else None
+            same_file = live_inode is not None and live_inode == self._live_inode
+            async with game_db_connection(self.server) as db:
+                # One read transaction, so the fingerprint matches the rows read
+                await db.execute("BEGIN")
+                try:
+                    incremental = (
+                        same_file
+                        and self._scanned_rowid is not None
+                        and await whitelist_fingerprint(db, self._scanned_rowid)
+                        == self._fingerprint
+                    )
+                    query = "SELECT rowid AS _rowid, * FROM whitelist"
+                    params = ()
+                    if incremental:
+                        query += " WHERE rowid > ?"
+                        params = (self._scanned_rowid,)
+                    async with db.execute(f"{query} ORDER BY rowid", params) as cursor:
+                        columns = {
+                            column[0].lower(): index
+                            for index, column in enumerate(cursor.description)
+                        }
+                        rows = await cursor.fetchall()
+
+                    if rows:
+                        scanned_rowid = rows[-1][0]
+                    else:
+                        scanned_rowid = self._scanned_rowid if incremental else 0
+                    fingerprint = await whitelist_fingerprint(db, scanned_rowid)
+                finally:
+                    await db.rollback()
+
+            def value(row, *names: str) -> str:
+                for name in names:
+                    if name in columns and row[columns[name]] is not None:
+                        return str(row[columns[name]])
+                return ""
+
+            records = [
+                PlayerRecord(
+                    username=value(row, "username"),
+                    steamid=value(row, "steamid"),
+                    access_level=value(row, "accesslevel", "role"),
+                )
+                for row in rows
+            ]
+            if incremental:
+                self._add(records)
+            else:
+                self._rebuild(records)
+
+            self._scanned_rowid = scanned_rowid
+            self._fingerprint = fingerprint
+            self._live_inode = live_inode
+            self._signature = signature
+            logger.debug(
+                f"Indexed {len(records)} {'new ' if incremental else ''}players "
+                f"for {self.server}"
+            )
+
+    def _rebuild(self, records: list[PlayerRecord]) -> None:
+        by_username = {}
+        by_steamid = {}
+        for record in records:
+            by_username[record.username] = record
+            if record.steamid:
+                # Same as a SELECT ... WHERE steamid=? would return
+                by_steamid.setdefault(record.steamid, record)
+
+        by_key = sorted((name.casefold(), name) for name in by_username)
+        self.by_username = by_username
+        self.by_steamid = by_steamid
+        self._sorted_keys = [key for key, _ in by_key]
+        self._sorted_names = [name for _, name in by_key]
+
+    def _add(self, records: list[PlayerRecord]) -> None:
+        for record in records:
+            if record.username not in self.by_username:
+                key = record.username.casefold()
+                position = bisect.bisect_right(self._sorted_keys, key)
+                self._sorted_keys.insert(position, key)
+                self._sorted_names.insert(position, record.username)
+            self.by_username[record.username] = record
+            if record.steamid:
+                self.by_steamid.setdefault(record.steamid, record)
+
+    def invalidate(self) -> None:
+        self._signature = None
+
+    def names_starting_with(self, prefix: str, limit: int) -> list[str]:
+        """Up to limit usernames starting with prefix, ignoring case."""
+        key = prefix.casefold()
+        start = bisect.bisect_left(self._sorted_keys, key)
+        names = []
+        for i in range(start, min(start + limit, len(self._sorted_keys))):
+            if not self._sorted_keys[i].startswith(key):
+                break
+            names.append(self._sorted_names[i])
+        return names
+
+
+_player_indexes: dict[str, _PlayerIndex] = {}
+
+
+async def _on_whitelist_changed(event: WhitelistChanged):
+    # Refresh on the next lookup, even if the file stat looks the same
+    if event.server in _player_indexes:
+        _player_indexes[event.server].invalidate()
+
+
+game_db_changes.subscribe(WhitelistChanged, _on_whitelist_changed)
+
+
+async def _player_index(server: str) -> _PlayerIndex:
+    if server not in _player_indexes:
+        _player_indexes[server] = _PlayerIndex(server)
+    index = _player_indexes[server]
+    await index.refresh()
+    return index
+
+
+async def get_player(server: str, username: str) -> Optional[PlayerRecord] | str:
+    """Return the whitelist record for a player."""
     file_exists, result = check_db_file(server)
     if not file_exists:
         return result
 
     try:
-        async with aiosqlite.connect(f"/home/{server}/Zomboid/db/pzserver.db") as db:
-            async with db.execute(
-                "SELECT * FROM whitelist WHERE username=?", [username]
-            ) as cursor:
-                return await cursor.fetchone()
+        index = await _player_index(server)
+        return index.by_username.get(username)
     except aiosqlite.Error as e:
         logger.error(f"Database error occurred: {e}")
         return f"Error accessing database for {server} server"
 
 
-async def get_player_by_steamid(server: str, steamid: str):
-    """Return the db row for a player."""
+async def get_player_by_steamid(
+    server: str, steamid: str
+) -> Optional[PlayerRecord] | str:
+    """Return the whitelist record for a player."""
     file_exists, result = check_db_file(server)
     if not file_exists:
         return result
 
     try:
-        async with aiosqlite.connect(f"/home/{server}/Zomboid/db/pzserver.db") as db:
-            async with db.execute(
-                "SELECT * FROM whitelist WHERE steamid=?", [steamid]
-            ) as cursor:
-                return await cursor.fetchone()
+        index = await _player_index(server)
+        return index.by_steamid.get(steamid)
+    except aiosqlite.Error as e:
+        logger.error(f"Database error occurred: {e}")
+        return f"Error accessing database for {server} server"
+
+
+async def suggest_player_names(server: str, prefix: str, limit: int = 25) -> list[str]:
+    """Return usernames starting with prefix, for autocomplete. Empty on errors."""
+    if not os.path.exists(game_db_path(server)):
+        return []
+
+    try:
+        index = await _player_index(server)
+    except aiosqlite.Error as e:
+        logger.error(f"Database error occurred: {e}")
+        return []
+    return index.names_starting_with(prefix, limit)
+
+
+async def find_players(server: str, player: str) -> list[PlayerRecord] | str:
+    """
+    Return every whitelist record matching a SteamID or a username.
+
+    Usernames are matched case-insensitively, since whoever reported the
+    player rarely knows the exact spelling.
+    """
+    file_exists, result = check_db_file(server)
+    if not file_exists:
+        return result
+
+    try:
+        index = await _player_index(server)
     except aiosqlite.Error as e:
         logger.error(f"Database error occurred: {e}")
         return f"Error accessing database for {server} server"
 
+    if player.isdigit():
+        return [
+            record for record in index.by_username.values() if record.steamid == player
+        ]
+
+    name = player.casefold()
+    return [
+        record
+        for record in index.by_username.values()
+        if record.username.casefold() == name
+    ]
+
 
 async def get_banned_player(server: str, steamid: str):
     """Return the db row for a banned player."""
@@ -57,7 +368,7 @@ async def get_banned_player(server: str, steamid: str):
         return result
 
     try:
-        async with aiosqlite.connect(f"/home/{server}/Zomboid/db/pzserver.db") as db:
+        async with game_db_connection(server) as db:
             async with db.execute(
                 "SELECT * FROM bannedid WHERE steamid=?", [steamid]
             ) as cursor:
@@ -67,16 +378,30 @@ async def get_banned_player(server: str, steamid: str):
         return f"Error accessing database for {server} server"
 
 
-async def get_all_banned_players(server: str):
-    """Return all banned users on a server."""
+async def get_all_banned_players(server: str) -> list[tuple[str | None, str]] | str:
+    """
+    Return every banned SteamID on a server with its username, in ban order.
+
+    The username is None for players who were banned before ever joining.
+    """
     file_exists, result = check_db_file(server)
     if not file_exists:
         return result
 
+    # One row per SteamID even if it was banned more than once or has
+    # several whitelist entries
+    query = """
+        SELECT MIN(w.username), b.steamid
+        FROM bannedid b
+        LEFT JOIN whitelist w ON w.steamid = b.steamid
+        GROUP BY b.steamid
+        ORDER BY MIN(b.rowid)
+    """
+
     try:
-        async with aiosqlite.connect(f"/home/{server}/Zomboid/db/pzserver.db") as db:
-            async with db.execute("SELECT * FROM bannedid") as cursor:
-                return await cursor.fetchall()
+        async with game_db_connection(server) as db:
+            async with db.execute(query) as cursor:
+                return list(await cursor.fetchall())
     except aiosqlite.Error as e:
         logger.error(f"Database error occurred: {e}")
         return f"Error accessing database for {server} server"
@@ -89,19 +414,38 @@ async def get_admins(server: str) -> str:
 
     game_version = get_game_version(server)
 
-    where_clause = "role='7'"
+    admin_level = "7"
 
     if game_version == "B41":
-        where_clause = "accesslevel='admin'"
+        admin_level = "admin"
 
     try:
-        async with aiosqlite.connect(f"/home/{server}/Zomboid/db/pzserver.db") as db:
-            query = f"SELECT username FROM whitelist WHERE {where_clause}"
+        index = await _player_index(server)
+        the_boys = [
+            player.username
+            for player in index.by_username.values()
+            if player.access_level == admin_level
+        ]
+        return ", ".join(sorted(the_boys, key=str.casefold))
+
+    except aiosqlite.Error as e:
+        logger.error(f"Database error occurred: {e}")
+        return f"Error accessing database for {server} server"
 
-            async with db.execute(query) as cursor:
-                the_boys = [row[0] async for row in cursor]
-                return ", ".join(sorted(the_boys, key=str.casefold))
 
+async def get_ticket_id_range(server: str) -> tuple[int, int] | str:
+    """Return the lowest and highest ticket IDs on a server, (0, 0) if it has none."""
+    file_exists, result = check_db_file(server)
+    if not file_exists:
+        return result
+
+    try:
+        async with game_db_connection(server) as db:
+            async with db.execute("SELECT MIN(id), MAX(id) FROM tickets") as cursor:
+                row = await cursor.fetchone()
+                if not row or row[0] is None:
+                    return 0, 0
+                return row[0], row[1]
     except aiosqlite.Error as e:
         logger.error(f"Database error occurred: {e}")
         return f"Error accessing database for {server} server"
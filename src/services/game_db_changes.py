@@ -0,0 +1,237 @@
+import asyncio
+import logging
+import os
+import zlib
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+import aiosqlite
+
+from src.config import Config
+from src.services.game_db_snapshot import game_db_path
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class GameDbEvent:
+    """Something changed in a server's game database."""
+
+    # The server's system user
+    server: str
+
+
+@dataclass(frozen=True)
+class TicketsChanged(GameDbEvent):
+    count: int
+    max_id: int
+    answers: int
+
+
+@dataclass(frozen=True)
+class WhitelistChanged(GameDbEvent):
+    count: int
+
+
+@dataclass(frozen=True)
+class BansChanged(GameDbEvent):
+    count: int
+
+
+class _ServerWatch:
+    """What the feed last saw of one server's database."""
+
+    def __init__(self):
+        self.conn: aiosqlite.Connection | None = None
+        self.file_id: tuple | None = None
+        self.data_version: int | None = None
+        self.signatures: dict[type, tuple] = {}
+
+    async def close(self):
+        if self.conn:
+            await self.conn.close()
+        self.conn = None
+        self.file_id = None
+        self.data_version = None
+
+
+async def _fetchone(
+    conn: aiosqlite.Connection, query: str, params: tuple = ()
+) -> tuple:
+    async with conn.execute(query, params) as cursor:
+        return tuple(await cursor.fetchone())
+
+
+async def _tickets_signature(conn: aiosqlite.Connection) -> tuple:
+    return await _fetchone(
+        conn, "SELECT COUNT(*), COALESCE(MAX(id), 0), COUNT(answeredID) FROM tickets"
+    )
+
+
+def _row_checksum(*values) -> int:
+    """CRC32 of a row's values, summed in SQL to fingerprint a table's contents."""
+    return zlib.crc32("\x1f".join(map(str, values)).encode())
+
+
+async def whitelist_fingerprint(
+    conn: aiosqlite.Connection, max_rowid: int | None = None
+) -> tuple:
+    """
+    Count, max rowid and a checksum of the whitelist's rows.
+
+    Computed in SQLite so no rows are fetched. With max_rowid, only the
+    rows up to it are covered, which tells whether they changed since they
+    were last read.
+    """
+    async with conn.execute("PRAGMA table_info(whitelist)") as cursor:
+        columns = {row[1] for row in await cursor.fetchall()}
+    # accesslevel on B41, the role ID on B42. Names, SteamIDs and levels
+    # change in place, so count and max rowid alone aren't enough.
+    checked = [
+        column
+        for column in ("username", "steamid", "accesslevel", "role")
+        if column in columns
+    ]
+
+    await conn.create_function("row_checksum", -1, _row_checksum, deterministic=True)
+    query = f"""
+        SELECT COUNT(*), COALESCE(MAX(rowid), 0),
+            total(row_checksum({", ".join(["rowid", *checked])}))
+        FROM whitelist
+    """
+    if max_rowid is None:
+        return await _fetchone(conn, query)
+    return await _fetchone(conn, f"{query} WHERE rowid <= ?", (max_rowid,))
+
+
+async def _bans_signature(conn: aiosqlite.Connection) -> tuple:
+    return await _fetchone(conn, "SELECT COUNT(*), COALESCE(MAX(rowid), 0) FROM bannedid")
+
+
+def _tickets_event(server: str, signature: tuple) -> GameDbEvent:
+    return TicketsChanged(server, *signature)
+
+
+def _whitelist_event(server: str, signature: tuple) -> GameDbEvent:
+    return WhitelistChanged(server, signature[0])
+
+
+def _bans_event(server: str, signature: tuple) -> GameDbEvent:
+    return BansChanged(server, signature[0])
+
+
+# Event type, how to fingerprint its table and how to build the event
+TABLE_DIFFS = [
+    (TicketsChanged, _tickets_signature, _tickets_event),
+    (WhitelistChanged, whitelist_fingerprint, _whitelist_event),
+    (BansChanged, _bans_signature, _bans_event),
+]
+
+
+class GameDbChangeFeed:
+    """
+    Watches each server's game database and publishes what changed.
+
+    Each check is a stat of the file plus PRAGMA data_version on a connection
+    kept open for the purpose, which only changes when another connection
+    commits. Only then are the tickets, whitelist and bannedid tables
+    fingerprinted, and subscribers get an event for each one that differs,
+    so a server nobody is playing on costs next to nothing to watch.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._watches: dict[str, _ServerWatch] = {}
+        self._subscribers: dict[type, list[Callable[..., Awaitable]]] = {}
+        self._task: asyncio.Task | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def subscribe(self, event_type: type, callback: Callable[..., Awaitable]) -> None:
+        self._subscribers.setdefault(event_type, []).append(callback)
+
+    def unsubscribe(self, event_type: type, callback: Callable[..., Awaitable]) -> None:
+        callbacks = self._subscribers.get(event_type, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    async def _publish(self, event: GameDbEvent) -> None:
+        for callback in list(self._subscribers.get(type(event), [])):
+            try:
+                await callback(event)
+            except Exception as e:
+                logger.error(f"Error in {type(event).__name__} subscriber: {e}")
+
+    async def check(self, server: str) -> list[GameDbEvent]:
+        """Look for changes on one server and publish them."""
+        watch = self._watches.setdefault(server, _ServerWatch())
+        path = game_db_path(server)
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            await watch.close()
+            return []
+
+        try:
+            # A new file (world reset, new snapshot) needs a new connection
+            file_id = (path, stat.st_dev, stat.st_ino)
+            if file_id != watch.file_id:
+                await watch.close()
+                watch.conn = await aiosqlite.connect(f"file:{path}?mode=ro", uri=True)
+                watch.file_id = file_id
+
+            (data_version,) = await _fetchone(watch.conn, "PRAGMA data_version")
+            if data_version == watch.data_version:
+                return []
+
+            events = []
+            for event_type, signature_of, make_event in TABLE_DIFFS:
+                signature = await signature_of(watch.conn)
+                if signature != watch.signatures.get(event_type):
+                    watch.signatures[event_type] = signature
+                    events.append(make_event(server, signature))
+            watch.data_version = data_version
+        except (aiosqlite.Error, OSError) as e:
+            logger.warning(f"Could not check {path} for changes: {e}")
+            await watch.close()
+            return []
+
+        for event in events:
+            await self._publish(event)
+        return events
+
+    async def _run(self):
+        while True:
+            servers = [srv["system_user"] for srv in Config.SERVER_DATA]
+            try:
+                results = await asyncio.gather(
+                    *[self.check(server) for server in servers], return_exceptions=True
+                )
+                for server, result in zip(servers, results):
+                    if isinstance(result, Exception):
+                        logger.error(
+                            f"Error checking {server} for game database changes: {result}"
+                        )
+                        # Start from a fresh connection next time
+                        if server in self._watches:
+                            await self._watches[server].close()
+            except Exception as e:
+                logger.error(f"Error checking game databases for changes: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if not self.is_running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        for watch in self._watches.values():
+            await watch.close()
+
+
+game_db_changes = GameDbChangeFeed(Config.GAME_DB_CHANGE_POLL_SECONDS)
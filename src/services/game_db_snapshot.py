@@ -0,0 +1,139 @@
+import asyncio
+import logging
+import os
+import sqlite3
+from pathlib import Path
+
+from src.config import DATA_DIR, Config
+
+logger = logging.getLogger(__name__)
+
+snapshot_dir = DATA_DIR / "snapshots"
+
+# Pages copied per backup step, the game can write between steps
+BACKUP_PAGES_PER_STEP = 1024
+
+
+def live_db_path(server: str) -> str:
+    """The game server's own database file."""
+    return f"/home/{server}/Zomboid/db/pzserver.db"
+
+
+def snapshot_path(server: str) -> Path:
+    return snapshot_dir / f"{server}.db"
+
+
+def file_signature(path: str) -> tuple:
+    """Changes whenever SQLite commits a write to the database at path."""
+    signature = []
+    for file in (path, f"{path}-wal", f"{path}-journal"):
+        try:
+            stat = os.stat(file)
+            signature.append((stat.st_ino, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def _backup(source: str, destination: Path) -> None:
+    """Copy source into a new file and swap it in place of destination."""
+    temp_path = destination.with_suffix(".tmp")
+    temp_path.unlink(missing_ok=True)
+
+    src = sqlite3.connect(f"file:{source}?mode=ro", uri=True, timeout=5)
+    try:
+        dst = sqlite3.connect(temp_path)
+        try:
+            src.backup(dst, pages=BACKUP_PAGES_PER_STEP)
+        finally:
+            dst.close()
+    finally:
+        src.close()
+
+    # A new inode, so pooled readers of the old snapshot know to reopen
+    os.replace(temp_path, destination)
+
+
+class GameDbSnapshots:
+    """
+    Bot-owned copies of each server's pzserver.db.
+
+    The live database is copied with SQLite's online backup API whenever its
+    files change, checked every `interval` seconds. Bot reads then go against
+    the copy, so the game server only ever shares its database with the bot
+    for the length of a backup, never for a Discord command or a ticket scan.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._signatures: dict[str, tuple] = {}
+        self._task: asyncio.Task | None = None
+
+    def has_snapshot(self, server: str) -> bool:
+        return server in self._signatures and snapshot_path(server).exists()
+
+    async def refresh(self, server: str) -> bool:
+        """Take a new snapshot if the live database changed. Returns True if it did."""
+        source = live_db_path(server)
+        destination = snapshot_path(server)
+
+        if not os.path.exists(source):
+            # Don't keep serving a world that no longer exists
+            if self._signatures.pop(server, None) is not None:
+                destination.unlink(missing_ok=True)
+                logger.warning(f"{source} is gone, dropped its snapshot")
+            return False
+
+        signature = file_signature(source)
+        if signature == self._signatures.get(server):
+            return False
+
+        try:
+            await asyncio.to_thread(_backup, source, destination)
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"Error snapshotting {source}: {e}")
+            return False
+
+        self._signatures[server] = signature
+        logger.debug(f"Snapshotted {source} to {destination}")
+        return True
+
+    async def refresh_all(self) -> None:
+        await asyncio.gather(
+            *[self.refresh(srv["system_user"]) for srv in Config.SERVER_DATA]
+        )
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.refresh_all()
+            except Exception as e:
+                logger.error(f"Error refreshing game database snapshots: {e}")
+
+    async def start(self) -> None:
+        """Take the first snapshots, then keep them fresh in the background."""
+        if self._task is not None:
+            return
+
+        snapshot_dir.mkdir(parents=True, exist_ok=True)
+        await self.refresh_all()
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"Game database snapshots ready for {len(self._signatures)} servers"
+        )
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+
+game_db_snapshots = GameDbSnapshots(Config.GAME_DB_SNAPSHOT_SECONDS)
+
+
+def game_db_path(server: str) -> str:
+    """The database the bot reads, its snapshot when there is one."""
+    if game_db_snapshots.has_snapshot(server):
+        return str(snapshot_path(server))
+    return live_db_path(server)
@@ -53,9 +53,14 @@ async def pz_send_command(system_user: str, server_command: str) -> str | None:
         return None
 
 
+def clean_server_message(message: str) -> str:
+    """Strips characters that would break the quoted servermsg argument."""
+    return re.sub(r"[\"']", "", message)
+
+
 async def pz_send_message(server: str, message: str) -> bool:
     """Sends a correctly formatted message to the game-server."""
-    valid_msg = re.sub(r"[\"']", "", message)
+    valid_msg = clean_server_message(message)
     server_msg = f'servermsg "{valid_msg}"'
     return await pz_send_command(server, server_msg) is not None
 
@@ -58,24 +58,34 @@ def format_time(seconds: float) -> str:
     return time.strftime("%Hhr %Mmin", time.gmtime(seconds))
 
 
+async def get_online_players(server_ip: str, port: int) -> list:
+    """Queries a steam server and returns its named players, longest session first."""
+    players = await a2s.aplayers((server_ip, port))
+
+    valid_players = [p for p in players if p.name]
+    valid_players.sort(key=lambda x: x.duration, reverse=True)
+    return valid_players
+
+
+def format_player_list(players: list, server_name: str) -> str:
+    """Formats a list of a2s players as a string table."""
+    if not players:
+        return f"I can see **0** players on the **{server_name}** server."
+
+    player_table = [[p.name, format_time(p.duration)] for p in players]
+
+    msg = f"I can see **{len(player_table)}** players on the **{server_name}** server.\n"
+    msg += f"```\n{tabulate(player_table, headers=['Name', 'Duration'])}\n```"
+    return msg
+
+
 async def get_player_list_string(server_ip: str, port: int, server_name: str) -> str:
     """
     Queries a steam server and returns a formatted string table of players.
     """
     try:
-        players = await a2s.aplayers((server_ip, port))
-
-        valid_players = [p for p in players if p.name]
-        valid_players.sort(key=lambda x: x.duration, reverse=True)
-
-        if not valid_players:
-            return f"I can see **0** players on the **{server_name}** server."
-
-        player_table = [[p.name, format_time(p.duration)] for p in valid_players]
-
-        msg = f"I can see **{len(player_table)}** players on the **{server_name}** server.\n"
-        msg += f"```\n{tabulate(player_table, headers=['Name', 'Duration'])}\n```"
-        return msg
+        players = await get_online_players(server_ip, port)
+        return format_player_list(players, server_name)
 
     except asyncio.TimeoutError:
         return f"**{server_name}**: Connection timed out (Steam Network)."
@@ -0,0 +1,81 @@
+from collections import deque
+
+
+def fold_case(text: str) -> str:
+    """Lowercase text without changing its length, so match offsets stay valid."""
+    return "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+
+class AhoCorasick:
+    """
+    Multi-pattern string matcher.
+
+    All patterns are compiled into one automaton up front, after which a scan
+    is a single pass over the text: the cost depends on the text length (and
+    the number of matches), not on how many patterns there are.
+
+    Args:
+        patterns: Strings to search for. Matching is case-insensitive.
+    """
+
+    def __init__(self, patterns: list[str]):
+        # Node 0 is the root. Each node has its transitions, a failure link and
+        # the lengths of the patterns that end there (including via failure links).
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[int]] = [[]]
+        self.pattern_count = 0
+
+        for pattern in patterns:
+            self._add(fold_case(pattern))
+        self._build_links()
+
+    def _add(self, pattern: str) -> None:
+        if not pattern:
+            return
+
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[node][char] = next_node
+            node = next_node
+
+        if len(pattern) not in self._output[node]:
+            self._output[node].append(len(pattern))
+            self.pattern_count += 1
+
+    def _build_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def find(self, text: str) -> list[tuple[int, int]]:
+        """
+        Find every pattern occurrence in text.
+
+        Returns:
+            list[tuple[int, int]]: (start, end) offsets of each match.
+        """
+        matches = []
+        node = 0
+        for index, char in enumerate(fold_case(text)):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for length in self._output[node]:
+                matches.append((index - length + 1, index + 1))
+        return matches
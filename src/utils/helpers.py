@@ -1,5 +1,6 @@
 import secrets
 import string
+from calendar import monthrange
 from datetime import datetime
 
 
@@ -16,6 +17,34 @@ def get_last_14th() -> datetime:
         return datetime(today.year, today.month, 14)
 
 
+def get_billing_period_start(when: datetime, bill_day: int) -> datetime:
+    """
+    Get the start of the billing period that a moment falls in.
+
+    Billing periods start on `bill_day` each month. Months that are too short
+    for that day start on their last day instead.
+
+    Args:
+        when: The moment to find the billing period for.
+        bill_day: The day of the month the bill hits.
+
+    Returns:
+        Midnight on the first day of the billing period.
+    """
+    if not 1 <= bill_day <= 31:
+        raise ValueError("bill_day must be between 1 and 31.")
+
+    def period_day(year: int, month: int) -> datetime:
+        return datetime(year, month, min(bill_day, monthrange(year, month)[1]))
+
+    start = period_day(when.year, when.month)
+    if when >= start:
+        return start
+    if when.month == 1:
+        return period_day(when.year - 1, 12)
+    return period_day(when.year, when.month - 1)
+
+
 def get_last_occurrence_of_day(day_number: int) -> datetime:
     """
     Get the date of the most recent occurrence of a specific day of the month.
@@ -29,15 +58,7 @@ def get_last_occurrence_of_day(day_number: int) -> datetime:
     if not 1 <= day_number <= 31:
         raise ValueError("day_number must be between 1 and 31.")
 
-    today = datetime.now()
-
-    if today.day < day_number:
-        if today.month == 1:
-            return datetime(today.year - 1, 12, day_number)
-        else:
-            return datetime(today.year, today.month - 1, day_number)
-    else:
-        return datetime(today.year, today.month, day_number)
+    return get_billing_period_start(datetime.now(), day_number)
 
 
 def show_donation_progress(current_amount, goal_amount):
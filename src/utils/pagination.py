@@ -0,0 +1,83 @@
+from typing import Any, Awaitable, Callable
+
+import discord
+
+# Leave room for the header and code block in Discord's 2000 char limit
+MAX_PAGE_CHARS = 1900
+
+
+def format_code_block_page(lines: list[str], header: str) -> str:
+    """Header followed by lines in a code block, cut to fit in one message."""
+    body = "\n".join(lines)
+    max_body = MAX_PAGE_CHARS - len(header)
+    if len(body) > max_body:
+        body = body[:max_body] + "…"
+    return f"{header}\n```\n{body}\n```"
+
+
+class CodeBlockPager(discord.ui.View):
+    """
+    Prev/next buttons that page through search results in a code block.
+
+    Args:
+        user_id: Only this user can use the buttons.
+        fetch_rows: Called with (limit, offset), returns the rows for a page.
+        format_row: Turns one row into its text in the code block.
+        title: Shown above each page, followed by the page number.
+        empty_message: Shown instead when the search found nothing.
+        page_size: Rows per page.
+    """
+
+    def __init__(
+        self,
+        user_id: int,
+        fetch_rows: Callable[[int, int], Awaitable[list]],
+        format_row: Callable[[Any], str],
+        title: str,
+        empty_message: str,
+        page_size: int,
+    ):
+        super().__init__(timeout=300)
+        self.user_id = user_id
+        self.fetch_rows = fetch_rows
+        self.format_row = format_row
+        self.title = title
+        self.empty_message = empty_message
+        self.page_size = page_size
+        self.page = 0
+
+    async def fetch_page(self) -> tuple[str, bool]:
+        """Returns the rendered page and whether there is a page after it."""
+        # One extra row tells whether there is a next page
+        rows = await self.fetch_rows(self.page_size + 1, self.page * self.page_size)
+        has_next = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+
+        if not rows:
+            return self.empty_message, False
+
+        header = f"{self.title}, page {self.page + 1}:"
+        lines = [self.format_row(row) for row in rows]
+        return format_code_block_page(lines, header), has_next
+
+    def update_buttons(self, has_next: bool) -> None:
+        self.previous.disabled = self.page == 0
+        self.next.disabled = not has_next
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return interaction.user.id == self.user_id
+
+    async def show_page(self, interaction: discord.Interaction) -> None:
+        content, has_next = await self.fetch_page()
+        self.update_buttons(has_next)
+        await interaction.response.edit_message(content=content, view=self)
+
+    @discord.ui.button(label="Previous", style=discord.ButtonStyle.grey)
+    async def previous(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = max(self.page - 1, 0)
+        await self.show_page(interaction)
+
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.grey)
+    async def next(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page += 1
+        await self.show_page(interaction)
@@ -0,0 +1,60 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Simple token bucket used to pace outbound traffic.
+
+    Args:
+        rate: Tokens added per second.
+        capacity: Maximum tokens the bucket can hold (the allowed burst).
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0.")
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+
+    def delay(self) -> float:
+        """Seconds until one token is available, without consuming it."""
+        self._refill()
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    async def acquire(self) -> None:
+        """Wait for and consume a single token."""
+        async with self._lock:
+            wait = self.delay()
+            while wait > 0:
+                await asyncio.sleep(wait)
+                wait = self.delay()
+            self._tokens -= 1
+
+    def update(self, limit: int, remaining: int, reset_after: float) -> None:
+        """
+        Match the bucket to rate limit headers from the server.
+
+        A response with only one request used tells us how long the window
+        is, so the refill rate follows it. The bucket never holds more
+        tokens than the server says are left, and when none are left the
+        next token comes no sooner than the reset.
+        """
+        self._refill()
+        self.capacity = max(float(limit), 1.0)
+        if remaining == limit - 1 and reset_after > 0:
+            self.rate = limit / reset_after
+        self._tokens = min(self._tokens, float(remaining))
+        if remaining <= 0:
+            self._tokens = min(self._tokens, 1 - self.rate * reset_after)
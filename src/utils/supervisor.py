@@ -0,0 +1,81 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+
+class ServerSupervisor:
+    """
+    Runs one unit of background work per server, all servers at once.
+
+    Each server's work is its own task with its own timeout, so a locked
+    database or a slow A2S query only holds up that server and a cycle takes
+    as long as the slowest server rather than the sum of them. A server
+    whose work fails or times out is retried with exponential backoff,
+    starting at `backoff` seconds and capped at `max_backoff`, while the
+    others carry on every cycle.
+
+    Args:
+        name: What the work is, for log messages.
+        timeout: Seconds one server's work may take before it is cancelled.
+        backoff: Seconds to wait before retrying a server after its first failure.
+        max_backoff: Longest wait between retries.
+    """
+
+    def __init__(
+        self, name: str, timeout: float, backoff: float = 30, max_backoff: float = 600
+    ):
+        self.name = name
+        self.timeout = timeout
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._failures: dict[str, int] = {}
+        self._retry_at: dict[str, float] = {}
+
+    def is_backing_off(self, server: str) -> bool:
+        return time.monotonic() < self._retry_at.get(server, 0)
+
+    def _failed(self, server: str, error: str) -> None:
+        failures = self._failures.get(server, 0) + 1
+        self._failures[server] = failures
+        delay = min(self.max_backoff, self.backoff * 2 ** (failures - 1))
+        self._retry_at[server] = time.monotonic() + delay
+        logger.error(
+            f"{self.name} failed for {server} ({error}), "
+            f"failure {failures}, retrying in {delay:.0f}s"
+        )
+
+    def _succeeded(self, server: str) -> None:
+        if self._failures.pop(server, None):
+            self._retry_at.pop(server, None)
+            logger.info(f"{self.name} recovered for {server}")
+
+    async def _run_one(self, server: str, work: Callable[[str], Awaitable]) -> bool:
+        try:
+            await asyncio.wait_for(work(server), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            self._failed(server, f"timed out after {self.timeout:.0f}s")
+            return False
+        except Exception as e:
+            self._failed(server, str(e) or type(e).__name__)
+            return False
+
+        self._succeeded(server)
+        return True
+
+    async def run(
+        self, work: Callable[[str], Awaitable], servers: Iterable[str]
+    ) -> dict[str, bool]:
+        """
+        Run work(server) for every server that isn't backing off.
+
+        Returns:
+            dict[str, bool]: Whether each server that ran succeeded.
+        """
+        servers = [server for server in servers if not self.is_backing_off(server)]
+        results = await asyncio.gather(
+            *[self._run_one(server, work) for server in servers]
+        )
+        return dict(zip(servers, results))